@@ -0,0 +1,37 @@
+"""Add composite index for latest preview version lookups
+
+Revision ID: 0011_add_preview_versions_latest_index
+Revises: 0a00af6fd715
+Create Date: 2025-09-24 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_add_preview_versions_latest_index"
+down_revision = "0a00af6fd715"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (session_id, phase, created_at DESC) index on preview_versions"""
+
+    connection = op.get_bind()
+
+    print("Creating ix_preview_versions_session_phase_created index...")
+    connection.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_preview_versions_session_phase_created
+        ON preview_versions (session_id, phase, created_at DESC)
+    """))
+    print("Successfully created ix_preview_versions_session_phase_created index")
+
+
+def downgrade() -> None:
+    """Drop the latest preview lookup index if it exists"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text("DROP INDEX IF EXISTS ix_preview_versions_session_phase_created"))
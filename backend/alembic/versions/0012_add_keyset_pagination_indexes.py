@@ -0,0 +1,45 @@
+"""Add composite indexes for keyset (cursor) pagination
+
+Revision ID: 0012_add_keyset_pagination_indexes
+Revises: 0011_add_preview_versions_latest_index
+Create Date: 2025-09-25 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_add_keyset_pagination_indexes"
+down_revision = "0011_add_preview_versions_latest_index"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_manga_projects_user_created", "manga_projects (user_id, created_at DESC, id DESC)"),
+    ("ix_manga_projects_user_updated", "manga_projects (user_id, updated_at DESC, id DESC)"),
+    ("ix_manga_projects_user_title", "manga_projects (user_id, title, id)"),
+    ("ix_session_messages_session_created", "session_messages (session_id, created_at DESC, id DESC)"),
+    ("ix_user_feedback_history_session_created", "user_feedback_history (session_id, created_at DESC, id DESC)"),
+)
+
+
+def upgrade() -> None:
+    """Create (owner, sort_key, id) indexes backing the keyset list queries"""
+
+    connection = op.get_bind()
+
+    for name, target in INDEXES:
+        print(f"Creating {name} index...")
+        connection.execute(sa.text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+    print("Successfully created keyset pagination indexes")
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes if they exist"""
+
+    connection = op.get_bind()
+    for name, _ in reversed(INDEXES):
+        connection.execute(sa.text(f"DROP INDEX IF EXISTS {name}"))
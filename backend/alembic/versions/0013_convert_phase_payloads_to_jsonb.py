@@ -0,0 +1,78 @@
+"""Convert phase payload columns to JSONB and add targeted indexes
+
+Revision ID: 0013_convert_phase_payloads_to_jsonb
+Revises: 0012_add_keyset_pagination_indexes
+Create Date: 2025-09-26 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_convert_phase_payloads_to_jsonb"
+down_revision = "0012_add_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+JSONB_COLUMNS = (
+    ("phase_results", "content"),
+    ("preview_versions", "version_data"),
+)
+
+
+def _column_type(connection, table: str, column: str) -> str | None:
+    return connection.execute(sa.text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = :table AND column_name = :column
+    """), {"table": table, "column": column}).scalar()
+
+
+def upgrade() -> None:
+    """Convert JSON -> JSONB (table rewrite) and create error / containment indexes"""
+
+    connection = op.get_bind()
+
+    for table, column in JSONB_COLUMNS:
+        data_type = _column_type(connection, table, column)
+        if data_type is None:
+            print(f"{table}.{column} does not exist, skipping")
+            continue
+        if data_type == "jsonb":
+            print(f"{table}.{column} is already jsonb")
+            continue
+        print(f"Converting {table}.{column} to jsonb...")
+        connection.execute(sa.text(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+        ))
+        print(f"Successfully converted {table}.{column}")
+
+    print("Creating ix_phase_results_errors index...")
+    connection.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_phase_results_errors
+        ON phase_results (session_id, phase)
+        WHERE status = 'failed' OR content ? 'error'
+    """))
+
+    print("Creating ix_preview_versions_version_data_gin index...")
+    connection.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_preview_versions_version_data_gin
+        ON preview_versions USING gin (version_data jsonb_path_ops)
+    """))
+    print("Successfully created JSONB indexes")
+
+
+def downgrade() -> None:
+    """Drop the JSONB indexes and convert the columns back to JSON"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text("DROP INDEX IF EXISTS ix_preview_versions_version_data_gin"))
+    connection.execute(sa.text("DROP INDEX IF EXISTS ix_phase_results_errors"))
+
+    for table, column in JSONB_COLUMNS:
+        if _column_type(connection, table, column) == "jsonb":
+            connection.execute(sa.text(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json"
+            ))
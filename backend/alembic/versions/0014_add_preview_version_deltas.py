@@ -0,0 +1,62 @@
+"""Add delta storage columns to preview_versions
+
+Revision ID: 0014_add_preview_version_deltas
+Revises: 0013_convert_phase_payloads_to_jsonb
+Create Date: 2025-09-27 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_add_preview_version_deltas"
+down_revision = "0013_convert_phase_payloads_to_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(connection, column: str) -> bool:
+    result = connection.execute(sa.text("""
+        SELECT COUNT(*)
+        FROM information_schema.columns
+        WHERE table_name = 'preview_versions'
+        AND column_name = :column
+    """), {"column": column})
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    """Add version_delta / delta_depth; existing rows stay full checkpoints (depth 0)"""
+
+    connection = op.get_bind()
+
+    if not _has_column(connection, "version_delta"):
+        print("Adding version_delta column to preview_versions table...")
+        op.add_column("preview_versions", sa.Column("version_delta", postgresql.JSONB(), nullable=True))
+        print("Successfully added version_delta column")
+    else:
+        print("version_delta column already exists, skipping...")
+
+    if not _has_column(connection, "delta_depth"):
+        print("Adding delta_depth column to preview_versions table...")
+        op.add_column(
+            "preview_versions",
+            sa.Column("delta_depth", sa.Integer(), nullable=False, server_default="0"),
+        )
+        print("Successfully added delta_depth column")
+    else:
+        print("delta_depth column already exists, skipping...")
+
+
+def downgrade() -> None:
+    """Remove delta columns (delta rows must be materialized before downgrading)"""
+
+    connection = op.get_bind()
+
+    if _has_column(connection, "delta_depth"):
+        op.drop_column("preview_versions", "delta_depth")
+    if _has_column(connection, "version_delta"):
+        op.drop_column("preview_versions", "version_delta")
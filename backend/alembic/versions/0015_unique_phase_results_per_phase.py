@@ -0,0 +1,65 @@
+"""Deduplicate phase_results and enforce one row per (session_id, phase)
+
+Revision ID: 0015_unique_phase_results_per_phase
+Revises: 0014_add_preview_version_deltas
+Create Date: 2025-09-28 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_unique_phase_results_per_phase"
+down_revision = "0014_add_preview_version_deltas"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Keep the most recent row per (session_id, phase) and add the unique constraint"""
+
+    connection = op.get_bind()
+
+    print("Removing duplicate phase_results rows...")
+    result = connection.execute(sa.text("""
+        DELETE FROM phase_results
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY session_id, phase
+                           ORDER BY updated_at DESC, created_at DESC, id DESC
+                       ) AS rn
+                FROM phase_results
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """))
+    print(f"Removed {result.rowcount} duplicate phase_results rows")
+
+    exists = connection.execute(sa.text("""
+        SELECT COUNT(*)
+        FROM pg_constraint
+        WHERE conname = 'uq_phase_results_session_phase'
+    """)).scalar()
+
+    if exists == 0:
+        print("Adding uq_phase_results_session_phase constraint...")
+        connection.execute(sa.text("""
+            ALTER TABLE phase_results
+            ADD CONSTRAINT uq_phase_results_session_phase UNIQUE (session_id, phase)
+        """))
+        print("Successfully added uq_phase_results_session_phase constraint")
+    else:
+        print("uq_phase_results_session_phase already exists, skipping...")
+
+
+def downgrade() -> None:
+    """Drop the unique constraint (removed duplicates are not restored)"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text(
+        "ALTER TABLE phase_results DROP CONSTRAINT IF EXISTS uq_phase_results_session_phase"
+    ))
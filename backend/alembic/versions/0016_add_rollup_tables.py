@@ -0,0 +1,269 @@
+"""Add trigger-maintained rollup tables for dashboard and health metrics
+
+Revision ID: 0016_add_rollup_tables
+Revises: 0015_unique_phase_results_per_phase
+Create Date: 2025-09-29 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0016_add_rollup_tables"
+down_revision = "0015_unique_phase_results_per_phase"
+branch_labels = None
+depends_on = None
+
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS rollup_counters (
+    name VARCHAR(128) PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS session_hourly_rollups (
+    bucket_start TIMESTAMPTZ NOT NULL,
+    status VARCHAR(32) NOT NULL,
+    entered_count INTEGER NOT NULL DEFAULT 0,
+    duration_seconds_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    duration_histogram INTEGER[] NOT NULL DEFAULT '{0,0,0,0,0,0}',
+    PRIMARY KEY (bucket_start, status)
+);
+
+CREATE TABLE IF NOT EXISTS phase_quality_rollups (
+    phase INTEGER PRIMARY KEY,
+    quality_sum NUMERIC NOT NULL DEFAULT 0,
+    quality_count BIGINT NOT NULL DEFAULT 0
+);
+"""
+
+FUNCTIONS = """
+CREATE OR REPLACE FUNCTION rollup_bump(counter_name TEXT, delta BIGINT) RETURNS void AS $$
+BEGIN
+    INSERT INTO rollup_counters (name, value) VALUES (counter_name, delta)
+    ON CONFLICT (name) DO UPDATE SET value = rollup_counters.value + EXCLUDED.value;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Histogram slot for DURATION_HISTOGRAM_BOUNDS (60, 120, 300, 600, 1200, +inf)
+CREATE OR REPLACE FUNCTION rollup_duration_slot(seconds DOUBLE PRECISION) RETURNS INTEGER AS $$
+    SELECT CASE
+        WHEN seconds <= 60 THEN 1
+        WHEN seconds <= 120 THEN 2
+        WHEN seconds <= 300 THEN 3
+        WHEN seconds <= 600 THEN 4
+        WHEN seconds <= 1200 THEN 5
+        ELSE 6
+    END;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION rollup_session_hour(bucket TIMESTAMPTZ, session_status TEXT, duration DOUBLE PRECISION)
+RETURNS void AS $$
+DECLARE
+    slot INTEGER;
+BEGIN
+    INSERT INTO session_hourly_rollups (bucket_start, status, entered_count, duration_seconds_sum)
+    VALUES (bucket, session_status, 1, COALESCE(duration, 0))
+    ON CONFLICT (bucket_start, status) DO UPDATE SET
+        entered_count = session_hourly_rollups.entered_count + 1,
+        duration_seconds_sum = session_hourly_rollups.duration_seconds_sum + EXCLUDED.duration_seconds_sum;
+
+    IF duration IS NOT NULL THEN
+        slot := rollup_duration_slot(duration);
+        UPDATE session_hourly_rollups
+        SET duration_histogram[slot] = duration_histogram[slot] + 1
+        WHERE bucket_start = bucket AND status = session_status;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Same expression as the dashboard fallback: quality_score, else content.metadata.quality
+CREATE OR REPLACE FUNCTION rollup_phase_quality(score NUMERIC, content JSONB) RETURNS NUMERIC AS $$
+    SELECT COALESCE(
+        score,
+        CASE WHEN jsonb_typeof(content #> '{metadata,quality}') = 'number'
+             THEN (content #>> '{metadata,quality}')::numeric END
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION rollup_manga_sessions() RETURNS trigger AS $$
+DECLARE
+    duration DOUBLE PRECISION;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM rollup_bump('manga_sessions.total', 1);
+        PERFORM rollup_bump('manga_sessions.status.' || NEW.status, 1);
+        PERFORM rollup_session_hour(date_trunc('hour', now()), 'created', NULL);
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM rollup_bump('manga_sessions.total', -1);
+        PERFORM rollup_bump('manga_sessions.status.' || OLD.status, -1);
+        RETURN OLD;
+    ELSIF NEW.status IS DISTINCT FROM OLD.status THEN
+        PERFORM rollup_bump('manga_sessions.status.' || OLD.status, -1);
+        PERFORM rollup_bump('manga_sessions.status.' || NEW.status, 1);
+        IF NEW.status IN ('completed', 'failed') THEN
+            duration := EXTRACT(EPOCH FROM COALESCE(NEW.completed_at, NEW.updated_at, now()) - NEW.created_at);
+        END IF;
+        PERFORM rollup_session_hour(date_trunc('hour', now()), NEW.status, duration);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_manga_projects() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM rollup_bump('manga_projects.total', 1);
+        RETURN NEW;
+    END IF;
+    PERFORM rollup_bump('manga_projects.total', -1);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_phase_results() RETURNS trigger AS $$
+DECLARE
+    old_quality NUMERIC;
+    new_quality NUMERIC;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_quality := rollup_phase_quality(OLD.quality_score, OLD.content);
+        IF old_quality IS NOT NULL THEN
+            UPDATE phase_quality_rollups
+            SET quality_sum = quality_sum - old_quality, quality_count = quality_count - 1
+            WHERE phase = OLD.phase;
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        new_quality := rollup_phase_quality(NEW.quality_score, NEW.content);
+        IF new_quality IS NOT NULL THEN
+            INSERT INTO phase_quality_rollups (phase, quality_sum, quality_count)
+            VALUES (NEW.phase, new_quality, 1)
+            ON CONFLICT (phase) DO UPDATE SET
+                quality_sum = phase_quality_rollups.quality_sum + EXCLUDED.quality_sum,
+                quality_count = phase_quality_rollups.quality_count + 1;
+        END IF;
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = """
+DROP TRIGGER IF EXISTS trg_rollup_manga_sessions ON manga_sessions;
+CREATE TRIGGER trg_rollup_manga_sessions
+AFTER INSERT OR DELETE OR UPDATE OF status ON manga_sessions
+FOR EACH ROW EXECUTE FUNCTION rollup_manga_sessions();
+
+DROP TRIGGER IF EXISTS trg_rollup_manga_projects ON manga_projects;
+CREATE TRIGGER trg_rollup_manga_projects
+AFTER INSERT OR DELETE ON manga_projects
+FOR EACH ROW EXECUTE FUNCTION rollup_manga_projects();
+
+DROP TRIGGER IF EXISTS trg_rollup_phase_results ON phase_results;
+CREATE TRIGGER trg_rollup_phase_results
+AFTER INSERT OR DELETE OR UPDATE OF quality_score, content, phase ON phase_results
+FOR EACH ROW EXECUTE FUNCTION rollup_phase_results();
+"""
+
+BACKFILL = """
+DELETE FROM rollup_counters;
+DELETE FROM session_hourly_rollups;
+DELETE FROM phase_quality_rollups;
+
+INSERT INTO rollup_counters (name, value)
+SELECT 'manga_sessions.total', COUNT(*) FROM manga_sessions
+UNION ALL
+SELECT 'manga_projects.total', COUNT(*) FROM manga_projects
+UNION ALL
+SELECT 'manga_sessions.status.' || status, COUNT(*) FROM manga_sessions GROUP BY status;
+
+INSERT INTO session_hourly_rollups (bucket_start, status, entered_count)
+SELECT date_trunc('hour', created_at), 'created', COUNT(*)
+FROM manga_sessions
+GROUP BY 1;
+
+INSERT INTO session_hourly_rollups (bucket_start, status, entered_count, duration_seconds_sum, duration_histogram)
+SELECT
+    bucket_start,
+    status,
+    COUNT(*),
+    SUM(duration),
+    ARRAY[
+        COUNT(*) FILTER (WHERE slot = 1),
+        COUNT(*) FILTER (WHERE slot = 2),
+        COUNT(*) FILTER (WHERE slot = 3),
+        COUNT(*) FILTER (WHERE slot = 4),
+        COUNT(*) FILTER (WHERE slot = 5),
+        COUNT(*) FILTER (WHERE slot = 6)
+    ]::INTEGER[]
+FROM (
+    SELECT
+        date_trunc('hour', COALESCE(completed_at, updated_at)) AS bucket_start,
+        status,
+        EXTRACT(EPOCH FROM COALESCE(completed_at, updated_at) - created_at) AS duration,
+        rollup_duration_slot(EXTRACT(EPOCH FROM COALESCE(completed_at, updated_at) - created_at)) AS slot
+    FROM manga_sessions
+    WHERE status IN ('completed', 'failed')
+) terminal
+GROUP BY bucket_start, status;
+
+INSERT INTO phase_quality_rollups (phase, quality_sum, quality_count)
+SELECT phase, SUM(quality), COUNT(quality)
+FROM (
+    SELECT phase, rollup_phase_quality(quality_score, content) AS quality FROM phase_results
+) scored
+WHERE quality IS NOT NULL
+GROUP BY phase;
+"""
+
+
+def upgrade() -> None:
+    """Create rollup tables, maintenance triggers and backfill from history"""
+
+    connection = op.get_bind()
+
+    print("Creating rollup tables...")
+    connection.execute(sa.text(TABLES))
+
+    print("Creating rollup functions...")
+    connection.execute(sa.text(FUNCTIONS))
+
+    # Block writers while triggers are installed and history is backfilled so
+    # no row is counted twice or missed.
+    print("Locking source tables for backfill...")
+    connection.execute(sa.text(
+        "LOCK TABLE manga_sessions, manga_projects, phase_results IN SHARE ROW EXCLUSIVE MODE"
+    ))
+
+    print("Creating rollup triggers...")
+    connection.execute(sa.text(TRIGGERS))
+
+    print("Backfilling rollups...")
+    connection.execute(sa.text(BACKFILL))
+    print("Successfully created rollup tables")
+
+
+def downgrade() -> None:
+    """Drop rollup triggers, functions and tables"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text("""
+        DROP TRIGGER IF EXISTS trg_rollup_phase_results ON phase_results;
+        DROP TRIGGER IF EXISTS trg_rollup_manga_projects ON manga_projects;
+        DROP TRIGGER IF EXISTS trg_rollup_manga_sessions ON manga_sessions;
+        DROP FUNCTION IF EXISTS rollup_phase_results();
+        DROP FUNCTION IF EXISTS rollup_manga_projects();
+        DROP FUNCTION IF EXISTS rollup_manga_sessions();
+        DROP FUNCTION IF EXISTS rollup_phase_quality(NUMERIC, JSONB);
+        DROP FUNCTION IF EXISTS rollup_session_hour(TIMESTAMPTZ, TEXT, DOUBLE PRECISION);
+        DROP FUNCTION IF EXISTS rollup_duration_slot(DOUBLE PRECISION);
+        DROP FUNCTION IF EXISTS rollup_bump(TEXT, BIGINT);
+        DROP TABLE IF EXISTS phase_quality_rollups;
+        DROP TABLE IF EXISTS session_hourly_rollups;
+        DROP TABLE IF EXISTS rollup_counters;
+    """))
@@ -0,0 +1,40 @@
+"""Add partial (status, updated_at) index for stale session reconciliation
+
+Revision ID: 0017_add_active_session_status_index
+Revises: 0016_add_rollup_tables
+Create Date: 2025-09-30 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_add_active_session_status_index"
+down_revision = "0016_add_rollup_tables"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_manga_sessions_active_status_updated"
+
+
+def upgrade() -> None:
+    """Index only non-terminal sessions so reconciliation cost tracks active rows"""
+
+    connection = op.get_bind()
+
+    print(f"Creating {INDEX_NAME} index...")
+    connection.execute(sa.text(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON manga_sessions (status, updated_at) "
+        "WHERE status IN ('queued', 'running', 'awaiting_feedback', 'processing')"
+    ))
+    print("Successfully created active session status index")
+
+
+def downgrade() -> None:
+    """Drop the active session status index if it exists"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
@@ -0,0 +1,108 @@
+"""Add content-addressed blob table with trigger-maintained reference counts
+
+Revision ID: 0018_add_content_blobs
+Revises: 0017_add_active_session_status_index
+Create Date: 2025-10-02 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0018_add_content_blobs"
+down_revision = "0017_add_active_session_status_index"
+branch_labels = None
+depends_on = None
+
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS content_blobs (
+    digest VARCHAR(64) PRIMARY KEY,
+    storage_path VARCHAR(512) NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    content_type VARCHAR(100),
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    uploaded_at TIMESTAMP WITHOUT TIME ZONE,
+    touched_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+CREATE INDEX IF NOT EXISTS ix_content_blobs_unreferenced
+    ON content_blobs (touched_at) WHERE ref_count <= 0;
+
+ALTER TABLE generated_images
+    ADD COLUMN IF NOT EXISTS content_digest VARCHAR(64) REFERENCES content_blobs (digest);
+ALTER TABLE manga_assets
+    ADD COLUMN IF NOT EXISTS content_digest VARCHAR(64) REFERENCES content_blobs (digest);
+
+CREATE INDEX IF NOT EXISTS ix_generated_images_content_digest
+    ON generated_images (content_digest) WHERE content_digest IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_manga_assets_content_digest
+    ON manga_assets (content_digest) WHERE content_digest IS NOT NULL;
+"""
+
+FUNCTIONS = """
+-- Shared by every table that references content_blobs through content_digest
+CREATE OR REPLACE FUNCTION content_blob_refs() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.content_digest IS NOT NULL THEN
+        UPDATE content_blobs
+        SET ref_count = ref_count - 1, touched_at = now() AT TIME ZONE 'utc'
+        WHERE digest = OLD.content_digest;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NEW.content_digest IS NOT NULL THEN
+            UPDATE content_blobs
+            SET ref_count = ref_count + 1, touched_at = now() AT TIME ZONE 'utc'
+            WHERE digest = NEW.content_digest;
+        END IF;
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = """
+DROP TRIGGER IF EXISTS trg_content_refs_generated_images ON generated_images;
+CREATE TRIGGER trg_content_refs_generated_images
+AFTER INSERT OR DELETE OR UPDATE OF content_digest ON generated_images
+FOR EACH ROW EXECUTE FUNCTION content_blob_refs();
+
+DROP TRIGGER IF EXISTS trg_content_refs_manga_assets ON manga_assets;
+CREATE TRIGGER trg_content_refs_manga_assets
+AFTER INSERT OR DELETE OR UPDATE OF content_digest ON manga_assets
+FOR EACH ROW EXECUTE FUNCTION content_blob_refs();
+"""
+
+
+def upgrade() -> None:
+    """Create content_blobs, content_digest references and ref-count triggers"""
+
+    connection = op.get_bind()
+
+    print("Creating content_blobs table and content_digest columns...")
+    connection.execute(sa.text(TABLES))
+
+    print("Creating content reference functions and triggers...")
+    connection.execute(sa.text(FUNCTIONS))
+    connection.execute(sa.text(TRIGGERS))
+    print("Successfully created content-addressed blob storage")
+
+
+def downgrade() -> None:
+    """Drop ref-count triggers, content_digest references and content_blobs"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text("""
+        DROP TRIGGER IF EXISTS trg_content_refs_manga_assets ON manga_assets;
+        DROP TRIGGER IF EXISTS trg_content_refs_generated_images ON generated_images;
+        DROP FUNCTION IF EXISTS content_blob_refs();
+        DROP INDEX IF EXISTS ix_manga_assets_content_digest;
+        DROP INDEX IF EXISTS ix_generated_images_content_digest;
+        ALTER TABLE manga_assets DROP COLUMN IF EXISTS content_digest;
+        ALTER TABLE generated_images DROP COLUMN IF EXISTS content_digest;
+        DROP TABLE IF EXISTS content_blobs;
+    """))
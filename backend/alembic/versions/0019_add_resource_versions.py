@@ -0,0 +1,114 @@
+"""Add trigger-maintained project versions and a covering phase_results index for ETags
+
+Revision ID: 0019_add_resource_versions
+Revises: 0018_add_content_blobs
+Create Date: 2025-10-03 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0019_add_resource_versions"
+down_revision = "0018_add_content_blobs"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = """
+ALTER TABLE manga_projects ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+"""
+
+FUNCTIONS = """
+-- Every project write bumps manga_projects.version and the owner's list counter
+-- (rollup_counters 'manga_projects.user_version.<user_id>', see migration 0016)
+CREATE OR REPLACE FUNCTION manga_project_versions() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        IF OLD.user_id IS NOT NULL THEN
+            PERFORM rollup_bump('manga_projects.user_version.' || OLD.user_id, 1);
+        END IF;
+        RETURN OLD;
+    END IF;
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.version = OLD.version THEN
+            NEW.version := OLD.version + 1;
+        END IF;
+        IF OLD.user_id IS NOT NULL AND OLD.user_id IS DISTINCT FROM NEW.user_id THEN
+            PERFORM rollup_bump('manga_projects.user_version.' || OLD.user_id, 1);
+        END IF;
+    END IF;
+    IF NEW.user_id IS NOT NULL THEN
+        PERFORM rollup_bump('manga_projects.user_version.' || NEW.user_id, 1);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Assets are part of the project representation (files, thumbnail, size)
+CREATE OR REPLACE FUNCTION manga_asset_project_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE manga_projects SET version = version + 1 WHERE id = OLD.project_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.project_id IS DISTINCT FROM OLD.project_id) THEN
+        UPDATE manga_projects SET version = version + 1 WHERE id = NEW.project_id;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = """
+DROP TRIGGER IF EXISTS trg_manga_project_versions ON manga_projects;
+CREATE TRIGGER trg_manga_project_versions
+BEFORE INSERT OR UPDATE OR DELETE ON manga_projects
+FOR EACH ROW EXECUTE FUNCTION manga_project_versions();
+
+DROP TRIGGER IF EXISTS trg_manga_asset_project_version ON manga_assets;
+CREATE TRIGGER trg_manga_asset_project_version
+AFTER INSERT OR UPDATE OR DELETE ON manga_assets
+FOR EACH ROW EXECUTE FUNCTION manga_asset_project_version();
+"""
+
+INDEX_NAME = "ix_phase_results_session_phase_version"
+
+
+def upgrade() -> None:
+    """Add project versions, their triggers and the phase_results validator index"""
+
+    connection = op.get_bind()
+
+    print("Adding manga_projects.version...")
+    connection.execute(sa.text(COLUMNS))
+
+    print("Creating project version functions and triggers...")
+    connection.execute(sa.text(FUNCTIONS))
+    connection.execute(sa.text(TRIGGERS))
+
+    print(f"Creating {INDEX_NAME} index...")
+    connection.execute(sa.text(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON phase_results (session_id, phase) "
+        "INCLUDE (status, updated_at, preview_version_id)"
+    ))
+    print("Successfully created resource versions")
+
+
+def downgrade() -> None:
+    """Drop project version triggers, the version column and the validator index"""
+
+    connection = op.get_bind()
+    connection.execute(sa.text(f"""
+        DROP INDEX IF EXISTS {INDEX_NAME};
+        DROP TRIGGER IF EXISTS trg_manga_asset_project_version ON manga_assets;
+        DROP TRIGGER IF EXISTS trg_manga_project_versions ON manga_projects;
+        DROP FUNCTION IF EXISTS manga_asset_project_version();
+        DROP FUNCTION IF EXISTS manga_project_versions();
+        ALTER TABLE manga_projects DROP COLUMN IF EXISTS version;
+        DELETE FROM rollup_counters WHERE name LIKE 'manga_projects.user_version.%';
+    """))
@@ -0,0 +1,48 @@
+"""ETag / conditional GET helpers for read endpoints.
+
+Responses are per-user (authenticated), so they are marked ``private`` and
+must be revalidated (``no-cache``): browsers keep the body and revalidate
+with ``If-None-Match``, which the endpoints answer with 304 from a version
+lookup; shared caches never store another user's data (``Vary: Authorization``).
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "private, no-cache"
+VARY = "Authorization"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the given version parts"""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match evaluation (weak comparison, RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def set_validators(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = VARY
+
+
+def not_modified_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Attach validators to ``response``; return a 304 if the client already has ``etag``"""
+    set_validators(response, etag)
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    not_modified = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(not_modified, etag)
+    return not_modified
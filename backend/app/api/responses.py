@@ -0,0 +1,83 @@
+"""JSON response classes.
+
+``FastJSONResponse`` is the app-wide default response class (orjson when it is
+installed, compact stdlib json otherwise). ``ModelJSONResponse`` serializes
+response models that were assembled from trusted internal data (typically via
+``model_construct``) in one pydantic-core pass, skipping FastAPI's
+dump / re-validate / encode round trip for ``response_model`` routes.
+"""
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+# orjson は任意依存（未インストール時は標準 json にフォールバック）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Set by Starlette from the body; never copied from the injected response
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return jsonable_encoder(value)
+
+
+def dumps_json(content: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+class ModelJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return _adapter(type(content)).dump_json(content)
+        if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+            return _adapter(list[type(content[0])]).dump_json(content)
+        return dumps_json(content)
+
+
+def model_response(
+    content: Any,
+    response: Optional[Response] = None,
+    *,
+    status_code: int = 200,
+) -> ModelJSONResponse:
+    """Return ``content`` without response_model re-validation, keeping headers set on ``response`` (e.g. ETag)"""
+    result = ModelJSONResponse(content, status_code=status_code)
+    if response is not None:
+        result.raw_headers.extend(
+            (key, value) for key, value in response.raw_headers if key not in _BODY_HEADERS
+        )
+    return result
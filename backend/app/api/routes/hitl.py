@@ -29,8 +29,10 @@ from app.db.models import (
     PhaseFeedbackState,
     UserFeedbackHistory,
 )
+from app.db.loading import light_session_options
 from app.dependencies import get_db_session
 from app.services.hitl_service import HITLService
+from app.services.pagination import InvalidCursorError, apply_keyset, count_cache, split_page
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/hitl", tags=["hitl"])
@@ -301,14 +303,20 @@ async def get_feedback_history(
     session_id: UUID,
     phase: Optional[int] = Query(None, ge=1, le=7, description="Filter by phase"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of entries to return"),
-    offset: int = Query(0, ge=0, description="Number of entries to skip"),
+    offset: int = Query(0, ge=0, description="Number of entries to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    include_total: bool = Query(True, description="Include the (cached, approximate) total count"),
     db: AsyncSession = Depends(get_db_session),
 ) -> FeedbackHistoryResponse:
     """Get feedback history for a session"""
 
     try:
         # Check if session exists
-        session_query = select(MangaSession).where(MangaSession.request_id == session_id)
+        session_query = (
+            select(MangaSession)
+            .options(*light_session_options())
+            .where(MangaSession.request_id == session_id)
+        )
         session_result = await db.execute(session_query)
         session = session_result.scalar_one_or_none()
 
@@ -326,17 +334,31 @@ async def get_feedback_history(
         if phase is not None:
             query = query.where(UserFeedbackHistory.phase == phase)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar()
-
-        # Get paginated results
-        query = query.order_by(UserFeedbackHistory.created_at.desc())
-        query = query.offset(offset).limit(limit)
+        # Get total count (cached, approximate)
+        total_count = None
+        if include_total:
+            total_count, _ = await count_cache.count(db, ("feedback_history", session.id, phase), query)
+
+        # Get paginated results (keyset on (created_at, id))
+        if cursor is None and offset:
+            query = query.offset(offset)
+        try:
+            query = apply_keyset(
+                query,
+                UserFeedbackHistory.created_at,
+                UserFeedbackHistory.id,
+                descending=True,
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
 
         result = await db.execute(query)
-        feedback_entries = result.scalars().all()
+        feedback_entries, next_cursor = split_page(result.scalars().all(), limit, "created_at")
 
         return FeedbackHistoryResponse(
             session_id=str(session_id),
@@ -358,6 +380,7 @@ async def get_feedback_history(
                 for entry in feedback_entries
             ],
             total_count=total_count,
+            next_cursor=next_cursor,
         )
 
     except HTTPException:
@@ -4,11 +4,14 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import make_etag, not_modified_response
+from app.api.responses import model_response
 from app.api.schemas.manga import (
     FeedbackRequest,
     GenerateRequest,
@@ -26,33 +29,53 @@ from app.api.schemas.manga import (
     PhaseRetryRequest,
     PhaseRetryResponse,
     SessionDetailResponse,
+    SessionStatusBatchRequest,
+    SessionStatusBatchResponse,
     SessionStatusResponse,
 )
 from app.dependencies import get_db_session
 from app.dependencies.auth import get_current_user
 from app.db.models import UserAccount
+from app.services.export_service import ExportService, export_response
 from app.services.feedback_service import FeedbackService
 from app.services.generation_service import GenerationService
 from app.services.manga_project_service import MangaProjectService
 from app.services.message_service import MessageService
 from app.services.phase_preview_service import PhasePreviewService
+from app.services.resource_versions import phase_results_version, project_version, user_projects_version
+from app.services.session_resolver import SessionResolver
+from app.services.signed_url_cache import signed_url_cache
 
 router = APIRouter(prefix="/api/v1/manga", tags=["manga"])
 
 
 @router.get("", response_model=MangaProjectListResponse)
 async def get_manga_projects(
+    request: Request,
+    response: Response,
     page: int = 1,
     limit: int = 20,
     sort: str = "created_at",
     order: str = "desc",
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> MangaProjectListResponse:
     """Get paginated list of user's manga projects"""
     service = MangaProjectService(db)
     try:
+        etag = make_etag(
+            "manga-projects",
+            current_user.id,
+            await user_projects_version(db, current_user.id),
+            str(request.url.query),
+        )
+        not_modified = not_modified_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+
         items, pagination = await service.get_user_projects(
             user=current_user,
             page=page,
@@ -60,8 +83,12 @@ async def get_manga_projects(
             sort=sort,
             order=order,
             status_filter=status_filter,
+            cursor=cursor,
+            include_total=include_total,
         )
         return MangaProjectListResponse(items=items, pagination=pagination)
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -69,12 +96,20 @@ async def get_manga_projects(
 @router.get("/{manga_id}", response_model=MangaProjectDetailResponse)
 async def get_manga_project_detail(
     manga_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> MangaProjectDetailResponse:
     """Get detailed information about a specific manga project"""
     service = MangaProjectService(db)
     try:
+        version = await project_version(db, manga_id, current_user.id)
+        if version is not None:
+            not_modified = not_modified_response(request, response, make_etag("manga-project", manga_id, version, signed_url_cache.url_epoch()))
+            if not_modified is not None:
+                return not_modified
+
         project = await service.get_project_detail(manga_id, current_user)
         if not project:
             raise HTTPException(status_code=404, detail="Manga project not found")
@@ -116,15 +151,38 @@ async def enqueue_generation(
         ) from e
 
 
+@router.post("/sessions/status:batch", response_model=SessionStatusBatchResponse)
+async def get_session_status_batch(
+    payload: SessionStatusBatchRequest,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: UserAccount = Depends(get_current_user),
+) -> SessionStatusBatchResponse:
+    """Resolve status for many sessions owned by the current user in one request"""
+    service = GenerationService(db)
+    try:
+        return await service.get_status_batch(payload, current_user)
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.get("/sessions/{request_id}/status", response_model=SessionStatusResponse)
 async def get_session_status(
     request_id: UUID,
+    wait: float = Query(default=0, ge=0, le=60, description="Long-poll: seconds to hold the request until status or phase changes"),
+    since_version: Optional[int] = Query(default=None, ge=0, description="Version from a previous response; returns immediately if newer"),
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> SessionStatusResponse:
     service = GenerationService(db)
     try:
-        return await service.get_status(request_id, current_user)
+        return await service.get_status(
+            request_id,
+            current_user,
+            wait_seconds=wait,
+            since_version=since_version,
+        )
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover
@@ -134,18 +192,41 @@ async def get_session_status(
 @router.get("/sessions/{request_id}", response_model=SessionDetailResponse)
 async def get_session_detail(
     request_id: UUID,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated parts to include (phase_results, preview_versions, generated_images); omitted parts are not loaded",
+    ),
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> SessionDetailResponse:
     service = GenerationService(db)
+    field_mask = {field.strip() for field in fields.split(",") if field.strip()} if fields is not None else None
     try:
-        return await service.get_session(request_id, current_user)
+        return model_response(await service.get_session(request_id, current_user, fields=field_mask))
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/sessions/{request_id}/export")
+async def export_session(
+    request_id: UUID,
+    format: str = Query(default="ndjson", pattern="^(ndjson|zip)$", description="ndjson (phase results) or zip (phase results, assets and manifest)"),
+    db: AsyncSession = Depends(get_db_session),
+    current_user: UserAccount = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream a complete session; contents are read in small batches while the response is sent"""
+    service = ExportService(db)
+    try:
+        plan = await service.plan_session_export(request_id, current_user)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return export_response(plan, format)
+
+
 @router.post("/sessions/{request_id}/feedback", status_code=status.HTTP_202_ACCEPTED)
 async def submit_feedback(
     request_id: UUID,
@@ -166,12 +247,21 @@ async def get_session_messages(
     request_id: UUID,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> MessagesListResponse:
     service = MessageService(db)
     try:
-        return await service.get_session_messages(request_id, current_user, limit, offset)
+        return await service.get_session_messages(
+            request_id,
+            current_user,
+            limit,
+            offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
     except HTTPException:
         raise
     except Exception as exc:
@@ -198,12 +288,32 @@ async def create_session_message(
 @router.get("/sessions/{request_id}/phases", response_model=list[PhasePreviewResponse])
 async def get_phase_previews(
     request_id: UUID,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated optional fields to include (content, metadata); omit metadata to skip version_data",
+    ),
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> list[PhasePreviewResponse]:
     service = PhasePreviewService(db)
+    field_mask = {field.strip() for field in fields.split(",") if field.strip()} if fields is not None else None
     try:
-        return await service.get_phase_previews(request_id, current_user)
+        versions = await phase_results_version(db, request_id, current_user.id)
+        if versions is not None:
+            # 画像の署名 URL を含むため URL epoch も ETag に含める
+            etag = make_etag(
+                "phases",
+                request_id,
+                sorted(field_mask) if field_mask is not None else None,
+                versions,
+                signed_url_cache.url_epoch(),
+            )
+            not_modified = not_modified_response(request, response, etag)
+            if not_modified is not None:
+                return not_modified
+        return model_response(await service.get_phase_previews(request_id, current_user, fields=field_mask), response)
     except HTTPException:
         raise
     except Exception as exc:
@@ -214,12 +324,20 @@ async def get_phase_previews(
 async def get_phase_preview(
     request_id: UUID,
     phase_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
     current_user: UserAccount = Depends(get_current_user),
 ) -> PhasePreviewResponse:
     service = PhasePreviewService(db)
     try:
-        return await service.get_phase_preview(request_id, phase_id, current_user)
+        versions = await phase_results_version(db, request_id, current_user.id, phase=phase_id)
+        if versions is not None:
+            etag = make_etag("phase", request_id, versions, signed_url_cache.url_epoch())
+            not_modified = not_modified_response(request, response, etag)
+            if not_modified is not None:
+                return not_modified
+        return model_response(await service.get_phase_preview(request_id, phase_id, current_user), response)
     except HTTPException:
         raise
     except Exception as exc:
@@ -252,20 +370,16 @@ async def get_phase_error_details(
     current_user: UserAccount = Depends(get_current_user),
 ) -> PhaseErrorDetailResponse:
     """Get detailed error information for a specific phase"""
-    from app.services.pipeline_service import HITLCapablePipelineOrchestrator
-    from app.core.db import get_session_factory
+    from app.services.pipeline_service import get_hitl_orchestrator
 
     try:
         # Get session and verify ownership
-        generation_service = GenerationService(db)
-        session = await generation_service._get_session_by_request(request_id, current_user)
-
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
+        session = await SessionResolver.for_db(db).get_owned(
+            request_id, current_user, light=False, allow_unowned=True
+        )
 
         # Get error details using pipeline service
-        session_factory = get_session_factory()
-        orchestrator = HITLCapablePipelineOrchestrator(session_factory)
+        orchestrator = get_hitl_orchestrator()
         error_details = await orchestrator.get_phase_error_details(session, phase_id)
 
         if not error_details:
@@ -288,23 +402,20 @@ async def retry_phase(
     current_user: UserAccount = Depends(get_current_user),
 ) -> PhaseRetryResponse:
     """Retry a specific phase of the manga generation process"""
-    from app.services.pipeline_service import HITLCapablePipelineOrchestrator
-    from app.core.db import get_session_factory
+    from app.services.pipeline_service import get_hitl_orchestrator
 
     try:
         # Get session and verify ownership
-        generation_service = GenerationService(db)
-        session = await generation_service._get_session_by_request(request_id, current_user)
-
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
+        session = await SessionResolver.for_db(db).get_owned(
+            request_id, current_user, light=False, allow_unowned=True
+        )
 
         # Check if phase exists
         from sqlalchemy import select
         from app.db.models.phase_result import PhaseResult
 
         result = await db.execute(
-            select(PhaseResult).where(
+            select(PhaseResult.id).where(
                 PhaseResult.session_id == session.id,
                 PhaseResult.phase == phase_id
             )
@@ -324,8 +435,7 @@ async def retry_phase(
             )
 
         # Start retry using pipeline service
-        session_factory = get_session_factory()
-        orchestrator = HITLCapablePipelineOrchestrator(session_factory)
+        orchestrator = get_hitl_orchestrator()
 
         retry_success = await orchestrator.retry_specific_phase(
             session=session,
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import make_etag, not_modified_response
 from app.api.schemas.project import (
     MangaProjectDetailResponse,
     MangaProjectItem,
@@ -17,7 +20,10 @@ from app.api.schemas.project import (
 from app.dependencies import get_db_session
 from app.dependencies.auth import get_current_user
 from app.db.models import MangaProject, UserAccount
+from app.services.export_service import ExportService, export_response
 from app.services.project_service import ProjectService
+from app.services.resource_versions import project_version, user_projects_version
+from app.services.signed_url_cache import signed_url_cache
 
 
 router = APIRouter(prefix="/api/v1/projects", tags=["manga-projects"])
@@ -25,14 +31,30 @@ router = APIRouter(prefix="/api/v1/projects", tags=["manga-projects"])
 
 @router.get("", response_model=MangaProjectListResponse)
 async def list_projects(
+    request: Request,
+    response: Response,
     page: int = 1,
     limit: int = 20,
     sort: str = "created_at",
     order: str = "desc",
     status_filter: str = "all",
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     current_user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
 ) -> MangaProjectListResponse:
+    # サムネイルの署名 URL を含むため URL epoch も ETag に含める
+    etag = make_etag(
+        "projects",
+        current_user.id,
+        await user_projects_version(db, current_user.id),
+        signed_url_cache.url_epoch(),
+        str(request.url.query),
+    )
+    not_modified = not_modified_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
     service = ProjectService(db)
     projects, meta = await service.list_projects(
         current_user,
@@ -41,12 +63,14 @@ async def list_projects(
         sort=sort,
         order=order,
         status_filter=status_filter,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     items: List[MangaProjectItem] = []
-    for project in projects:
-        thumbnail_url = ProjectService.extract_thumbnail(project)
-        size_bytes = sum(int(asset.size_bytes) for asset in project.assets if asset.size_bytes)
+    thumbnails = await asyncio.gather(*(ProjectService.extract_thumbnail(project) for project in projects))
+    for project, thumbnail_url in zip(projects, thumbnails):
+        size_bytes = sum(int(asset.file_size) for asset in project.assets if asset.file_size)
         items.append(
             MangaProjectItem(
                 manga_id=project.id,
@@ -66,8 +90,10 @@ async def list_projects(
         limit=meta["limit"],
         total_items=meta["total_items"],
         total_pages=meta["total_pages"],
-        has_next=meta["page"] < meta["total_pages"],
-        has_previous=meta["page"] > 1,
+        has_next=meta["next_cursor"] is not None,
+        has_previous=meta["page"] > 1 or cursor is not None,
+        next_cursor=meta["next_cursor"],
+        total_is_approximate=meta["total_is_approximate"],
     )
 
     return MangaProjectListResponse(items=items, pagination=pagination)
@@ -76,12 +102,21 @@ async def list_projects(
 @router.get("/{manga_id}", response_model=MangaProjectDetailResponse)
 async def get_project_detail(
     manga_id: UUID,
+    request: Request,
+    response: Response,
     current_user: UserAccount = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
 ) -> MangaProjectDetailResponse:
+    version = await project_version(db, manga_id, current_user.id)
+    if version is not None:
+        etag = make_etag("project", manga_id, version, signed_url_cache.url_epoch())
+        not_modified = not_modified_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+
     service = ProjectService(db)
     project = await service.get_project(current_user, manga_id)
-    files = service.aggregate_files(project)
+    files = await service.aggregate_files(project)
     metadata = project.project_metadata or {}
     if project.settings:
         metadata = {"settings": project.settings, **metadata}
@@ -97,6 +132,17 @@ async def get_project_detail(
     )
 
 
+@router.get("/{manga_id}/export")
+async def export_project(
+    manga_id: UUID,
+    format: str = Query(default="ndjson", pattern="^(ndjson|zip)$"),
+    current_user: UserAccount = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+) -> StreamingResponse:
+    plan = await ExportService(db).plan_project_export(manga_id, current_user)
+    return export_response(plan, format)
+
+
 @router.put("/{manga_id}", response_model=MangaProjectUpdateResponse)
 async def update_project(
     manga_id: UUID,
@@ -3,12 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, select, text
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.db import get_session_metrics
 from app.core.settings import get_settings
-from app.db.models import MangaProject, MangaSession, PhaseResult
+from app.db.models.manga_session import MangaSessionStatus
 from app.dependencies import get_db_session
+from app.services import rollups
 
 
 router = APIRouter(prefix="/api/v1/system", tags=["system"])
@@ -29,6 +31,7 @@ async def system_health(db: AsyncSession = Depends(get_db_session)) -> dict:
             "database": db_status,
             "storage": "configured",
         },
+        "database_sessions": get_session_metrics(),
     }
 
 
@@ -52,22 +55,25 @@ async def system_capabilities() -> dict:
 
 @router.get("/dashboard")
 async def system_dashboard(db: AsyncSession = Depends(get_db_session)) -> dict:
-    total_projects = await db.execute(select(func.count()).select_from(MangaProject))
-    total_sessions = await db.execute(select(func.count()).select_from(MangaSession))
-    recent_sessions = await db.execute(
-        select(func.count())
-        .select_from(MangaSession)
-        .where(MangaSession.created_at >= func.now() - text("INTERVAL '1 day'"))
-    )
-    avg_quality = await db.execute(select(func.avg(PhaseResult.quality_score)))
+    # 集計はトリガーで更新されるロールアップ表から読む（ベーステーブルは走査しない）
+    counters = await rollups.get_counters(db, rollups.PROJECT_TOTAL_COUNTER, rollups.SESSION_TOTAL_COUNTER)
+    recent_sessions = await rollups.count_entered_since(db, rollups.CREATED_STATUS, hours=24)
+    processing = await rollups.get_duration_stats(db, MangaSessionStatus.COMPLETED.value, hours=24)
+    quality = await rollups.get_quality_overview(db)
 
     return {
         "system_overview": {
-            "projects_total": total_projects.scalar_one(),
-            "sessions_total": total_sessions.scalar_one(),
-            "sessions_last_24h": recent_sessions.scalar_one(),
+            "projects_total": counters[rollups.PROJECT_TOTAL_COUNTER],
+            "sessions_total": counters[rollups.SESSION_TOTAL_COUNTER],
+            "sessions_last_24h": recent_sessions,
+        },
+        "processing_metrics": {
+            "completed_last_24h": processing.count,
+            "avg_processing_seconds": processing.average_seconds,
+            "processing_time_histogram": processing.histogram_labels(),
         },
         "quality_metrics": {
-            "avg_quality_score": float(avg_quality.scalar_one() or 0),
+            "avg_quality_score": float(quality["average"]),
+            "avg_quality_by_phase": {str(phase): value for phase, value in quality["by_phase"].items()},
         },
     }
@@ -6,9 +6,8 @@ import logging
 from typing import Any, Dict
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.websocket import (
     InboundMessage,
@@ -16,8 +15,8 @@ from app.api.schemas.websocket import (
     KeepAliveMessage,
     build_error_message,
 )
+from app.core.db import session_scope
 from app.core.settings import get_settings
-from app.dependencies import get_db_session
 from app.services.hitl_service import HITLService
 from app.services.realtime_hub import realtime_hub
 
@@ -28,23 +27,24 @@ router = APIRouter()
 async def handle_user_feedback(
     message: UserFeedbackMessage,
     request_id: UUID,
-    websocket: WebSocket,
-    db: AsyncSession
+    websocket: WebSocket
 ) -> None:
     """Handle user feedback message"""
     try:
-        hitl_service = HITLService(db)
-
-        # Submit feedback through HITL service
-        result = await hitl_service.submit_feedback(
-            session_id=request_id,
-            phase=message.phase,
-            feedback_type=message.feedback_type,
-            selected_options=message.selected_options,
-            natural_language_input=message.natural_language_input,
-            user_satisfaction_score=message.user_satisfaction_score,
-            processing_time_ms=message.processing_time_ms,
-        )
+        # DBセッションはこのメッセージの処理中のみ保持する（送信前に返却）
+        async with session_scope(workload="websocket") as db:
+            hitl_service = HITLService(db)
+
+            # Submit feedback through HITL service
+            result = await hitl_service.submit_feedback(
+                session_id=request_id,
+                phase=message.phase,
+                feedback_type=message.feedback_type,
+                selected_options=message.selected_options,
+                natural_language_input=message.natural_language_input,
+                user_satisfaction_score=message.user_satisfaction_score,
+                processing_time_ms=message.processing_time_ms,
+            )
 
         # Send success confirmation compatible with frontend format
         response = {
@@ -92,8 +92,7 @@ async def handle_keep_alive(
 async def process_inbound_message(
     raw_message: Dict[str, Any],
     request_id: UUID,
-    websocket: WebSocket,
-    db: AsyncSession
+    websocket: WebSocket
 ) -> None:
     """Process incoming message from client"""
     try:
@@ -101,7 +100,7 @@ async def process_inbound_message(
 
         if message_type == "user_feedback":
             message = UserFeedbackMessage(**raw_message)
-            await handle_user_feedback(message, request_id, websocket, db)
+            await handle_user_feedback(message, request_id, websocket)
 
         elif message_type == "ping":
             message = KeepAliveMessage(**raw_message)
@@ -142,8 +141,7 @@ async def process_inbound_message(
 async def websocket_session_endpoint(
     websocket: WebSocket,
     request_id: UUID,
-    token: str | None = None,
-    db: AsyncSession = Depends(get_db_session)
+    token: str | None = None
 ):
     """Enhanced WebSocket endpoint with bidirectional HITL support"""
     settings = get_settings()
@@ -172,7 +170,7 @@ async def websocket_session_endpoint(
                 raw_data = await websocket.receive_text()
                 try:
                     message_data = json.loads(raw_data)
-                    await process_inbound_message(message_data, request_id, websocket, db)
+                    await process_inbound_message(message_data, request_id, websocket)
                 except json.JSONDecodeError as e:
                     logger.error(f"Invalid JSON received: {e}")
                     error_msg = build_error_message(
@@ -107,7 +107,8 @@ class FeedbackHistoryResponse(BaseModel):
     """Response schema for feedback history list"""
     session_id: str
     feedback_entries: List[UserFeedbackHistoryResponse]
-    total_count: int
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class HITLStatusResponse(BaseModel):
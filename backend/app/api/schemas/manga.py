@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -44,6 +44,24 @@ class SessionStatusResponse(BaseModel):
     current_phase: Optional[int] = None
     updated_at: datetime
     project_id: Optional[str] = None  # Changed from UUID to str for frontend compatibility
+    version: Optional[int] = None  # updated_at in epoch ms; pass back as since_version (valid on any instance)
+
+
+MAX_BATCH_STATUS_IDS = 100
+
+
+class SessionStatusBatchRequest(BaseModel):
+    request_ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_STATUS_IDS)
+    since_version: Optional[int] = Field(default=None, ge=0)
+    wait: float = Field(default=0, ge=0, le=60)
+
+
+class SessionStatusBatchResponse(BaseModel):
+    # items are compact tuples ordered as in `fields`
+    fields: List[str] = ["request_id", "status", "current_phase", "version"]
+    items: List[Tuple[str, str, Optional[int], int]]
+    missing: List[str] = []
+    version: int
 
 
 class SessionDetailResponse(BaseModel):
@@ -54,8 +72,11 @@ class SessionDetailResponse(BaseModel):
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
     retry_count: int
-    phase_results: list[dict]
-    preview_versions: list[dict]
+    # fields= で除外された場合は None（未ロード）
+    phase_results: Optional[list[dict]] = None
+    preview_versions: Optional[list[dict]] = None
+    # 保存済み画像（phase, storage_path, 署名 URL）
+    generated_images: Optional[list[dict]] = None
     project_id: Optional[str] = None  # Changed from UUID to str for frontend compatibility
 
 
@@ -90,8 +111,9 @@ class MessageResponse(BaseModel):
 
 class MessagesListResponse(BaseModel):
     messages: List[MessageResponse]
-    total: int
+    total: Optional[int] = None
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class PhasePreviewUpdate(BaseModel):
@@ -117,6 +139,8 @@ class PhasePreviewResponse(BaseModel):
     metadata: Optional[dict]
     created_at: datetime
     updated_at: datetime
+    # フェーズで保存された画像の署名 URL
+    image_urls: Optional[List[str]] = None
 
 
 class SessionEventResponse(BaseModel):
@@ -142,10 +166,12 @@ class MangaProjectItem(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None  # None when include_total=false
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    total_is_approximate: bool = False  # Served from the short-TTL count cache
 
 
 class MangaProjectListResponse(BaseModel):
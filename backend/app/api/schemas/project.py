@@ -10,10 +10,12 @@ from pydantic import BaseModel, Field
 class Pagination(BaseModel):
     page: int
     limit: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None  # None when include_total=false
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    total_is_approximate: bool = False  # Served from the short-TTL count cache
 
 
 class MangaProjectItem(BaseModel):
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import time
+from collections import defaultdict
 from contextlib import asynccontextmanager
+from typing import Any, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -9,6 +12,11 @@ from .settings import get_settings
 _engine = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
+# ワークロード別のセッション（接続チェックアウト）利用統計
+_session_stats: Dict[str, Dict[str, float]] = defaultdict(
+    lambda: {"checkouts": 0, "active": 0, "total_hold_seconds": 0.0, "max_hold_seconds": 0.0}
+)
+
 
 def init_engine() -> None:
     global _engine, _session_factory
@@ -30,6 +38,13 @@ def init_engine() -> None:
         )
 
 
+def get_engine():
+    if _engine is None:
+        init_engine()
+    assert _engine is not None
+    return _engine
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     if _session_factory is None:
         init_engine()
@@ -38,12 +53,46 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
 
 
 @asynccontextmanager
-async def session_scope() -> AsyncSession:
+async def session_scope(*, workload: str = "request") -> AsyncSession:
+    """Transactional session scope; usage is attributed to ``workload`` in session metrics."""
     session_factory = get_session_factory()
-    async with session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    stats = _session_stats[workload]
+    stats["checkouts"] += 1
+    stats["active"] += 1
+    started = time.perf_counter()
+    try:
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+    finally:
+        held = time.perf_counter() - started
+        stats["active"] -= 1
+        stats["total_hold_seconds"] += held
+        stats["max_hold_seconds"] = max(stats["max_hold_seconds"], held)
+
+
+def get_session_metrics() -> Dict[str, Any]:
+    """Return per-workload session usage and current pool status"""
+    metrics: Dict[str, Any] = {
+        "workloads": {
+            name: {
+                "checkouts": int(stats["checkouts"]),
+                "active": int(stats["active"]),
+                "avg_hold_ms": round(stats["total_hold_seconds"] * 1000 / stats["checkouts"], 2) if stats["checkouts"] else 0.0,
+                "max_hold_ms": round(stats["max_hold_seconds"] * 1000, 2),
+            }
+            for name, stats in _session_stats.items()
+        }
+    }
+    if _engine is not None:
+        pool = _engine.pool
+        metrics["pool"] = {
+            "size": getattr(pool, "size", lambda: None)(),
+            "checked_out": getattr(pool, "checkedout", lambda: None)(),
+            "overflow": getattr(pool, "overflow", lambda: None)(),
+        }
+    return metrics
@@ -20,16 +20,34 @@ class Settings(BaseSettings):
 
     gcs_bucket_preview: str = Field(...)
     signed_url_ttl_seconds: int = Field(default=3600, ge=60, le=86400)
+    signed_url_refresh_margin_seconds: int = Field(default=300, ge=0, le=3600, description="Cached signed URLs are re-signed this long before they expire")
+    signed_url_sweep_interval_minutes: int = Field(default=30, ge=1, le=1440, description="Interval of the expired preview_cache_metadata sweep")
+    storage_backend: str = Field(default="gcs", description="Asset storage backend: 'gcs' or 'local'")
+    storage_local_root: str = Field(default="/tmp/spell-storage", description="Root directory of the local storage backend")
+    storage_upload_concurrency: int = Field(default=8, ge=1, le=64, description="Max concurrent asset uploads per instance")
+    storage_stream_chunk_bytes: int = Field(default=8 * 1024 * 1024, ge=256 * 1024, le=256 * 1024 * 1024, description="Chunk size of streamed (resumable) uploads; a multiple of 256 KiB")
+    content_gc_grace_minutes: int = Field(default=60, ge=5, le=10080, description="Unreferenced content blobs are deleted only after being untouched this long")
+    content_gc_interval_minutes: int = Field(default=60, ge=1, le=1440, description="Interval of the unreferenced content blob sweep")
 
     firebase_project_id: str = Field(...)
     firebase_client_email: str = Field(...)
     firebase_private_key: str = Field(..., description="Service account private key with newlines escaped")
 
     websocket_base_url: Optional[AnyUrl] = Field(default=None)
+    session_snapshot_ttl_seconds: int = Field(default=15, ge=0, le=600, description="Max age of in-memory session snapshots (bounds cross-instance staleness)")
+    session_status_flush_interval_seconds: float = Field(default=2.0, ge=0.1, le=60, description="Max delay before buffered non-terminal session status updates are written")
+    preview_checkpoint_interval: int = Field(default=10, ge=1, le=100, description="Store a full preview version every N versions per phase (1 disables delta storage)")
+    health_report_refresh_seconds: float = Field(default=30.0, ge=1, le=3600, description="Interval of the background health report refresh; probes serve the cached report")
+    health_report_max_age_seconds: float = Field(default=120.0, ge=1, le=7200, description="Cached health reports older than this are rebuilt on read (single-flight)")
+    reconcile_interval_minutes: int = Field(default=10, ge=1, le=1440, description="Interval of the periodic state reconciliation job")
+    leader_renew_interval_seconds: float = Field(default=15.0, ge=1, le=300, description="How often the background-job leader renews its lease (and followers retry)")
+    leader_lease_seconds: float = Field(default=45.0, ge=2, le=900, description="Leader steps down if its lease has not been renewed within this time")
+    startup_warmup_timeout_seconds: float = Field(default=60.0, ge=0, le=600, description="Max time startup waits for client warm-up before accepting connections; /health/ready returns 503 until warm-up finishes")
 
     auth_secret_key: str = Field(default="change-me", min_length=12)
     access_token_expires_minutes: int = Field(default=60, ge=5, le=720)
     refresh_token_expires_days: int = Field(default=30, ge=1, le=90)
+    principal_cache_ttl_seconds: float = Field(default=60.0, ge=0, le=3600, description="Max age of cached authenticated principals (bounded by token expiry); bounds cross-instance deactivation lag")
 
     vertex_project_id: str = Field(default="", description="GCP project ID for Vertex AI")
     vertex_location: str = Field(default="asia-northeast1")
@@ -43,6 +61,7 @@ class Settings(BaseSettings):
     # HITL (Human-in-the-loop) Configuration
     hitl_enabled: bool = Field(default=True, description="Enable HITL feedback system")
     hitl_feedback_timeout_minutes: int = Field(default=30, ge=1, le=120, description="Feedback timeout in minutes")
+    hitl_feedback_poll_interval_seconds: int = Field(default=60, ge=5, le=600, description="Safety-net DB poll interval while waiting for feedback notifications")
     hitl_max_retry_attempts: int = Field(default=3, ge=1, le=10, description="Maximum retry attempts for failed feedback integration")
     hitl_default_quality_threshold: float = Field(default=0.72, ge=0.0, le=1.0, description="Default quality threshold for HITL phases")
     
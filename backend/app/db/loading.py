@@ -0,0 +1,49 @@
+"""Loader strategies for read paths that must not pull large JSON/text payloads.
+
+Large columns are deferred per query rather than on the mapper: the pipeline
+reads ``MangaSession.text`` / ``PhaseResult.content`` / ``PreviewVersion.version_data``
+from fully loaded rows, and an implicit lazy load would fail under AsyncSession
+anyway. Read paths opt in with these options; deferred columns use
+``raiseload=True`` so an accidental access fails loudly instead of issuing I/O.
+"""
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy.orm import Load, defer, selectinload
+
+from app.db.models import MangaProject, MangaSession, PhaseResult, PreviewVersion
+
+MANGA_SESSION_LARGE_COLUMNS = (
+    MangaSession.text,
+    MangaSession.session_metadata,
+    MangaSession.options,
+    MangaSession.feedback_mode,
+    MangaSession.error_message,
+)
+PHASE_RESULT_LARGE_COLUMNS = (PhaseResult.content,)
+PREVIEW_VERSION_LARGE_COLUMNS = (PreviewVersion.version_data,)
+MANGA_PROJECT_LARGE_COLUMNS = (MangaProject.project_metadata, MangaProject.settings)
+
+
+def light_session_options() -> List[Load]:
+    """MangaSession without story text / metadata blobs (ownership checks, ids, status)"""
+    return [defer(column, raiseload=True) for column in MANGA_SESSION_LARGE_COLUMNS]
+
+
+def session_detail_options(*, phase_results: bool, preview_versions: bool) -> List[Load]:
+    """Light MangaSession plus explicitly eager-loaded children for the requested parts
+
+    Children that were not requested are not loaded at all.
+    """
+    options = light_session_options()
+    if phase_results:
+        options.append(selectinload(MangaSession.phase_results))
+    if preview_versions:
+        options.append(selectinload(MangaSession.preview_versions))
+    return options
+
+
+def light_project_options() -> List[Load]:
+    """MangaProject without metadata/settings JSON (list views)"""
+    return [defer(column, raiseload=True) for column in MANGA_PROJECT_LARGE_COLUMNS]
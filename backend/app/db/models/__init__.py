@@ -17,6 +17,8 @@ from .interactive_changes import InteractiveChange
 from .preview_branches import PreviewBranch
 from .preview_versions_extended import PreviewVersionExtended
 from .phase_quality_gates import PhaseQualityGate
+from .rollups import PhaseQualityRollup, RollupCounter, SessionHourlyRollup
+from .content_blob import ContentBlob
 
 __all__ = [
     "MangaSession",
@@ -43,4 +45,8 @@ __all__ = [
     "PreviewVersionExtended",
     "PhaseQualityGate",
     "MangaAssetPhase",
+    "RollupCounter",
+    "SessionHourlyRollup",
+    "PhaseQualityRollup",
+    "ContentBlob",
 ]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, text
+
+from app.db.base import Base
+
+
+class ContentBlob(Base):
+    """Content-addressed stored object (``blobs/sha256/..``)
+
+    ``ref_count`` is maintained by triggers on the tables that reference the
+    blob through ``content_digest`` (generated_images, manga_assets).
+    ``uploaded_at`` is NULL until the object has been written; ``touched_at``
+    moves on every claim and reference change so garbage collection can
+    leave recently used blobs alone.
+    """
+
+    __tablename__ = "content_blobs"
+    __table_args__ = (
+        Index(
+            "ix_content_blobs_unreferenced",
+            "touched_at",
+            postgresql_where=text("ref_count <= 0"),
+        ),
+    )
+
+    digest = Column(String(64), primary_key=True)
+    storage_path = Column(String(512), nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    content_type = Column(String(100), nullable=True)
+    ref_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    uploaded_at = Column(DateTime, nullable=True)
+    touched_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
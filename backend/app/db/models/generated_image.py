@@ -16,6 +16,7 @@ class GeneratedImage(Base):
     session_id = Column(UUID(as_uuid=True), ForeignKey("manga_sessions.id", ondelete="CASCADE"), nullable=False)
     phase = Column(Integer, nullable=False)
     storage_path = Column(String(512), nullable=False)
+    content_digest = Column(String(64), ForeignKey("content_blobs.digest"), nullable=True)
     signed_url = Column(String(2048), nullable=True)
     image_metadata = Column(JSON, nullable=True)
 
@@ -35,6 +35,7 @@ class MangaAsset(Base):
     asset_type = Column(String(32), nullable=False)
     phase = Column(Integer, nullable=False)
     storage_path = Column(String(512), nullable=False)
+    content_digest = Column(String(64), ForeignKey("content_blobs.digest"), nullable=True)
     file_size = Column(BigInteger, nullable=True)
     content_type = Column(String(100), nullable=True)
     asset_metadata = Column(JSONB, nullable=True)
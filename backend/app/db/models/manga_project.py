@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -32,6 +32,8 @@ class MangaProject(Base):
     style = Column(String(64), nullable=True)
     visibility = Column(String(32), nullable=False, default="private")
     expires_at = Column(DateTime, nullable=True)
+    # Bumped by triggers on every project/asset write (ETag validator)
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -40,3 +42,10 @@ class MangaProject(Base):
     session = relationship("MangaSession", back_populates="projects", foreign_keys=[session_id])
     sessions = relationship("MangaSession", back_populates="project", foreign_keys="MangaSession.project_id")
     assets = relationship("MangaAsset", back_populates="project", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # keyset pagination: (user_id, sort_key, id)
+        Index("ix_manga_projects_user_created", "user_id", created_at.desc(), id.desc()),
+        Index("ix_manga_projects_user_updated", "user_id", updated_at.desc(), id.desc()),
+        Index("ix_manga_projects_user_title", "user_id", "title", "id"),
+    )
@@ -3,7 +3,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy import text as sql_text
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
 from sqlalchemy.orm import relationship
 
@@ -46,6 +47,16 @@ class MangaSession(Base):
     started_at = Column(TIMESTAMP(timezone=True), nullable=True)
     completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # stale-session reconciliation: 非終了状態の行だけを (status, updated_at) で引く
+        Index(
+            "ix_manga_sessions_active_status_updated",
+            "status",
+            "updated_at",
+            postgresql_where=sql_text("status IN ('queued', 'running', 'awaiting_feedback', 'processing')"),
+        ),
+    )
+
     phase_results = relationship("PhaseResult", back_populates="session", cascade="all, delete-orphan")
     preview_versions = relationship("PreviewVersion", back_populates="session", cascade="all, delete-orphan")
     feedback_entries = relationship("UserFeedback", back_populates="session", cascade="all, delete-orphan")
@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -17,7 +17,7 @@ class PhaseResult(Base):
     session_id = Column(UUID(as_uuid=True), ForeignKey("manga_sessions.id", ondelete="CASCADE"), nullable=False)
     phase = Column(Integer, nullable=False)
     status = Column(String(32), nullable=False, default="pending")
-    content = Column(JSON, nullable=True)
+    content = Column(JSONB, nullable=True)
     quality_score = Column(Numeric(4, 2), nullable=True)
     preview_version_id = Column(UUID(as_uuid=True), ForeignKey("preview_versions.id", ondelete="SET NULL"), nullable=True)
 
@@ -26,3 +26,22 @@ class PhaseResult(Base):
 
     session = relationship("MangaSession", back_populates="phase_results")
     preview_version = relationship("PreviewVersion", back_populates="phase_results")
+
+    __table_args__ = (
+        # 1 セッション・1 フェーズ 1 行（履歴は PreviewVersion 側）
+        UniqueConstraint("session_id", "phase", name="uq_phase_results_session_phase"),
+        # エラー詳細の参照用（失敗フェーズのみの部分インデックス）
+        Index(
+            "ix_phase_results_errors",
+            "session_id",
+            "phase",
+            postgresql_where=text("status = 'failed' OR content ? 'error'"),
+        ),
+        # ETag 検証用（index-only で version を判定する）
+        Index(
+            "ix_phase_results_session_phase_version",
+            "session_id",
+            "phase",
+            postgresql_include=["status", "updated_at", "preview_version_id"],
+        ),
+    )
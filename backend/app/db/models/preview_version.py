@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -17,7 +17,10 @@ class PreviewVersion(Base):
     session_id = Column(UUID(as_uuid=True), ForeignKey("manga_sessions.id", ondelete="CASCADE"), nullable=False)
     phase = Column(Integer, nullable=False)
     parent_version_id = Column(UUID(as_uuid=True), ForeignKey("preview_versions.id", ondelete="SET NULL"), nullable=True)
-    version_data = Column(JSON, nullable=True)
+    version_data = Column(JSONB, nullable=True)
+    # 差分保存: version_delta は親バージョンに対する JSON Patch（この場合 version_data は NULL）
+    version_delta = Column(JSONB, nullable=True)
+    delta_depth = Column(Integer, nullable=False, default=0, server_default="0")
     change_description = Column(String(255), nullable=True)
     quality_level = Column(Integer, nullable=True)
     quality_score = Column(Numeric(4, 2), nullable=True)
@@ -28,3 +31,15 @@ class PreviewVersion(Base):
     parent_version = relationship("PreviewVersion", remote_side=[id], backref="children")
     phase_results = relationship("PhaseResult", back_populates="preview_version")
     cache_entry = relationship("PreviewCacheMetadata", back_populates="preview_version", uselist=False)
+
+    __table_args__ = (
+        # Latest-version-per-phase lookups (DISTINCT ON phase ORDER BY created_at DESC)
+        Index("ix_preview_versions_session_phase_created", "session_id", "phase", created_at.desc()),
+        # Containment lookups on version_data (@>)
+        Index(
+            "ix_preview_versions_version_data_gin",
+            version_data,
+            postgresql_using="gin",
+            postgresql_ops={"version_data": "jsonb_path_ops"},
+        ),
+    )
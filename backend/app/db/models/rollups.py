@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Float, Integer, Numeric, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, TIMESTAMP
+
+from app.db.base import Base
+
+# 処理時間ヒストグラムの上限（秒）。最後のスロットはそれ以上
+DURATION_HISTOGRAM_BOUNDS = (60, 120, 300, 600, 1200)
+
+
+class RollupCounter(Base):
+    """Trigger-maintained counters (e.g. ``manga_sessions.status.running``)"""
+
+    __tablename__ = "rollup_counters"
+
+    name = Column(String(128), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+class SessionHourlyRollup(Base):
+    """Per-hour session transitions by status (``created`` counts inserts)
+
+    Terminal statuses also carry the processing-time sum and histogram
+    (slots follow DURATION_HISTOGRAM_BOUNDS plus an overflow slot).
+    """
+
+    __tablename__ = "session_hourly_rollups"
+
+    bucket_start = Column(TIMESTAMP(timezone=True), primary_key=True)
+    status = Column(String(32), primary_key=True)
+    entered_count = Column(Integer, nullable=False, default=0)
+    duration_seconds_sum = Column(Float, nullable=False, default=0)
+    duration_histogram = Column(
+        ARRAY(Integer),
+        nullable=False,
+        server_default=text("'{0,0,0,0,0,0}'"),
+    )
+
+
+class PhaseQualityRollup(Base):
+    """Per-phase quality sum/count over phase_results"""
+
+    __tablename__ = "phase_quality_rollups"
+
+    phase = Column(Integer, primary_key=True)
+    quality_sum = Column(Numeric, nullable=False, default=0)
+    quality_count = Column(BigInteger, nullable=False, default=0)
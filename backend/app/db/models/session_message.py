@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
 from sqlalchemy.orm import relationship
 
@@ -31,4 +31,8 @@ class SessionMessage(Base):
     updated_at = Column(TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    session = relationship("MangaSession", back_populates="messages")
\ No newline at end of file
+    session = relationship("MangaSession", back_populates="messages")
+
+    __table_args__ = (
+        Index("ix_session_messages_session_created", "session_id", created_at.desc(), id.desc()),
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID
 from sqlalchemy.orm import relationship
 
@@ -35,6 +35,10 @@ class UserFeedbackHistory(Base):
     # Relationships
     session = relationship("MangaSession", back_populates="feedback_history")
 
+    __table_args__ = (
+        Index("ix_user_feedback_history_session_created", "session_id", created_at.desc(), id.desc()),
+    )
+
     def __repr__(self) -> str:
         return f"<UserFeedbackHistory(session_id={self.session_id}, phase={self.phase}, type={self.feedback_type})>"
 
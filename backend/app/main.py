@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.responses import FastJSONResponse
 from app.api.routes import auth as auth_routes
 from app.api.routes import hitl as hitl_routes
 from app.api.routes import internal as internal_routes
@@ -28,6 +29,20 @@ async def lifespan(app: FastAPI):
     # Start background tasks
     background_tasks = []
 
+    # Firebase Admin SDK は起動時に一度だけ初期化する（リクエスト毎には行わない）
+    try:
+        from app.services.auth_service import AuthService
+        AuthService.initialize_firebase()
+    except Exception as e:
+        logger.error(f"❌ Firebase initialization failed: {e}")
+        raise
+
+    # Storage/Vertex クライアントとオーケストレーターを最初のリクエスト前に初期化する
+    from app.services.service_warmup import service_warmup
+    logger.info("🔥 Warming up clients and services...")
+    background_tasks.append(service_warmup.start())
+    await service_warmup.wait(timeout=get_settings().startup_warmup_timeout_seconds)
+
     try:
         # Import here to avoid circular imports and startup issues
         logger.info("🔧 Importing background services...")
@@ -37,18 +52,53 @@ async def lifespan(app: FastAPI):
         from app.services.state_reconciler import start_periodic_reconciliation
         logger.info("✅ State reconciler imported")
 
-        # Start health monitoring (every 5 minutes)
+        from app.services.leader_election import background_leader
+        logger.info("✅ Leader election imported")
+
+        # Singleton jobs run only on the instance holding the advisory lock
+        logger.info("🗳️ Starting leader election...")
+        leader_task = asyncio.create_task(background_leader.run())
+        background_tasks.append(leader_task)
+
+        # Start health monitoring (refreshes the cached report probes read)
         logger.info("🏥 Starting health monitoring...")
-        health_task = asyncio.create_task(start_health_monitoring(interval_minutes=5))
+        health_task = asyncio.create_task(
+            background_leader.run_while_leader(start_health_monitoring, job_name="health_monitoring")
+        )
         background_tasks.append(health_task)
         logger.info("✅ Health monitoring started")
 
-        # Start state reconciliation (every 10 minutes)
+        # Start state reconciliation (settings.reconcile_interval_minutes)
         logger.info("🔄 Starting state reconciliation...")
-        reconcile_task = asyncio.create_task(start_periodic_reconciliation(interval_minutes=10))
+        reconcile_task = asyncio.create_task(
+            background_leader.run_while_leader(start_periodic_reconciliation, job_name="state_reconciliation")
+        )
         background_tasks.append(reconcile_task)
         logger.info("✅ State reconciliation started")
 
+        # Sweep expired signed URL cache rows
+        from app.services.signed_url_cache import start_signed_url_sweep
+        sweep_task = asyncio.create_task(
+            background_leader.run_while_leader(start_signed_url_sweep, job_name="signed_url_sweep")
+        )
+        background_tasks.append(sweep_task)
+        logger.info("✅ Signed URL cache sweep started")
+
+        # Delete content blobs no longer referenced by any asset
+        from app.services.content_store import start_content_gc
+        content_gc_task = asyncio.create_task(
+            background_leader.run_while_leader(start_content_gc, job_name="content_gc")
+        )
+        background_tasks.append(content_gc_task)
+        logger.info("✅ Content blob GC started")
+
+        # Start HITL feedback listener (cross-instance LISTEN/NOTIFY)
+        from app.services.feedback_notifier import start_feedback_listener
+        logger.info("📡 Starting HITL feedback listener...")
+        feedback_listener_task = asyncio.create_task(start_feedback_listener())
+        background_tasks.append(feedback_listener_task)
+        logger.info("✅ HITL feedback listener started")
+
         logger.info("🎯 All background services started successfully")
 
     except Exception as e:
@@ -57,15 +107,22 @@ async def lifespan(app: FastAPI):
 
     yield  # Application runs here
 
-    # Cleanup on shutdown
+    # Cleanup on shutdown (singleton jobs first, then the election releases the lock)
     logger.info("🛑 Shutting down background services")
-    for task in background_tasks:
+    for task in reversed(background_tasks):
         if not task.done():
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
                 pass
+
+    # Write out buffered (non-terminal) session status updates
+    try:
+        from app.services.session_write_buffer import session_status_buffer
+        await session_status_buffer.flush_all()
+    except Exception as e:
+        logger.error(f"❌ Failed to flush session status buffer: {e}")
     logger.info("✅ Shutdown complete")
 
 
@@ -79,6 +136,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # Configure CORS
@@ -103,8 +161,14 @@ def create_app() -> FastAPI:
         return {"status": "ok"}
 
     @app.get("/health/ready")
-    async def health_ready() -> dict[str, str]:
+    async def health_ready():
         """Readiness probe - check if app is ready to serve traffic"""
+        from app.services.service_warmup import service_warmup
+        if not service_warmup.ready:
+            return FastJSONResponse(
+                {"status": "warming_up", "warmup": service_warmup.describe()},
+                status_code=503,
+            )
         try:
             # Basic database connectivity check
             from app.core.db import session_scope
@@ -122,13 +186,17 @@ def create_app() -> FastAPI:
         """Comprehensive system health check"""
         try:
             from app.services.health_monitor import health_monitor
+            from app.services.leader_election import background_leader
+            from app.services.service_warmup import service_warmup
             report = await health_monitor.get_system_health()
             return {
                 "status": report.overall_status.value,
                 "score": report.score,
                 "timestamp": report.timestamp.isoformat(),
                 "metrics_count": len(report.metrics),
-                "recommendations_count": len(report.recommendations)
+                "recommendations_count": len(report.recommendations),
+                "leader": background_leader.describe(),
+                "warmup": service_warmup.describe(),
             }
         except Exception as e:
             logger.error(f"Comprehensive health check failed: {e}")
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# GCS の resumable upload はチャンクが 256 KiB の倍数である必要がある
+GCS_CHUNK_ALIGNMENT = 256 * 1024
+
+
+async def iter_chunks(data: bytes, chunk_bytes: int) -> AsyncIterator[bytes]:
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_bytes):
+        yield bytes(view[offset:offset + chunk_bytes])
+
+
+class StorageBackend:
+    """Blocking object-store operations, exposed as coroutines"""
+
+    def warm(self) -> None:
+        """Blocking: create clients / directories ahead of the first request"""
+
+    async def upload_bytes(self, path: str, data: bytes, content_type: str) -> None:
+        raise NotImplementedError
+
+    async def upload_stream(self, path: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        raise NotImplementedError
+
+    async def download_bytes(self, path: str) -> bytes:
+        raise NotImplementedError
+
+    async def delete(self, path: str) -> None:
+        raise NotImplementedError
+
+
+class GCSStorageBackend(StorageBackend):
+    """GCS backend on the process-wide client (``core_clients.get_storage_client``)
+
+    Every blocking call runs in a worker thread; the client and its HTTP
+    connection pool are shared for the lifetime of the process.
+    """
+
+    def __init__(self, bucket_name: str, *, chunk_bytes: int = 8 * 1024 * 1024) -> None:
+        self.bucket_name = bucket_name
+        self.chunk_bytes = max(GCS_CHUNK_ALIGNMENT, chunk_bytes // GCS_CHUNK_ALIGNMENT * GCS_CHUNK_ALIGNMENT)
+        self._bucket: Any = None
+
+    def warm(self) -> None:
+        self._get_bucket()
+
+    def _get_bucket(self) -> Any:
+        if self._bucket is None:
+            from app.core import clients as core_clients
+
+            self._bucket = core_clients.get_storage_client().bucket(self.bucket_name)
+        return self._bucket
+
+    def _blob(self, path: str) -> Any:
+        return self._get_bucket().blob(path)
+
+    async def upload_bytes(self, path: str, data: bytes, content_type: str) -> None:
+        blob = self._blob(path)
+        await asyncio.to_thread(blob.upload_from_string, data, content_type=content_type)
+
+    async def upload_stream(self, path: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        """Resumable upload, one ``chunk_bytes`` request at a time; finalized only if the stream completes"""
+        blob = self._blob(path)
+        writer = await asyncio.to_thread(blob.open, "wb", chunk_size=self.chunk_bytes, content_type=content_type)
+        buffer = bytearray()
+        total = 0
+        async for chunk in chunks:
+            buffer.extend(chunk)
+            total += len(chunk)
+            if len(buffer) >= self.chunk_bytes:
+                pending, buffer = bytes(buffer), bytearray()
+                await asyncio.to_thread(writer.write, pending)
+        if buffer:
+            await asyncio.to_thread(writer.write, bytes(buffer))
+        await asyncio.to_thread(writer.close)
+        return total
+
+    async def download_bytes(self, path: str) -> bytes:
+        blob = self._blob(path)
+        return await asyncio.to_thread(blob.download_as_bytes)
+
+    async def delete(self, path: str) -> None:
+        blob = self._blob(path)
+        await asyncio.to_thread(blob.delete)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Filesystem backend for development and tests; writes are atomic (temp file + rename)"""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).resolve()
+
+    def warm(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _resolve(self, path: str) -> Path:
+        target = (self.root / path.lstrip("/")).resolve()
+        if target != self.root and self.root not in target.parents:
+            raise ValueError(f"Storage path escapes backend root: {path}")
+        return target
+
+    def _open_temp(self, target: Path) -> Tuple[int, str]:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+
+    def _write(self, target: Path, data: bytes) -> None:
+        fd, tmp_path = self._open_temp(target)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, target)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    async def upload_bytes(self, path: str, data: bytes, content_type: str) -> None:
+        await asyncio.to_thread(self._write, self._resolve(path), data)
+
+    async def upload_stream(self, path: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        target = self._resolve(path)
+        fd, tmp_path = await asyncio.to_thread(self._open_temp, target)
+        handle = os.fdopen(fd, "wb")
+        total = 0
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(handle.write, chunk)
+                total += len(chunk)
+            await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(os.replace, tmp_path, target)
+        except BaseException:
+            handle.close()
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return total
+
+    async def download_bytes(self, path: str) -> bytes:
+        return await asyncio.to_thread(self._resolve(path).read_bytes)
+
+    async def delete(self, path: str) -> None:
+        await asyncio.to_thread(self._resolve(path).unlink, missing_ok=True)
+
+
+class AssetStorage:
+    """Non-blocking asset I/O with bounded upload concurrency
+
+    - ``upload`` / ``upload_stream`` wait for one of ``max_concurrency`` slots,
+      so bursts of panel images cannot exhaust threads or sockets
+    - payloads larger than one chunk are streamed as a resumable upload
+    - ``start_upload`` runs an upload in the background; the caller keeps the
+      task and awaits it (``wait_for``) before it depends on the object
+    """
+
+    def __init__(
+        self,
+        backend: Optional[StorageBackend] = None,
+        *,
+        max_concurrency: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+    ) -> None:
+        self._backend = backend
+        self._max_concurrency = max_concurrency
+        self._chunk_bytes = chunk_bytes
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._background: Set[asyncio.Task] = set()
+        self.uploaded_bytes = 0
+
+    @property
+    def backend(self) -> StorageBackend:
+        if self._backend is None:
+            from app.core.settings import get_settings
+
+            settings = get_settings()
+            if settings.storage_backend == "local":
+                self._backend = LocalStorageBackend(settings.storage_local_root)
+            else:
+                self._backend = GCSStorageBackend(settings.gcs_bucket_preview, chunk_bytes=self.chunk_bytes)
+        return self._backend
+
+    @property
+    def max_concurrency(self) -> int:
+        if self._max_concurrency is None:
+            from app.core.settings import get_settings
+
+            self._max_concurrency = int(get_settings().storage_upload_concurrency)
+        return self._max_concurrency
+
+    @property
+    def chunk_bytes(self) -> int:
+        if self._chunk_bytes is None:
+            from app.core.settings import get_settings
+
+            self._chunk_bytes = int(get_settings().storage_stream_chunk_bytes)
+        return self._chunk_bytes
+
+    @property
+    def _slots(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def upload(self, path: str, data: bytes, *, content_type: str = "application/octet-stream") -> str:
+        if len(data) > self.chunk_bytes:
+            await self.upload_stream(path, iter_chunks(data, self.chunk_bytes), content_type=content_type)
+            return path
+        async with self._slots:
+            await self.backend.upload_bytes(path, data, content_type)
+        self.uploaded_bytes += len(data)
+        return path
+
+    async def upload_stream(
+        self,
+        path: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        async with self._slots:
+            total = await self.backend.upload_stream(path, chunks, content_type)
+        self.uploaded_bytes += total
+        return path
+
+    async def upload_many(self, items: Iterable[Tuple[str, bytes, str]]) -> List[str]:
+        """Upload ``(path, data, content_type)`` items concurrently (bounded by ``max_concurrency``)"""
+        return list(
+            await asyncio.gather(
+                *(self.upload(path, data, content_type=content_type) for path, data, content_type in items)
+            )
+        )
+
+    def start_upload(
+        self,
+        path: str,
+        data: bytes,
+        *,
+        content_type: str = "application/octet-stream",
+    ) -> asyncio.Task:
+        return self.spawn(self.upload(path, data, content_type=content_type))
+
+    def spawn(self, coro: Awaitable[T]) -> "asyncio.Task[T]":
+        """Run an upload-bound coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.ensure_future(coro)
+        # 参照を保持しないとタスクが GC される可能性がある
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    @staticmethod
+    async def wait_for(tasks: Iterable[asyncio.Task]) -> List[Any]:
+        """Await background uploads; failures are logged and left out of the result"""
+        uploaded = []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Background asset upload failed: {result}")
+            else:
+                uploaded.append(result)
+        return uploaded
+
+    async def warm(self) -> None:
+        """Resolve the backend and its client so the first upload does not pay for it"""
+        backend = self.backend
+        await asyncio.to_thread(backend.warm)
+
+    async def download(self, path: str) -> bytes:
+        return await self.backend.download_bytes(path)
+
+    async def delete(self, path: str) -> None:
+        await self.backend.delete(path)
+
+
+asset_storage = AssetStorage()
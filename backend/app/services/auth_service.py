@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import get_settings
 from app.db.models import UserAccount, UserRefreshToken
+from app.services.principal_cache import principal_cache
 from app.services.token_service import TokenService
 
 # Firebase Admin SDK のインポートを条件付きにする
@@ -29,6 +30,12 @@ except ImportError:
 class AuthService:
     _firebase_initialized = False
 
+    @classmethod
+    def initialize_firebase(cls) -> bool:
+        """Initialize the Firebase Admin SDK once per process (called at startup)"""
+        cls._initialize_firebase()
+        return cls._firebase_initialized
+
     @classmethod
     def _initialize_firebase(cls):
         if not cls._firebase_initialized and FIREBASE_ADMIN_AVAILABLE:
@@ -63,9 +70,10 @@ class AuthService:
         self.db = db
         self.settings = get_settings()
         self.token_service = TokenService(self.settings.auth_secret_key)
-        self._initialize_firebase()
 
     async def login_with_google(self, id_token: str) -> Dict[str, object]:
+        # 通常は起動時に初期化済み（未初期化の場合のみここで行う）
+        self._initialize_firebase()
         claims = self._decode_id_token(id_token)
         # FirebaseとGoogle JWTの様々なフィールド名に対応
         firebase_uid = claims.get("uid") or claims.get("user_id") or claims.get("sub")
@@ -123,6 +131,10 @@ class AuthService:
         )
 
     async def authenticate_access_token(self, token: str) -> UserAccount:
+        cached = principal_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             payload = self.token_service.verify_token(token)
         except ValueError:
@@ -136,6 +148,7 @@ class AuthService:
         user = result.scalar_one_or_none()
         if not user or not user.is_active:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user_inactive")
+        principal_cache.put(token, user, datetime.fromisoformat(payload["exp"]))
         return user
 
     async def _ensure_user(self, firebase_uid: str, email: str, claims: Dict[str, object]) -> UserAccount:
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ContentBlob
+from app.services.asset_storage import AssetStorage, asset_storage
+
+logger = logging.getLogger(__name__)
+
+# これより大きいペイロードはワーカースレッドでハッシュする
+THREADED_DIGEST_BYTES = 1024 * 1024
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+async def compute_digest(data: bytes) -> str:
+    """content_digest that keeps large payloads off the event loop"""
+    if len(data) > THREADED_DIGEST_BYTES:
+        return await asyncio.to_thread(content_digest, data)
+    return content_digest(data)
+
+
+def blob_path(digest: str) -> str:
+    return f"blobs/sha256/{digest[:2]}/{digest}"
+
+
+@dataclass(frozen=True)
+class StoredContent:
+    digest: str
+    storage_path: str
+    size_bytes: int
+    deduplicated: bool
+
+
+class ContentStore:
+    """Content-addressed, deduplicated object storage on top of AssetStorage
+
+    - Objects live at ``blobs/sha256/<digest>``; ``content_blobs`` records
+      whether the object has been written
+    - ``put`` of content that is already stored only touches metadata
+    - Callers reference a blob by storing its digest in ``content_digest``
+      (generated_images, manga_assets); triggers keep ``ref_count`` in sync
+    - Unreferenced blobs are deleted by ``collect_garbage`` once they have not
+      been touched for ``gc_grace_minutes``, which covers the gap between
+      ``put`` and the caller committing its reference
+    """
+
+    def __init__(
+        self,
+        storage: Optional[AssetStorage] = None,
+        *,
+        scope: Optional[Callable[..., AbstractAsyncContextManager[AsyncSession]]] = None,
+        gc_grace_minutes: Optional[int] = None,
+    ) -> None:
+        self._storage = storage
+        self._scope = scope
+        self._gc_grace_minutes = gc_grace_minutes
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.uploads = 0
+        self.deduplicated = 0
+
+    @property
+    def storage(self) -> AssetStorage:
+        return self._storage or asset_storage
+
+    @property
+    def gc_grace_minutes(self) -> int:
+        if self._gc_grace_minutes is None:
+            from app.core.settings import get_settings
+
+            self._gc_grace_minutes = int(get_settings().content_gc_grace_minutes)
+        return self._gc_grace_minutes
+
+    def _session_scope(self, workload: str) -> AbstractAsyncContextManager[AsyncSession]:
+        if self._scope is not None:
+            return self._scope(workload=workload)
+        from app.core.db import session_scope
+
+        return session_scope(workload=workload)
+
+    async def put(self, data: bytes, *, content_type: str, digest: Optional[str] = None) -> StoredContent:
+        """Store ``data`` once; the caller must reference the returned digest to keep it"""
+        if digest is None:
+            digest = await compute_digest(data)
+
+        inflight = self._inflight.get(digest)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[digest] = future
+        try:
+            stored = await self._put(digest, data, content_type)
+            future.set_result(stored)
+            return stored
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 待機者がいない場合の "exception was never retrieved" を抑止
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(digest, None)
+
+    async def _put(self, digest: str, data: bytes, content_type: str) -> StoredContent:
+        path = blob_path(digest)
+        async with self._session_scope("content_store") as db:
+            already_uploaded = await self._claim(db, digest, path, len(data), content_type)
+        if already_uploaded:
+            self.deduplicated += 1
+            return StoredContent(digest, path, len(data), deduplicated=True)
+
+        # 同じ内容を並行して書くインスタンスがあっても、同一パス・同一バイト列なので安全
+        await self.storage.upload(path, data, content_type=content_type)
+        async with self._session_scope("content_store") as db:
+            await db.execute(
+                update(ContentBlob)
+                .where(ContentBlob.digest == digest, ContentBlob.uploaded_at.is_(None))
+                .values(uploaded_at=datetime.utcnow())
+            )
+        self.uploads += 1
+        return StoredContent(digest, path, len(data), deduplicated=False)
+
+    @staticmethod
+    async def _claim(db: AsyncSession, digest: str, path: str, size: int, content_type: str) -> bool:
+        """Register (or touch) the blob row; True if its object has already been written"""
+        now = datetime.utcnow()
+        statement = insert(ContentBlob).values(
+            digest=digest,
+            storage_path=path,
+            size_bytes=size,
+            content_type=content_type,
+            ref_count=0,
+            touched_at=now,
+            created_at=now,
+        )
+        uploaded_at = (
+            await db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[ContentBlob.digest],
+                    set_={"touched_at": statement.excluded.touched_at},
+                ).returning(ContentBlob.uploaded_at)
+            )
+        ).scalar()
+        return uploaded_at is not None
+
+    async def delete_unreferenced(self, db: AsyncSession, *, limit: int = 500) -> int:
+        """Delete unreferenced blobs past the grace period within ``db``'s transaction
+
+        Candidate rows stay locked (FOR UPDATE) while their objects are
+        deleted, so a concurrent ``_claim`` of the same digest waits for this
+        transaction and then registers a fresh, not-yet-uploaded row instead
+        of deduplicating against an object that is being removed. Rows whose
+        object could not be deleted are kept for the next run.
+        """
+        cutoff = datetime.utcnow() - timedelta(minutes=self.gc_grace_minutes)
+        candidates = await db.execute(
+            select(ContentBlob.digest, ContentBlob.storage_path, ContentBlob.uploaded_at)
+            .where(ContentBlob.ref_count <= 0, ContentBlob.touched_at < cutoff)
+            .order_by(ContentBlob.touched_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        deleted: List[str] = []
+        for row in candidates:
+            if row.uploaded_at is not None:
+                try:
+                    await self.storage.delete(row.storage_path)
+                except Exception as e:
+                    logger.warning(f"Deleting unreferenced blob {row.storage_path} failed: {e}")
+                    continue
+            deleted.append(row.digest)
+        if deleted:
+            await db.execute(
+                delete(ContentBlob).where(ContentBlob.digest.in_(deleted), ContentBlob.ref_count <= 0)
+            )
+        return len(deleted)
+
+    async def collect_garbage(self, *, limit: int = 500) -> int:
+        """Remove unreferenced blobs; objects are deleted before their locked rows are"""
+        async with self._session_scope("content_gc") as db:
+            return await self.delete_unreferenced(db, limit=limit)
+
+
+content_store = ContentStore()
+
+
+async def start_content_gc(interval_minutes: Optional[int] = None):
+    """Periodically delete unreferenced content blobs (leader-only job)"""
+    if interval_minutes is None:
+        from app.core.settings import get_settings
+
+        interval_minutes = get_settings().content_gc_interval_minutes
+    logger.info(f"🧹 Starting content blob GC (every {interval_minutes} minutes)")
+
+    while True:
+        try:
+            await asyncio.sleep(interval_minutes * 60)
+            removed = await content_store.collect_garbage()
+            if removed:
+                logger.info(f"🧹 Removed {removed} unreferenced content blobs")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Content blob GC failed: {e}")
@@ -9,12 +9,11 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.manga_session import MangaSession, MangaSessionStatus
-from app.core.db import session_scope
+from app.db.models.manga_session import MangaSessionStatus
 from app.services.realtime_hub import realtime_hub
+from app.services.session_write_buffer import session_status_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -40,22 +39,19 @@ class EmergencyStopManager:
             True if successful, False otherwise
         """
         try:
-            async with session_scope() as db_session:
-                # Update session status in database
-                await db_session.execute(
-                    update(MangaSession)
-                    .where(MangaSession.id == session_id)
-                    .values(
-                        status=MangaSessionStatus.FAILED.value,
-                        error_message=f"Emergency stop: {reason}",
-                        updated_at=datetime.utcnow()
-                    )
-                )
-                await db_session.commit()
-
-                logger.warning(
-                    f"🚨 Emergency stop executed for session {session_id}: {reason}"
-                )
+            # Terminal state: merged with any buffered status fields and written immediately
+            await session_status_buffer.update(
+                session_id,
+                {
+                    "status": MangaSessionStatus.FAILED.value,
+                    "error_message": f"Emergency stop: {reason}",
+                },
+                flush=True,
+            )
+
+            logger.warning(
+                f"🚨 Emergency stop executed for session {session_id}: {reason}"
+            )
 
             # Immediate WebSocket notification to frontend
             await EmergencyStopManager._notify_frontend_immediately(
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import io
+import logging
+import mimetypes
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import PurePosixPath
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import dumps_json
+from app.db.models import GeneratedImage, MangaAsset, MangaProject, MangaSession, PhaseResult, UserAccount
+from app.services.asset_storage import AssetStorage, asset_storage
+from app.services.session_resolver import SessionResolver
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "zip")
+# phase_results を読む単位。バッチ毎に DB セッションを開閉し、送信中は接続を保持しない
+EXPORT_BATCH_SIZE = 8
+# これ以上のチャンクが溜まったら ZIP の出力を吐き出す
+ZIP_FLUSH_BYTES = 256 * 1024
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "zip": "application/zip"}
+
+
+@dataclass
+class ExportPlan:
+    """What an export contains; only keys and small metadata, never phase contents"""
+
+    name: str
+    header: Dict[str, Any]
+    phase_keys: List[Tuple[UUID, int]] = field(default_factory=list)
+    assets: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class ExportService:
+    """Plans session/project exports inside the request; streaming happens in ``stream_*``"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def plan_session_export(self, request_id: UUID, user: UserAccount) -> ExportPlan:
+        session = await SessionResolver.for_db(self.db).get_owned(request_id, user)
+        header = {
+            "type": "session",
+            "session_id": str(session.id),
+            "request_id": str(session.request_id),
+            "status": session.status,
+            "current_phase": session.current_phase,
+            "started_at": _iso(session.started_at),
+            "completed_at": _iso(session.completed_at),
+            "project_id": str(session.project_id) if session.project_id else None,
+        }
+        plan = ExportPlan(name=f"session-{session.request_id}", header=header)
+        await self._add_sessions(plan, [session.id])
+        return plan
+
+    async def plan_project_export(self, project_id: UUID, user: UserAccount) -> ExportPlan:
+        project = (
+            await self.db.execute(
+                select(MangaProject).where(MangaProject.id == project_id, MangaProject.user_id == user.id)
+            )
+        ).scalar_one_or_none()
+        if project is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="project_not_found")
+
+        header = {
+            "type": "project",
+            "manga_id": str(project.id),
+            "title": project.title,
+            "status": project.status,
+            "total_pages": project.total_pages,
+            "style": project.style,
+            "metadata": project.project_metadata,
+            "created_at": _iso(project.created_at),
+            "updated_at": _iso(project.updated_at),
+        }
+        plan = ExportPlan(name=f"project-{project.id}", header=header)
+
+        session_ids = (
+            await self.db.execute(
+                select(MangaSession.id)
+                .where(or_(MangaSession.project_id == project.id, MangaSession.id == project.session_id))
+                .order_by(MangaSession.created_at)
+            )
+        ).scalars().all()
+        await self._add_sessions(plan, list(session_ids))
+
+        assets = await self.db.execute(
+            select(
+                MangaAsset.storage_path,
+                MangaAsset.content_type,
+                MangaAsset.asset_type,
+                MangaAsset.phase,
+                MangaAsset.file_size,
+            )
+            .where(MangaAsset.project_id == project.id)
+            .order_by(MangaAsset.created_at)
+        )
+        plan.assets.extend(
+            {
+                "type": "asset",
+                "asset_type": row.asset_type,
+                "phase": row.phase,
+                "storage_path": row.storage_path,
+                "content_type": row.content_type,
+                "size_bytes": int(row.file_size) if row.file_size else None,
+            }
+            for row in assets
+        )
+        return plan
+
+    async def _add_sessions(self, plan: ExportPlan, session_ids: List[UUID]) -> None:
+        if not session_ids:
+            return
+        keys = await self.db.execute(
+            select(PhaseResult.session_id, PhaseResult.phase)
+            .where(PhaseResult.session_id.in_(session_ids))
+            .order_by(PhaseResult.session_id, PhaseResult.phase)
+        )
+        plan.phase_keys.extend((row.session_id, row.phase) for row in keys)
+
+        images = await self.db.execute(
+            select(
+                GeneratedImage.session_id,
+                GeneratedImage.phase,
+                GeneratedImage.storage_path,
+                GeneratedImage.image_metadata,
+            )
+            .where(GeneratedImage.session_id.in_(session_ids))
+            .order_by(GeneratedImage.created_at)
+        )
+        plan.assets.extend(
+            {
+                "type": "generated_image",
+                "session_id": str(row.session_id),
+                "phase": row.phase,
+                "storage_path": row.storage_path,
+                "content_type": "image/png",
+                "metadata": row.image_metadata,
+            }
+            for row in images
+        )
+
+
+async def iter_phase_results(plan: ExportPlan, *, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+    """Phase result records in plan order, read in short per-batch transactions"""
+    from app.core.db import session_scope
+
+    for offset in range(0, len(plan.phase_keys), batch_size):
+        batch = plan.phase_keys[offset:offset + batch_size]
+        async with session_scope(workload="export") as db:
+            result = await db.execute(
+                select(
+                    PhaseResult.session_id,
+                    PhaseResult.phase,
+                    PhaseResult.status,
+                    PhaseResult.quality_score,
+                    PhaseResult.content,
+                    PhaseResult.updated_at,
+                ).where(tuple_(PhaseResult.session_id, PhaseResult.phase).in_(batch))
+            )
+            rows = {(row.session_id, row.phase): row for row in result}
+        for key in batch:
+            row = rows.get(key)
+            if row is None:
+                continue  # 計画後に削除された
+            yield {
+                "type": "phase_result",
+                "session_id": str(row.session_id),
+                "phase": row.phase,
+                "status": row.status,
+                "quality_score": float(row.quality_score) if row.quality_score is not None else None,
+                "content": row.content,
+                "updated_at": _iso(row.updated_at),
+            }
+
+
+async def stream_ndjson(plan: ExportPlan) -> AsyncIterator[bytes]:
+    """Header, phase results, then asset records; one JSON document per line"""
+    yield dumps_json(plan.header) + b"\n"
+    async for record in iter_phase_results(plan):
+        yield dumps_json(record) + b"\n"
+    for asset in plan.assets:
+        yield dumps_json(asset) + b"\n"
+
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable sink: zipfile then writes data descriptors and never seeks back"""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    @property
+    def pending(self) -> int:
+        return self._size
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        return data
+
+
+def _asset_entry_name(asset: Dict[str, Any]) -> str:
+    path = PurePosixPath(asset["storage_path"])
+    if not path.suffix and asset.get("content_type"):
+        path = path.with_name(path.name + (mimetypes.guess_extension(asset["content_type"]) or ""))
+    return f"assets/{path}"
+
+
+async def stream_zip(plan: ExportPlan, storage: Optional[AssetStorage] = None) -> AsyncIterator[bytes]:
+    """ZIP of phase results (deflated JSON), assets (stored as-is) and a trailing manifest.json
+
+    Memory is bounded by one phase-result batch plus one asset object.
+    """
+    storage = storage or asset_storage
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+    manifest: Dict[str, Any] = {**plan.header, "phase_results": [], "assets": []}
+
+    async for record in iter_phase_results(plan):
+        name = f"phases/{record['session_id']}/phase-{record['phase']}.json"
+        archive.writestr(name, dumps_json(record))
+        manifest["phase_results"].append({"session_id": record["session_id"], "phase": record["phase"], "file": name})
+        if sink.pending >= ZIP_FLUSH_BYTES:
+            yield sink.drain()
+
+    written = set()
+    for asset in plan.assets:
+        entry = {key: value for key, value in asset.items() if key != "metadata"}
+        name = _asset_entry_name(asset)
+        if name not in written:
+            try:
+                data = await storage.download(asset["storage_path"])
+            except Exception as e:
+                logger.warning(f"Export {plan.name}: asset {asset['storage_path']} unavailable: {e}")
+                manifest["assets"].append({**entry, "missing": True})
+                continue
+            info = zipfile.ZipInfo(name, date_time=datetime.utcnow().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            archive.writestr(info, data)
+            written.add(name)
+            yield sink.drain()
+        manifest["assets"].append({**entry, "file": name})
+
+    archive.writestr("manifest.json", dumps_json(manifest))
+    archive.close()
+    yield sink.drain()
+
+
+def export_response(plan: ExportPlan, export_format: str) -> StreamingResponse:
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported_export_format")
+    body = stream_zip(plan) if export_format == "zip" else stream_ndjson(plan)
+    filename = f"{plan.name}.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK_CHANNEL = "hitl_feedback"
+
+FeedbackKey = Tuple[str, int]
+
+
+class FeedbackNotifier:
+    """HITLフィードバック到着通知レジストリ
+
+    パイプラインは (session_id, phase) ごとに Future を登録して待機し、
+    `HITLService.submit_feedback` がコミット時にそれを解決する。
+    複数インスタンス構成では Postgres LISTEN/NOTIFY で他インスタンスの待機者も起こす。
+    """
+
+    def __init__(self) -> None:
+        self._waiters: Dict[FeedbackKey, Set[asyncio.Future[None]]] = defaultdict(set)
+
+    @staticmethod
+    def _key(session_id: UUID | str, phase: int) -> FeedbackKey:
+        return (str(session_id), int(phase))
+
+    def register(self, session_id: UUID | str, phase: int) -> asyncio.Future[None]:
+        """待機用 Future を登録する（DB確認より前に呼び出すこと）"""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[self._key(session_id, phase)].add(future)
+        return future
+
+    def unregister(self, session_id: UUID | str, phase: int, future: asyncio.Future[None]) -> None:
+        key = self._key(session_id, phase)
+        waiters = self._waiters.get(key)
+        if not waiters:
+            return
+        waiters.discard(future)
+        if not waiters:
+            self._waiters.pop(key, None)
+
+    def notify_local(self, session_id: UUID | str, phase: int) -> int:
+        """このプロセス内の待機者を起こし、起こした数を返す"""
+        waiters = self._waiters.pop(self._key(session_id, phase), set())
+        woken = 0
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+                woken += 1
+        return woken
+
+    def waiter_count(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def publish(self, db: AsyncSession, session_id: UUID | str, phase: int) -> None:
+        """他インスタンス向けに NOTIFY を発行する
+
+        pg_notify はトランザクション内で発行され、コミット時にのみ配信される。
+        失敗しても呼び出し元のトランザクションを中断させないよう SAVEPOINT 内で実行する。
+        Postgres 以外のバックエンドでは何もしない。
+        """
+        try:
+            bind = db.get_bind()
+            if bind.dialect.name != "postgresql":
+                return
+            async with db.begin_nested():
+                await db.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": FEEDBACK_CHANNEL, "payload": f"{session_id}:{int(phase)}"},
+                )
+        except Exception as e:
+            logger.warning(f"Failed to publish feedback notification: {e}")
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            session_id, phase = payload.rsplit(":", 1)
+            self.notify_local(session_id, int(phase))
+        except ValueError:
+            logger.warning(f"Malformed feedback notification payload: {payload}")
+
+
+feedback_notifier = FeedbackNotifier()
+
+
+async def start_feedback_listener(reconnect_delay_seconds: int = 5):
+    """LISTEN用の専用接続を保持し、他インスタンスからのフィードバック通知を受信する"""
+    from app.core.db import get_engine
+
+    logger.info(f"📡 Starting HITL feedback listener on channel '{FEEDBACK_CHANNEL}'")
+
+    while True:
+        try:
+            engine = get_engine()
+            if engine.dialect.name != "postgresql":
+                logger.info("Feedback listener disabled: database is not PostgreSQL")
+                return
+
+            async with engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                await driver_connection.add_listener(FEEDBACK_CHANNEL, feedback_notifier._on_notification)
+                try:
+                    # 接続が切れるまで待機（pre-pingの代わりに定期的に生存確認）
+                    while not driver_connection.is_closed():
+                        await asyncio.sleep(30)
+                finally:
+                    if not driver_connection.is_closed():
+                        await driver_connection.remove_listener(FEEDBACK_CHANNEL, feedback_notifier._on_notification)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Feedback listener failed: {e}")
+
+        await asyncio.sleep(reconnect_delay_seconds)
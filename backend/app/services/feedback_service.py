@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.manga import FeedbackRequest
+from app.db.loading import light_session_options
 from app.db.models import MangaSession, UserAccount, UserFeedback
 
 
@@ -20,7 +21,9 @@ class FeedbackService:
         user: UserAccount | None = None,
     ) -> dict[str, str]:
         session_result = await self.db.execute(
-            select(MangaSession).where(MangaSession.request_id == request_id)
+            select(MangaSession)
+            .options(*light_session_options())
+            .where(MangaSession.request_id == request_id)
         )
         session_obj = session_result.scalar_one_or_none()
         if session_obj is None:
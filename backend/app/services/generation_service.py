@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence, Set
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
@@ -12,9 +13,12 @@ from app.api.schemas.manga import (
     GenerateRequest,
     GenerateResponse,
     SessionDetailResponse,
+    SessionStatusBatchRequest,
+    SessionStatusBatchResponse,
     SessionStatusResponse,
 )
 from app.core import settings as core_settings
+from app.db.loading import session_detail_options
 from app.db.models import (
     MangaProject,
     MangaProjectStatus,
@@ -22,6 +26,13 @@ from app.db.models import (
     MangaSessionStatus,
     UserAccount,
 )
+from app.services.phase_preview_service import preview_images
+from app.services.preview_versioning import resolve_versions
+from app.services.session_resolver import SessionResolver
+from app.services.session_snapshot import session_snapshot_store
+
+# ロングポーリング中に DB を読み直す間隔（他インスタンスでの更新はプロセス内通知が届かない）
+LONG_POLL_REFRESH_SECONDS = 2.0
 
 
 class GenerationService:
@@ -96,28 +107,143 @@ class GenerationService:
         self,
         request_id: UUID,
         user: Optional[UserAccount] = None,
+        *,
+        wait_seconds: float = 0,
+        since_version: Optional[int] = None,
     ) -> SessionStatusResponse:
-        session = await self._get_session_by_request(request_id, user)
-        if not session:
+        # スナップショットから返す（キャッシュミス時も必要な列のみ1クエリ）
+        snapshot = await session_snapshot_store.load(self.db, request_id)
+        if not snapshot:
             raise HTTPException(status_code=404, detail="Session not found")
+        if user and snapshot.user_id and snapshot.user_id != str(user.id):
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if wait_seconds > 0:
+            snapshot = await self._wait_for_status_change(snapshot, wait_seconds, since_version)
+
         return SessionStatusResponse(
-            session_id=str(session.id),
-            request_id=str(session.request_id),
-            status=session.status,
-            current_phase=session.current_phase,
-            updated_at=session.updated_at or datetime.utcnow(),
-            project_id=str(session.project_id) if session.project_id else None,
+            session_id=snapshot.session_id,
+            request_id=snapshot.request_id,
+            status=snapshot.status,
+            current_phase=snapshot.current_phase,
+            updated_at=snapshot.updated_at or datetime.utcnow(),
+            project_id=snapshot.project_id,
+            version=snapshot.status_version,
+        )
+
+    async def get_status_batch(
+        self,
+        payload: SessionStatusBatchRequest,
+        user: UserAccount,
+    ) -> SessionStatusBatchResponse:
+        """複数セッションのステータスをまとめて返す（since_version 以降の変更のみ、ロングポーリング対応）"""
+        request_ids = list(dict.fromkeys(payload.request_ids))
+        snapshots = await session_snapshot_store.load_many(self.db, request_ids, user.id)
+        since_version = payload.since_version
+
+        def changed(snapshot) -> bool:
+            return since_version is None or snapshot.status_version > since_version
+
+        if since_version is not None and payload.wait > 0 and snapshots and not any(map(changed, snapshots.values())):
+            # 待機中は DB 接続を保持しない
+            await self.db.commit()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + payload.wait
+            session_ids = [snapshot.session_id for snapshot in snapshots.values()]
+            owned = [request_id for request_id in request_ids if str(request_id) in snapshots]
+            generation = session_snapshot_store.current_generation()
+            while not any(map(changed, snapshots.values())):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                woke = await session_snapshot_store.wait_for_change(
+                    session_ids, generation, min(remaining, LONG_POLL_REFRESH_SECONDS)
+                )
+                generation = session_snapshot_store.current_generation()
+                if woke:
+                    snapshots = await session_snapshot_store.load_many(self.db, owned, user.id)
+                else:
+                    # 他インスタンスでの更新はこのプロセスに通知されないため DB を読み直す
+                    snapshots = await session_snapshot_store.refresh_many(self.db, owned, user.id)
+                await self.db.commit()
+
+        items = [
+            (snapshot.request_id, snapshot.status, snapshot.current_phase, snapshot.status_version)
+            for snapshot in snapshots.values()
+            if changed(snapshot)
+        ]
+        missing = [str(request_id) for request_id in request_ids if str(request_id) not in snapshots]
+        return SessionStatusBatchResponse(
+            items=items,
+            missing=missing,
+            version=max([since_version or 0, *(snapshot.status_version for snapshot in snapshots.values())]),
         )
 
+    async def _wait_for_status_change(
+        self,
+        snapshot,
+        wait_seconds: float,
+        since_version: Optional[int],
+    ):
+        """ステータスまたはフェーズが変わるまで（最大 wait_seconds）待機する"""
+        if since_version is not None and snapshot.status_version > since_version:
+            return snapshot
+        if snapshot.status in (MangaSessionStatus.COMPLETED.value, MangaSessionStatus.FAILED.value):
+            return snapshot
+
+        # 待機中は DB 接続を保持しない
+        await self.db.commit()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_seconds
+        generation = session_snapshot_store.current_generation()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return snapshot
+            woke = await session_snapshot_store.wait_for_change(
+                [snapshot.session_id], generation, min(remaining, LONG_POLL_REFRESH_SECONDS)
+            )
+            generation = session_snapshot_store.current_generation()
+
+            fresh = session_snapshot_store.get_by_request(snapshot.request_id) if woke else None
+            if fresh is None:
+                # 他インスタンスでの更新はこのプロセスに通知されないため DB を読み直す
+                fresh = await session_snapshot_store.refresh(self.db, UUID(snapshot.request_id))
+                await self.db.commit()
+                if fresh is None:
+                    return snapshot
+            if (fresh.status, fresh.current_phase) != (snapshot.status, snapshot.current_phase):
+                return fresh
+            # プレビュー等の更新のみ: 引き続き待機
+
     async def get_session(
         self,
         request_id: UUID,
         user: Optional[UserAccount] = None,
+        fields: Optional[Set[str]] = None,
     ) -> SessionDetailResponse:
-        session = await self._get_session_by_request(request_id, user)
+        """Session detail; ``fields`` selects the heavy parts (phase_results, preview_versions, generated_images).
+
+        None keeps the full response. Parts that are not selected are neither
+        loaded nor serialized, and the session's own text/metadata columns are
+        never loaded here.
+        """
+        include_phase_results = fields is None or "phase_results" in fields
+        include_preview_versions = fields is None or "preview_versions" in fields
+        include_generated_images = fields is None or "generated_images" in fields
+        session = await self._get_session_by_request(
+            request_id,
+            user,
+            options=session_detail_options(
+                phase_results=include_phase_results,
+                preview_versions=include_preview_versions,
+            ),
+        )
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
-        return SessionDetailResponse(
+        # phase_results / preview_versions は保存済みの dict なので再検証しない
+        return SessionDetailResponse.model_construct(
             session_id=str(session.id),
             request_id=str(session.request_id),
             status=session.status,
@@ -125,8 +251,17 @@ class GenerationService:
             started_at=session.started_at,
             completed_at=session.completed_at,
             retry_count=session.retry_count,
-            phase_results=[pr.content or {} for pr in session.phase_results],
-            preview_versions=[pv.version_data or {} for pv in session.preview_versions],
+            phase_results=(
+                [pr.content or {} for pr in session.phase_results] if include_phase_results else None
+            ),
+            preview_versions=(
+                [data or {} for data in await resolve_versions(self.db, session.preview_versions)]
+                if include_preview_versions
+                else None
+            ),
+            generated_images=(
+                await preview_images(self.db, session.id) if include_generated_images else None
+            ),
             project_id=str(session.project_id) if session.project_id else None,
         )
 
@@ -134,11 +269,19 @@ class GenerationService:
         self,
         request_id: UUID,
         user: Optional[UserAccount] = None,
+        options: Sequence = (),
     ) -> Optional[MangaSession]:
-        result = await self.db.execute(
-            select(MangaSession).where(MangaSession.request_id == request_id)
-        )
-        session = result.scalar_one_or_none()
+        resolver = SessionResolver.for_db(self.db)
+        if not options:
+            session = await resolver.get(request_id, light=False)
+        else:
+            # 子テーブルの eager load 付きは個別に取得し、同一リクエスト内の後続参照で再利用する
+            result = await self.db.execute(
+                select(MangaSession).options(*options).where(MangaSession.request_id == request_id)
+            )
+            session = result.scalar_one_or_none()
+            if session is not None:
+                resolver.remember(session, light=True)
         if session and user and session.user_id and session.user_id != user.id:
             raise HTTPException(status_code=404, detail="Session not found")
         return session
@@ -146,15 +289,12 @@ class GenerationService:
     async def _start_processing_task(self, request_id: UUID) -> None:
         """Start manga processing in a background task"""
         import asyncio
-        from app.core.db import get_session_factory
-        from app.services.pipeline_service import PipelineOrchestrator
+        from app.services.pipeline_service import get_pipeline_orchestrator
         
         async def process_in_background():
             """Background task to process manga generation"""
             try:
-                session_factory = get_session_factory()
-                orchestrator = PipelineOrchestrator(session_factory)
-                await orchestrator.run(request_id)
+                await get_pipeline_orchestrator().run(request_id)
                 import logging
                 logger = logging.getLogger(__name__)
                 logger.info(f"✅ Manga processing completed for request_id: {request_id}")
@@ -5,16 +5,17 @@ Phase 4: Real-time monitoring, alerting, and performance tracking
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.manga_session import MangaSession, MangaSessionStatus
+from app.db.models.manga_session import MangaSessionStatus
 from app.core.db import session_scope
+from app.services import rollups
 from app.services.circuit_breaker import circuit_breaker_manager
 from app.services.state_reconciler import StateReconciler
 
@@ -60,18 +61,55 @@ class HealthMonitor:
 
     def __init__(self):
         self.metric_history: Dict[str, List[HealthMetric]] = {}
+        self._latest_report: Optional[SystemHealthReport] = None
+        self._refresh_lock = asyncio.Lock()
         self.alert_thresholds = {
             "active_sessions_ratio": {"warning": 0.8, "critical": 0.95},
             "failed_sessions_ratio": {"warning": 0.1, "critical": 0.25},
             "average_processing_time": {"warning": 300, "critical": 600},  # seconds
             "stale_sessions_count": {"warning": 5, "critical": 15},
-            "circuit_breakers_open": {"warning": 1, "critical": 3}
+            "circuit_breakers_open": {"warning": 1, "critical": 3},
+            "state_reconciliation_age_minutes": {"warning": 2, "critical": 4},  # multiples of the interval
         }
 
-    async def get_system_health(self) -> SystemHealthReport:
+    @property
+    def latest_report(self) -> Optional[SystemHealthReport]:
+        return self._latest_report
+
+    async def get_system_health(self, max_age_seconds: Optional[float] = None) -> SystemHealthReport:
+        """
+        Return the cached health report, rebuilding it only when missing or older than max_age_seconds
+
+        Probes call this; the report itself is refreshed by start_health_monitoring.
+        Concurrent callers share a single rebuild.
+        """
+        if max_age_seconds is None:
+            from app.core.settings import get_settings
+
+            max_age_seconds = get_settings().health_report_max_age_seconds
+
+        report = self._latest_report
+        if report is not None and (datetime.utcnow() - report.timestamp).total_seconds() <= max_age_seconds:
+            return report
+
+        async with self._refresh_lock:
+            report = self._latest_report
+            if report is not None and (datetime.utcnow() - report.timestamp).total_seconds() <= max_age_seconds:
+                return report
+            return await self._build_report()
+
+    async def refresh(self) -> SystemHealthReport:
+        """Rebuild the cached report now (background refresh loop)"""
+        async with self._refresh_lock:
+            return await self._build_report()
+
+    async def _build_report(self) -> SystemHealthReport:
         """
         Generate comprehensive system health report
 
+        Read-only: metrics come from rollup counters and the last scheduled
+        reconciliation run; nothing here modifies session state.
+
         Returns:
             Complete health assessment with metrics and recommendations
         """
@@ -101,6 +139,9 @@ class HealthMonitor:
             consistency_metrics = await self._check_state_consistency()
             metrics.extend(consistency_metrics)
 
+            # Background-job leadership (no DB access; state kept by the election loop)
+            metrics.extend(self._check_leadership())
+
             # Calculate overall health score and status
             overall_status, score = self._calculate_overall_health(metrics)
 
@@ -129,6 +170,7 @@ class HealthMonitor:
             recommendations=recommendations
         )
 
+        self._latest_report = report
         logger.info(f"✅ Health report generated: {overall_status.value} (score: {score:.1f})")
         return report
 
@@ -167,14 +209,8 @@ class HealthMonitor:
 
         try:
             async with session_scope() as db_session:
-                # Count sessions by status
-                result = await db_session.execute(
-                    select(
-                        MangaSession.status,
-                        func.count(MangaSession.id).label('count')
-                    ).group_by(MangaSession.status)
-                )
-                status_counts = dict(result.fetchall())
+                # Count sessions by status (trigger-maintained counters)
+                status_counts = await rollups.get_session_status_counts(db_session)
 
                 total_sessions = sum(status_counts.values())
                 if total_sessions > 0:
@@ -200,8 +236,9 @@ class HealthMonitor:
                         message=f"Active sessions: {running_ratio:.1%} of total"
                     ))
 
-                # Check for stale sessions
-                reconciliation_stats = await StateReconciler.reconcile_all_sessions()
+            # Stale sessions found by the last scheduled reconciliation run
+            reconciliation_stats = StateReconciler.last_run_stats
+            if reconciliation_stats is not None:
                 stale_count = (
                     reconciliation_stats.get("stale_running_fixed", 0) +
                     reconciliation_stats.get("stale_queued_fixed", 0) +
@@ -213,7 +250,7 @@ class HealthMonitor:
                     name="stale_sessions_count",
                     value=stale_count,
                     status=stale_status,
-                    message=f"Stale sessions detected and fixed: {stale_count}"
+                    message=f"Stale sessions fixed by last reconciliation: {stale_count}"
                 ))
 
         except Exception as e:
@@ -265,21 +302,11 @@ class HealthMonitor:
 
         try:
             async with session_scope() as db_session:
-                # Check average processing time for recent completed sessions
-                cutoff_time = datetime.utcnow() - timedelta(hours=24)
-                result = await db_session.execute(
-                    select(
-                        func.avg(
-                            func.extract('epoch', MangaSession.updated_at - MangaSession.created_at)
-                        ).label('avg_processing_time')
-                    ).where(
-                        and_(
-                            MangaSession.status == MangaSessionStatus.COMPLETED.value,
-                            MangaSession.updated_at > cutoff_time
-                        )
-                    )
+                # Average processing time for sessions completed in the last 24h (hourly rollups)
+                stats = await rollups.get_duration_stats(
+                    db_session, MangaSessionStatus.COMPLETED.value, hours=24
                 )
-                avg_time = result.scalar() or 0
+                avg_time = stats.average_seconds
 
                 status = self._evaluate_threshold("average_processing_time", avg_time)
                 metrics.append(HealthMetric(
@@ -304,8 +331,23 @@ class HealthMonitor:
         metrics = []
 
         try:
-            # Run state reconciliation and check results
-            reconciliation_stats = await StateReconciler.reconcile_all_sessions()
+            from app.services.leader_election import background_leader
+
+            # 照合ジョブはリーダーでのみ実行され、結果はそのプロセスのメモリにしかない。
+            # フォロワーは UNKNOWN を報告せず、この指標を省く
+            if not background_leader.is_leader:
+                return metrics
+
+            # Results of the last scheduled reconciliation; health checks never run it themselves
+            reconciliation_stats = StateReconciler.last_run_stats
+            if reconciliation_stats is None:
+                metrics.append(HealthMetric(
+                    name="state_consistency_issues",
+                    value=0,
+                    status=HealthStatus.UNKNOWN,
+                    message="State reconciliation has not run yet"
+                ))
+                return metrics
 
             # Total inconsistencies found
             total_issues = (
@@ -323,6 +365,16 @@ class HealthMonitor:
                 message=f"State consistency issues found and resolved: {total_issues}"
             ))
 
+            # The reconciliation job itself must keep running
+            age_minutes = (datetime.utcnow() - StateReconciler.last_run_at).total_seconds() / 60
+            interval = StateReconciler.run_interval_minutes
+            metrics.append(HealthMetric(
+                name="state_reconciliation_age_minutes",
+                value=age_minutes,
+                status=self._evaluate_threshold("state_reconciliation_age_minutes", age_minutes / interval),
+                message=f"Last state reconciliation: {age_minutes:.1f} minutes ago"
+            ))
+
         except Exception as e:
             metrics.append(HealthMetric(
                 name="state_consistency_check",
@@ -333,6 +385,26 @@ class HealthMonitor:
 
         return metrics
 
+    def _check_leadership(self) -> List[HealthMetric]:
+        """Report which instance runs the singleton background jobs"""
+        from app.services.leader_election import background_leader
+
+        info = background_leader.describe()
+        if info["leader"] is None:
+            return [HealthMetric(
+                name="background_leader",
+                value=0,
+                status=HealthStatus.WARNING,
+                message=f"No leader known for '{info['name']}' background jobs"
+            )]
+        suffix = " (this instance)" if info["is_leader"] else ""
+        return [HealthMetric(
+            name="background_leader",
+            value=1 if info["is_leader"] else 0,
+            status=HealthStatus.HEALTHY,
+            message=f"Background jobs leader: {info['leader']}{suffix}"
+        )]
+
     def _evaluate_threshold(self, metric_name: str, value: float) -> HealthStatus:
         """Evaluate a metric value against defined thresholds"""
         thresholds = self.alert_thresholds.get(metric_name, {})
@@ -420,14 +492,17 @@ class HealthMonitor:
 health_monitor = HealthMonitor()
 
 
-async def start_health_monitoring(interval_minutes: int = 5):
-    """Start background health monitoring"""
-    logger.info(f"🏥 Starting health monitoring (every {interval_minutes} minutes)")
+async def start_health_monitoring(interval_seconds: Optional[float] = None):
+    """Refresh the cached health report in the background"""
+    if interval_seconds is None:
+        from app.core.settings import get_settings
+
+        interval_seconds = get_settings().health_report_refresh_seconds
+    logger.info(f"🏥 Starting health monitoring (every {interval_seconds:.0f} seconds)")
 
     while True:
         try:
-            await asyncio.sleep(interval_minutes * 60)
-            report = await health_monitor.get_system_health()
+            report = await health_monitor.refresh()
 
             # Log critical issues immediately
             if report.overall_status == HealthStatus.CRITICAL:
@@ -437,4 +512,6 @@ async def start_health_monitoring(interval_minutes: int = 5):
 
         except Exception as e:
             logger.error(f"Health monitoring iteration failed: {e}")
-            # Continue monitoring even if one iteration fails
\ No newline at end of file
+            # Continue monitoring even if one iteration fails
+
+        await asyncio.sleep(interval_seconds)
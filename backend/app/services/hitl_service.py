@@ -15,6 +15,8 @@ from app.db.models import (
     PhaseFeedbackState,
     UserFeedbackHistory,
 )
+from app.services.feedback_notifier import feedback_notifier
+from app.services.session_resolver import SessionResolver
 
 # HITL Error Classes
 class HITLError(Exception):
@@ -88,10 +90,8 @@ class HITLService:
         from asyncpg.exceptions import UndefinedColumnError
 
         try:
-            # Try to query by request_id if the column exists
-            session_query = select(MangaSession).where(MangaSession.request_id == session_id)
-            session_result = await self.db.execute(session_query)
-            return session_result.scalar_one_or_none()
+            # Try to query by request_id if the column exists (resolved once per request)
+            return await SessionResolver.for_db(self.db).get(session_id, light=False)
         except (ProgrammingError, InvalidRequestError, UndefinedColumnError):
             # If request_id column doesn't exist, query by id instead
             logger.warning(f"request_id column not available, using id instead")
@@ -177,8 +177,14 @@ class HITLService:
                 .values(total_feedback_count=MangaSession.total_feedback_count + 1)
             )
 
+            # 他インスタンスの待機者向け NOTIFY（コミット時に配信）
+            await feedback_notifier.publish(self.db, session.id, phase)
+
             await self.db.commit()
 
+            # 同一プロセス内で待機中のパイプラインを即座に再開
+            feedback_notifier.notify_local(session.id, phase)
+
             logger.info(
                 f"Feedback submitted successfully: session={session_id}, phase={phase}, type={feedback_type}"
             )
@@ -393,10 +399,15 @@ class HITLSessionContext:
 class HITLStateManager:
     """Enhanced state manager for HITL workflows"""
 
-    def __init__(self, hitl_service: HITLService):
+    def __init__(
+        self,
+        hitl_service: HITLService,
+        active_sessions: Optional[Dict[UUID, HITLSessionContext]] = None,
+    ):
         self.hitl_service = hitl_service
         self.db = hitl_service.db
-        self.active_sessions: Dict[UUID, HITLSessionContext] = {}
+        # 複数のマネージャー（リクエスト毎）で共有できるよう外から渡せる
+        self.active_sessions: Dict[UUID, HITLSessionContext] = active_sessions if active_sessions is not None else {}
 
     async def start_hitl_session(self, session_id: UUID, phase: int, preview_data: Optional[Dict[str, Any]] = None) -> HITLSessionContext:
         """Start a new HITL session for a phase with error handling"""
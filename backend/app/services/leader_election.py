@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+# pg_stat_activity.application_name of the connection holding the lock: "<prefix><name>:<instance_id>"
+LEADER_APPLICATION_PREFIX = "spell-leader:"
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg_advisory_lock derived from ``name``"""
+    digest = hashlib.sha1(name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def default_instance_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+
+
+class LeaderElection:
+    """Postgres advisory-lock leader election for singleton background jobs
+
+    - The leader holds a session-level ``pg_try_advisory_lock`` on a dedicated
+      connection; Postgres releases it when that connection dies, so another
+      instance takes over on its next attempt.
+    - Leadership is a lease renewed every ``renew_interval_seconds`` by pinging
+      the connection; if renewal fails or the lease lapses, the instance steps down.
+    - Followers retry every interval and record who currently holds the lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        renew_interval_seconds: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        instance_id: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.lock_key = advisory_lock_key(name)
+        self.instance_id = instance_id or default_instance_id()
+        self._renew_interval_seconds = renew_interval_seconds
+        self._lease_seconds = lease_seconds
+        self._connection: Any = None
+        # ロック用接続はアプリのプールを通さない（返却されたプール接続にロックが残るのを防ぐ）
+        self._lock_engine: Any = None
+        self._leader = False
+        self._lease_expires_at = 0.0
+        self._leader_event = asyncio.Event()
+        self._follower_event = asyncio.Event()
+        self._follower_event.set()
+        self.leader_id: Optional[str] = None
+        self.last_checked_at: Optional[float] = None
+
+    def _setting(self, attribute: str, name: str) -> float:
+        value = getattr(self, attribute)
+        if value is None:
+            from app.core.settings import get_settings
+
+            value = float(getattr(get_settings(), name))
+            setattr(self, attribute, value)
+        return value
+
+    @property
+    def renew_interval_seconds(self) -> float:
+        return self._setting("_renew_interval_seconds", "leader_renew_interval_seconds")
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._setting("_lease_seconds", "leader_lease_seconds")
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader and time.monotonic() < self._lease_expires_at
+
+    @property
+    def application_name(self) -> str:
+        return f"{LEADER_APPLICATION_PREFIX}{self.name}:{self.instance_id}"[:63]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
+            "leader": self.leader_id,
+        }
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader:
+            self._lease_expires_at = time.monotonic() + self.lease_seconds
+            self.leader_id = self.instance_id
+        if leader == self._leader:
+            return
+        self._leader = leader
+        if leader:
+            logger.info(f"👑 Acquired leadership for '{self.name}' ({self.instance_id})")
+            self._follower_event.clear()
+            self._leader_event.set()
+        else:
+            logger.warning(f"Lost leadership for '{self.name}' ({self.instance_id})")
+            self._leader_event.clear()
+            self._follower_event.set()
+
+    # ------------------------------------------------------------ election loop
+
+    async def run(self) -> None:
+        """Campaign for / renew leadership until cancelled"""
+        logger.info(f"🗳️ Starting leader election '{self.name}' as {self.instance_id}")
+        try:
+            while True:
+                try:
+                    if self._connection is None:
+                        await self._try_acquire()
+                    elif time.monotonic() >= self._lease_expires_at:
+                        # ループが止まっていた等で更新が間に合わなかった場合は一旦降りる
+                        await self._step_down()
+                    else:
+                        await self._renew()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Leader election '{self.name}' iteration failed: {e}")
+                    await self._step_down()
+                self.last_checked_at = time.monotonic()
+                await asyncio.sleep(self.renew_interval_seconds)
+        finally:
+            await self.release()
+
+    def _get_lock_engine(self) -> Any:
+        """Non-pooled engine: closing a lock connection always ends its Postgres session"""
+        if self._lock_engine is None:
+            from app.core.db import get_engine
+
+            self._lock_engine = create_async_engine(get_engine().url, poolclass=NullPool)
+        return self._lock_engine
+
+    async def _try_acquire(self) -> None:
+        from app.core.db import get_engine
+
+        engine = get_engine()
+        if engine.dialect.name != "postgresql":
+            # 単一インスタンス（開発環境）では常にリーダー
+            self._connection = False
+            self._set_leader(True)
+            return
+
+        connection = await self._get_lock_engine().connect()
+        try:
+            await connection.execute(
+                text("SELECT set_config('application_name', :name, false)"),
+                {"name": self.application_name},
+            )
+            acquired = (
+                await connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key})
+            ).scalar()
+            if not acquired:
+                self.leader_id = await self._lookup_leader(connection)
+            # セッションレベルのロックはトランザクション終了後も保持される
+            await connection.commit()
+        except BaseException:
+            await self._discard(connection)
+            raise
+
+        if acquired:
+            self._connection = connection
+            self._set_leader(True)
+        else:
+            await self._discard(connection)
+            self._set_leader(False)
+
+    async def _renew(self) -> None:
+        if self._connection is not False:
+            await self._connection.execute(text("SELECT 1"))
+            await self._connection.commit()
+        self._set_leader(True)
+
+    async def _lookup_leader(self, connection: Any) -> Optional[str]:
+        unsigned = self.lock_key & 0xFFFFFFFFFFFFFFFF
+        row = (
+            await connection.execute(
+                text(
+                    "SELECT a.application_name FROM pg_locks l "
+                    "JOIN pg_stat_activity a ON a.pid = l.pid "
+                    "WHERE l.locktype = 'advisory' AND l.granted "
+                    "AND l.classid::bigint = :high AND l.objid::bigint = :low AND l.objsubid = 1"
+                ),
+                {"high": unsigned >> 32, "low": unsigned & 0xFFFFFFFF},
+            )
+        ).first()
+        if row is None or not row[0]:
+            return None
+        prefix = f"{LEADER_APPLICATION_PREFIX}{self.name}:"
+        return row[0][len(prefix):] if row[0].startswith(prefix) else row[0]
+
+    async def _step_down(self) -> None:
+        connection, self._connection = self._connection, None
+        self._set_leader(False)
+        if self.leader_id == self.instance_id:
+            self.leader_id = None
+        if connection:
+            await self._discard(connection)
+
+    @staticmethod
+    async def _discard(connection: Any) -> None:
+        """Drop the DBAPI connection so the backend (and any advisory lock it holds) ends"""
+        try:
+            await connection.invalidate()
+        except Exception as e:
+            logger.debug(f"Invalidating leader connection failed: {e}")
+        try:
+            await connection.close()
+        except Exception as e:
+            logger.debug(f"Closing leader connection failed: {e}")
+
+    async def release(self) -> None:
+        """Unlock explicitly (shutdown) so a follower can take over without waiting for disconnect"""
+        connection = self._connection
+        if connection:
+            try:
+                await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+                await connection.commit()
+            except Exception as e:
+                logger.debug(f"Advisory unlock failed: {e}")
+        await self._step_down()
+        engine, self._lock_engine = self._lock_engine, None
+        if engine is not None:
+            await engine.dispose()
+
+    # ------------------------------------------------------------ singleton jobs
+
+    async def run_while_leader(self, job_factory: Callable[[], Awaitable[Any]], *, job_name: str) -> None:
+        """Run ``job_factory()`` only while this instance leads; cancel it when leadership is lost"""
+        while True:
+            await self._leader_event.wait()
+            logger.info(f"▶️ Starting singleton job '{job_name}' on leader {self.instance_id}")
+            task = asyncio.ensure_future(job_factory())
+            try:
+                await self._follower_event.wait()
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            logger.info(f"⏹️ Stopped singleton job '{job_name}' (no longer leader)")
+
+
+background_leader = LeaderElection("background-jobs")
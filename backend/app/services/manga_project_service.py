@@ -4,13 +4,17 @@ import math
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, select
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.db.loading import light_project_options
 from app.db.models.manga_project import MangaProject
 from app.db.models.user_account import UserAccount
 from app.api.schemas.manga import MangaProjectItem, MangaProjectDetailResponse, Pagination
+from app.services.pagination import InvalidCursorError, apply_keyset, count_cache, split_page
+from app.services.project_service import ProjectService
 
 
 class MangaProjectService:
@@ -25,41 +29,57 @@ class MangaProjectService:
         sort: str = "created_at",
         order: str = "desc",
         status_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> tuple[List[MangaProjectItem], Pagination]:
-        """Get paginated list of user's manga projects"""
+        """Get paginated list of user's manga projects (keyset on (sort, id) when cursor is given)"""
 
         # Validate parameters
         page = max(1, page)
         limit = min(max(1, limit), 100)
 
         # Build base query
-        query = select(MangaProject).where(MangaProject.user_id == user.id)
+        query = (
+            select(MangaProject)
+            .options(*light_project_options())
+            .where(MangaProject.user_id == user.id)
+        )
 
         # Apply status filter
         if status_filter and status_filter != "all":
             query = query.where(MangaProject.status == status_filter)
 
-        # Apply sorting
-        sort_column = getattr(MangaProject, sort, MangaProject.created_at)
-        if order.lower() == "asc":
-            query = query.order_by(sort_column)
-        else:
-            query = query.order_by(desc(sort_column))
-
-        # Get total count
-        count_query = select(func.count()).select_from(
-            query.subquery()
-        )
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
+        # Get total count (cached, approximate)
+        total: Optional[int] = None
+        total_is_approximate = False
+        if include_total:
+            total, total_is_approximate = await count_cache.count(
+                self.db, ("projects", user.id, status_filter or "all"), query
+            )
 
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        # Apply sorting and pagination
+        # Only non-null columns with matching (user_id, sort, id) indexes are keyset-safe
+        sort_column = {
+            "updated_at": MangaProject.updated_at,
+            "title": MangaProject.title,
+        }.get(sort, MangaProject.created_at)
+        if cursor is None and page > 1:
+            query = query.offset((page - 1) * limit)
+        try:
+            query = apply_keyset(
+                query,
+                sort_column,
+                MangaProject.id,
+                descending=order.lower() != "asc",
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_cursor")
 
         # Execute query
         result = await self.db.execute(query)
-        projects = result.scalars().all()
+        projects, next_cursor = split_page(result.scalars().all(), limit, sort_column.key)
 
         # Convert to response items
         items = [
@@ -77,14 +97,18 @@ class MangaProjectService:
         ]
 
         # Calculate pagination info
-        total_pages = math.ceil(total / limit) if total > 0 else 1
+        total_pages = None
+        if total is not None:
+            total_pages = math.ceil(total / limit) if total > 0 else 1
         pagination = Pagination(
             page=page,
             limit=limit,
             total_items=total,
             total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1,
+            has_next=next_cursor is not None,
+            has_previous=page > 1 or cursor is not None,
+            next_cursor=next_cursor,
+            total_is_approximate=total_is_approximate,
         )
 
         return items, pagination
@@ -98,7 +122,7 @@ class MangaProjectService:
 
         query = (
             select(MangaProject)
-            .options(selectinload(MangaProject.session))
+            .options(selectinload(MangaProject.assets))
             .where(
                 and_(
                     MangaProject.id == project_id,
@@ -120,9 +144,12 @@ class MangaProjectService:
                 "assets": [
                     {
                         "id": str(asset.id),
-                        "file_type": asset.file_type,
-                        "file_url": asset.file_url,
-                        "metadata": asset.metadata,
+                        "asset_type": asset.asset_type,
+                        "phase": asset.phase,
+                        "content_type": asset.content_type,
+                        "storage_path": asset.storage_path,
+                        "url": await ProjectService.asset_url(asset),
+                        "metadata": asset.asset_metadata or {},
                     }
                     for asset in project.assets
                 ]
@@ -4,12 +4,14 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.schemas.manga import MessageRequest, MessageResponse, MessagesListResponse
 from app.db.models import MangaSession, SessionMessage, UserAccount
+from app.services.pagination import InvalidCursorError, apply_keyset, count_cache, split_page
+from app.services.session_resolver import SessionResolver
+from app.services.session_snapshot import session_snapshot_store
 
 
 class MessageService:
@@ -22,29 +24,40 @@ class MessageService:
         current_user: UserAccount,
         limit: int = 50,
         offset: int = 0,
+        *,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> MessagesListResponse:
-        """Get paginated messages for a session."""
+        """Get paginated messages for a session (newest first, keyset on (created_at, id))."""
         # Get session
         session = await self._get_user_session(request_id, current_user)
 
-        # Get total count
         from sqlalchemy import select
-        total_query = select(func.count(SessionMessage.id)).where(
-            SessionMessage.session_id == session.id
-        )
-        total = await self.db.scalar(total_query)
+        base_query = select(SessionMessage).where(SessionMessage.session_id == session.id)
+
+        # Get total count (cached, approximate)
+        total = None
+        if include_total:
+            total, _ = await count_cache.count(self.db, ("session_messages", session.id), base_query)
 
         # Get messages with pagination
-        messages_query = (
-            select(SessionMessage)
-            .where(SessionMessage.session_id == session.id)
-            .order_by(desc(SessionMessage.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
+        messages_query = base_query
+        if cursor is None and offset:
+            messages_query = messages_query.offset(offset)
+        try:
+            messages_query = apply_keyset(
+                messages_query,
+                SessionMessage.created_at,
+                SessionMessage.id,
+                descending=True,
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_cursor")
 
         result = await self.db.execute(messages_query)
-        messages = result.scalars().all()
+        messages, next_cursor = split_page(result.scalars().all(), limit, "created_at")
 
         # Convert to response format
         message_responses = [
@@ -61,12 +74,11 @@ class MessageService:
             for msg in messages
         ]
 
-        has_more = (offset + limit) < total
-
         return MessagesListResponse(
             messages=message_responses,
             total=total,
-            has_more=has_more,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor,
         )
 
     async def create_message(
@@ -91,6 +103,8 @@ class MessageService:
         self.db.add(message)
         await self.db.flush()
         await self.db.commit()
+        session_snapshot_store.invalidate_messages(session.id)
+        count_cache.invalidate(("session_messages", session.id))
 
         # Create event for real-time updates
         await self._create_session_event(
@@ -116,25 +130,8 @@ class MessageService:
         )
 
     async def _get_user_session(self, request_id: UUID, current_user: UserAccount) -> MangaSession:
-        """Get session and verify ownership."""
-        from sqlalchemy import select
-
-        query = (
-            select(MangaSession)
-            .where(MangaSession.request_id == request_id)
-            .where(MangaSession.user_id == current_user.id)
-        )
-
-        result = await self.db.execute(query)
-        session = result.scalar_one_or_none()
-
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found",
-            )
-
-        return session
+        """Get session and verify ownership (resolved once per request)."""
+        return await SessionResolver.for_db(self.db).get_owned(request_id, current_user)
 
     async def _create_session_event(self, session_id: UUID, event_type: str, event_data: dict):
         """Create a session event for real-time updates."""
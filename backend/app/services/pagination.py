@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import base64
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, and_, asc, desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Encode the last row's (sort_key, id) as an opaque URL-safe cursor"""
+    if isinstance(sort_value, datetime):
+        payload = {"t": "dt", "k": sort_value.isoformat()}
+    else:
+        payload = {"t": "raw", "k": sort_value}
+    payload["id"] = str(row_id)
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        sort_value = payload["k"]
+        if payload.get("t") == "dt":
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("invalid_cursor") from exc
+
+
+def apply_keyset(
+    query: Select,
+    sort_column,
+    id_column,
+    *,
+    descending: bool,
+    cursor: Optional[str],
+    limit: int,
+) -> Select:
+    """Order by (sort_key, id) and seek past the cursor; fetches limit + 1 rows to detect more pages"""
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        if descending:
+            query = query.where(
+                or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id))
+            )
+        else:
+            query = query.where(
+                or_(sort_column > sort_value, and_(sort_column == sort_value, id_column > row_id))
+            )
+
+    direction = desc if descending else asc
+    return query.order_by(direction(sort_column), direction(id_column)).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int, sort_attr: str) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build next_cursor from the last returned row"""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_attr), last.id)
+
+
+class ApproximateCountCache:
+    """Short-TTL cache for count(*) totals shown alongside paginated lists.
+
+    Totals are refreshed at most once per TTL per key, so they may lag recent
+    inserts by up to ``ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 4096) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: int) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def count(self, db: AsyncSession, key: Hashable, query: Select) -> Tuple[int, bool]:
+        """Return (total, is_cached) for the rows matched by ``query``"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+        total = (await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))).scalar_one()
+        self.set(key, int(total))
+        return int(total), False
+
+
+count_cache = ApproximateCountCache()
@@ -1,13 +1,70 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.manga import PhasePreviewResponse, PhasePreviewUpdate
-from app.db.models import MangaSession, PhaseResult, PreviewVersion, UserAccount
+from app.db.models import GeneratedImage, MangaSession, PhaseResult, PreviewVersion, UserAccount
+from app.services.phase_result_store import upsert_phase_result
+from app.services.preview_versioning import create_preview_version, resolve_version_data, resolve_versions
+from app.services.session_resolver import SessionResolver
+from app.services.session_snapshot import session_snapshot_store
+from app.services.signed_url_cache import signed_url_cache
+
+
+async def preview_image_url(
+    db: AsyncSession,
+    storage_path: str,
+    *,
+    version_id: Optional[UUID],
+    phase: int,
+) -> str:
+    """Signed URL of a stored phase image, cached in preview_cache_metadata under the phase's preview version"""
+    from app.core.settings import get_settings
+
+    return await signed_url_cache.get_url(
+        get_settings().gcs_bucket_preview,
+        storage_path,
+        db=db,
+        version_id=version_id,
+        phase=phase,
+    )
+
+
+async def preview_images(db: AsyncSession, session_id: UUID, *, phase: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Stored images of a session (optionally one phase) with signed URLs, in phase and creation order"""
+    latest_preview = (
+        select(PreviewVersion.phase.label("phase"), PreviewVersion.id.label("version_id"))
+        .where(PreviewVersion.session_id == session_id)
+        .distinct(PreviewVersion.phase)
+        .order_by(PreviewVersion.phase, PreviewVersion.created_at.desc())
+        .subquery("latest_preview")
+    )
+    query = (
+        select(GeneratedImage.phase, GeneratedImage.storage_path, latest_preview.c.version_id)
+        .select_from(GeneratedImage)
+        .outerjoin(latest_preview, latest_preview.c.phase == GeneratedImage.phase)
+        .where(GeneratedImage.session_id == session_id)
+        .order_by(GeneratedImage.phase, GeneratedImage.created_at)
+    )
+    if phase is not None:
+        query = query.where(GeneratedImage.phase == phase)
+
+    images: List[Dict[str, Any]] = []
+    seen = set()
+    for row in (await db.execute(query)).all():
+        # 再生成で同じ画像が出ると同じ blob を指す行が増えるため一度だけ返す
+        if (row.phase, row.storage_path) in seen:
+            continue
+        seen.add((row.phase, row.storage_path))
+        url = await preview_image_url(db, row.storage_path, version_id=row.version_id, phase=row.phase)
+        images.append({"phase": row.phase, "storage_path": row.storage_path, "url": url})
+    return images
 
 
 class PhasePreviewService:
@@ -18,65 +75,130 @@ class PhasePreviewService:
         self,
         request_id: UUID,
         current_user: UserAccount,
+        fields: Optional[Set[str]] = None,
     ) -> List[PhasePreviewResponse]:
-        """Get all phase previews for a session."""
-        session = await self._get_user_session(request_id, current_user)
+        """Get all phase previews for a session.
+
+        Ownership check, phase results and the latest preview per phase are
+        resolved in one query (DISTINCT ON over preview_versions). ``fields``
+        is an optional mask; leaving out ``metadata`` skips the version_data blob
+        and only extracts the small keys server-side. Delta-encoded versions are
+        reconstructed (cached) from their checkpoint. Stored image paths are
+        aggregated per phase in the same query and signed through the signed
+        URL cache.
+        """
+        include_metadata = fields is None or "metadata" in fields
+        include_content = fields is None or "content" in fields
+
+        if include_metadata:
+            preview_columns = [PreviewVersion.version_data.label("version_data")]
+        else:
+            preview_columns = [
+                PreviewVersion.version_data["image_url"].as_string().label("image_url"),
+                PreviewVersion.version_data["document_url"].as_string().label("document_url"),
+            ]
+            if include_content:
+                preview_columns.append(PreviewVersion.version_data["content"].as_string().label("content"))
+        preview_columns += [
+            PreviewVersion.id.label("preview_version_id"),
+            PreviewVersion.version_delta.is_not(None).label("is_delta"),
+        ]
+
+        owned_session = (
+            (MangaSession.request_id == request_id)
+            & (MangaSession.user_id == current_user.id)
+        )
 
-        from sqlalchemy import select
+        # Latest preview version per phase (uses ix_preview_versions_session_phase_created)
+        latest_preview = (
+            select(PreviewVersion.phase.label("phase"), *preview_columns)
+            .join(MangaSession, MangaSession.id == PreviewVersion.session_id)
+            .where(owned_session)
+            .distinct(PreviewVersion.phase)
+            .order_by(PreviewVersion.phase, PreviewVersion.created_at.desc())
+            .subquery("latest_preview")
+        )
+
+        phase_images = (
+            select(
+                GeneratedImage.phase.label("phase"),
+                func.array_agg(aggregate_order_by(GeneratedImage.storage_path, GeneratedImage.created_at)).label(
+                    "image_paths"
+                ),
+            )
+            .join(MangaSession, MangaSession.id == GeneratedImage.session_id)
+            .where(owned_session)
+            .group_by(GeneratedImage.phase)
+            .subquery("phase_images")
+        )
 
-        # Get phase results with preview versions
         query = (
-            select(PhaseResult)
-            .where(PhaseResult.session_id == session.id)
+            select(
+                PhaseResult.id,
+                PhaseResult.session_id,
+                PhaseResult.phase,
+                PhaseResult.status,
+                PhaseResult.created_at,
+                PhaseResult.updated_at,
+                *[column for column in latest_preview.c if column.key != "phase"],
+                phase_images.c.image_paths,
+            )
+            .join(MangaSession, MangaSession.id == PhaseResult.session_id)
+            .outerjoin(latest_preview, latest_preview.c.phase == PhaseResult.phase)
+            .outerjoin(phase_images, phase_images.c.phase == PhaseResult.phase)
+            .where(owned_session)
             .order_by(PhaseResult.phase)
         )
 
-        result = await self.db.execute(query)
-        phase_results = result.scalars().all()
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            # Distinguish "no phases yet" from "not found / not owned"
+            await self._get_user_session(request_id, current_user)
+            return []
 
         previews = []
-        for phase_result in phase_results:
-            # Get latest preview version for this phase
-            preview_query = (
-                select(PreviewVersion)
-                .where(PreviewVersion.session_id == session.id)
-                .where(PreviewVersion.phase == phase_result.phase)
-                .order_by(PreviewVersion.created_at.desc())
-                .limit(1)
-            )
-
-            preview_result = await self.db.execute(preview_query)
-            preview_version = preview_result.scalar_one_or_none()
-
-            # Extract preview data
-            preview_data = preview_version.version_data if preview_version else {}
-            content = preview_data.get("content")
-            image_url = preview_data.get("image_url")
-            document_url = preview_data.get("document_url")
-
-            # Calculate progress based on status
-            progress = 0
-            if phase_result.status == "completed":
-                progress = 100
-            elif phase_result.status == "running":
-                progress = 50
-            elif phase_result.status == "awaiting_feedback":
-                progress = 90
-
+        for row in rows:
+            if row.is_delta:
+                preview_data = await resolve_version_data(self.db, row.preview_version_id) or {}
+                content = preview_data.get("content") if include_content else None
+                image_url = preview_data.get("image_url")
+                document_url = preview_data.get("document_url")
+                metadata = preview_data if include_metadata else None
+            elif include_metadata:
+                preview_data = row.version_data or {}
+                content = preview_data.get("content")
+                image_url = preview_data.get("image_url")
+                document_url = preview_data.get("document_url")
+                metadata = preview_data
+            else:
+                content = row.content if include_content else None
+                image_url = row.image_url
+                document_url = row.document_url
+                metadata = None
+
+            image_urls = [
+                await preview_image_url(self.db, path, version_id=row.preview_version_id, phase=row.phase)
+                for path in dict.fromkeys(row.image_paths or ())
+            ]
+
+            # DB 由来の値なので検証せずに組み立てる（metadata は大きな dict になり得る）
             previews.append(
-                PhasePreviewResponse(
-                    id=str(phase_result.id),
-                    session_id=str(session.id),
-                    phase_number=phase_result.phase,
-                    preview_type=self._determine_preview_type(preview_data),
+                PhasePreviewResponse.model_construct(
+                    id=str(row.id),
+                    session_id=str(row.session_id),
+                    phase_number=row.phase,
+                    preview_type=self._determine_preview_type(
+                        {"image_url": image_url, "document_url": document_url}
+                    ),
                     content=content,
                     image_url=image_url,
                     document_url=document_url,
-                    progress=progress,
-                    status=phase_result.status,
-                    metadata=preview_data,
-                    created_at=phase_result.created_at,
-                    updated_at=phase_result.updated_at,
+                    progress=self._status_progress(row.status),
+                    status=row.status,
+                    metadata=metadata,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                    image_urls=image_urls,
                 )
             )
 
@@ -91,8 +213,6 @@ class PhasePreviewService:
         """Get a specific phase preview."""
         session = await self._get_user_session(request_id, current_user)
 
-        from sqlalchemy import select
-
         query = (
             select(PhaseResult)
             .where(PhaseResult.session_id == session.id)
@@ -120,20 +240,17 @@ class PhasePreviewService:
         preview_result = await self.db.execute(preview_query)
         preview_version = preview_result.scalar_one_or_none()
 
-        preview_data = preview_version.version_data if preview_version else {}
+        preview_data = {}
+        if preview_version is not None:
+            preview_data = (await resolve_versions(self.db, [preview_version]))[0] or {}
         content = preview_data.get("content")
         image_url = preview_data.get("image_url")
         document_url = preview_data.get("document_url")
 
-        progress = 0
-        if phase_result.status == "completed":
-            progress = 100
-        elif phase_result.status == "running":
-            progress = 50
-        elif phase_result.status == "awaiting_feedback":
-            progress = 90
+        progress = self._status_progress(phase_result.status)
+        images = await preview_images(self.db, session.id, phase=phase_id)
 
-        return PhasePreviewResponse(
+        return PhasePreviewResponse.model_construct(
             id=str(phase_result.id),
             session_id=str(session.id),
             phase_number=phase_result.phase,
@@ -146,6 +263,7 @@ class PhasePreviewService:
             metadata=preview_data,
             created_at=phase_result.created_at,
             updated_at=phase_result.updated_at,
+            image_urls=[image["url"] for image in images],
         )
 
     async def update_phase_preview(
@@ -158,31 +276,6 @@ class PhasePreviewService:
         """Update a phase preview."""
         session = await self._get_user_session(request_id, current_user)
 
-        from sqlalchemy import select
-
-        # Get or create phase result
-        query = (
-            select(PhaseResult)
-            .where(PhaseResult.session_id == session.id)
-            .where(PhaseResult.phase == phase_id)
-        )
-
-        result = await self.db.execute(query)
-        phase_result = result.scalar_one_or_none()
-
-        if not phase_result:
-            # Create new phase result
-            phase_result = PhaseResult(
-                session_id=session.id,
-                phase=phase_id,
-                status=payload.status,
-            )
-            self.db.add(phase_result)
-            await self.db.flush()
-
-        # Update phase result status
-        phase_result.status = payload.status
-
         # Create new preview version
         version_data = {
             "preview_type": payload.preview_type,
@@ -193,16 +286,24 @@ class PhasePreviewService:
             "metadata": payload.metadata or {},
         }
 
-        preview_version = PreviewVersion(
+        preview_version = await create_preview_version(
+            self.db,
             session_id=session.id,
             phase=phase_id,
             version_data=version_data,
             change_description=f"Updated {payload.preview_type} preview",
         )
 
-        self.db.add(preview_version)
-        await self.db.flush()
+        # Create or update the phase's single result row
+        phase_result = await upsert_phase_result(
+            self.db,
+            session.id,
+            phase_id,
+            status=payload.status,
+            preview_version_id=preview_version.id,
+        )
         await self.db.commit()
+        session_snapshot_store.invalidate_phases(session.id)
 
         # Create event for real-time updates
         await self._create_session_event(
@@ -231,6 +332,16 @@ class PhasePreviewService:
             updated_at=phase_result.updated_at,
         )
 
+    def _status_progress(self, phase_status: str) -> int:
+        """Calculate progress based on status."""
+        if phase_status == "completed":
+            return 100
+        elif phase_status == "running":
+            return 50
+        elif phase_status == "awaiting_feedback":
+            return 90
+        return 0
+
     def _determine_preview_type(self, preview_data: dict) -> str:
         """Determine preview type from data."""
         if preview_data.get("image_url"):
@@ -241,25 +352,8 @@ class PhasePreviewService:
             return "text"
 
     async def _get_user_session(self, request_id: UUID, current_user: UserAccount) -> MangaSession:
-        """Get session and verify ownership."""
-        from sqlalchemy import select
-
-        query = (
-            select(MangaSession)
-            .where(MangaSession.request_id == request_id)
-            .where(MangaSession.user_id == current_user.id)
-        )
-
-        result = await self.db.execute(query)
-        session = result.scalar_one_or_none()
-
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found",
-            )
-
-        return session
+        """Get session and verify ownership (resolved once per request)."""
+        return await SessionResolver.for_db(self.db).get_owned(request_id, current_user)
 
     async def _create_session_event(self, session_id: UUID, event_type: str, event_data: dict):
         """Create a session event for real-time updates."""
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PhaseResult
+
+
+async def upsert_phase_result(
+    db: AsyncSession,
+    session_id: UUID,
+    phase: int,
+    **values: Any,
+) -> Row:
+    """Insert or update the single PhaseResult row for (session_id, phase)
+
+    Only the given columns are overwritten on conflict; the per-iteration
+    history lives in PreviewVersion. Returns (id, status, created_at, updated_at).
+    """
+    now = datetime.utcnow()
+    statement = insert(PhaseResult).values(session_id=session_id, phase=phase, updated_at=now, **values)
+    statement = statement.on_conflict_do_update(
+        constraint="uq_phase_results_session_phase",
+        set_={**values, "updated_at": now},
+    ).returning(PhaseResult.id, PhaseResult.status, PhaseResult.created_at, PhaseResult.updated_at)
+    return (await db.execute(statement)).one()
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 import json
 import logging
 import math
 import time
-from datetime import datetime, timedelta
+from contextvars import ContextVar
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core import clients as core_clients, settings as core_settings
+from app.core import settings as core_settings
 from app.core.db import session_scope
 from app.db.models import (
     FeedbackOptionTemplate,
     GeneratedImage,
     MangaAsset,
+    MangaAssetPhase,
     MangaAssetType,
     MangaProject,
     MangaProjectStatus,
@@ -25,12 +29,19 @@ from app.db.models import (
     MangaSessionStatus,
     PhaseResult,
     PreviewCacheMetadata,
-    PreviewVersion,
 )
+from app.services.asset_storage import asset_storage
+from app.services.content_store import blob_path, compute_digest, content_store
 from app.services.realtime_hub import build_event, realtime_hub
 from app.services.emergency_stop import EmergencyStopManager
+from app.services.feedback_notifier import feedback_notifier
+from app.services.phase_result_store import upsert_phase_result
+from app.services.preview_versioning import create_preview_version
+from app.services.session_snapshot import session_snapshot_store
+from app.services.session_write_buffer import session_status_buffer
 from app.services.hitl_service import (
     HITLService,
+    HITLSessionContext,
     HITLStateManager,
     HITLError,
     HITLSessionError,
@@ -712,13 +723,33 @@ class QualityCalculator:
         return breakdown
 
 
+# フェーズ実行中の DB セッション。オーケストレーターはプロセス共有なのでタスク毎に保持する
+_phase_db: ContextVar[Optional[AsyncSession]] = ContextVar("pipeline_phase_db", default=None)
+
+
 class PipelineOrchestrator:
+    """Runs the generation pipeline; one long-lived instance serves every session
+
+    Per-session state is keyed by session (``_pending_uploads``) or task-local
+    (``db``), so the process-wide instances from ``get_pipeline_orchestrator``
+    can run many sessions concurrently.
+    """
+
     def __init__(self, session_factory):
         self.session_factory = session_factory
         self.settings = core_settings.get_settings()
-        core_clients.get_storage_client.cache_clear()
         self.vertex_service = get_vertex_service()
-        self.db = None  # Will be set per-operation to avoid transaction conflicts
+        # session.id -> 生成と並行して進むアセットアップロード
+        self._pending_uploads: Dict[UUID, List[asyncio.Task]] = {}
+
+    @property
+    def db(self) -> Optional[AsyncSession]:
+        """Session of the phase transaction running in the current task"""
+        return _phase_db.get()
+
+    @db.setter
+    def db(self, value: Optional[AsyncSession]) -> None:
+        _phase_db.set(value)
 
     async def run(self, request_id: UUID) -> None:
         """
@@ -797,6 +828,9 @@ class PipelineOrchestrator:
                     await self._update_session_status(session.id, MangaSessionStatus.FAILED.value, error_message=str(phase_error))
                     raise
 
+            # Wait for asset uploads that overlapped with the later phases
+            await self._wait_for_uploads(session)
+
             # Mark session as completed (separate transaction)
             await self._update_session_status(
                 session.id,
@@ -810,6 +844,8 @@ class PipelineOrchestrator:
 
         except Exception as e:
             logger.error(f"❌ Pipeline execution failed for session {session.request_id}: {e}")
+            # 未完了のアップロードはバックグラウンドで完了させる
+            self._pending_uploads.pop(session.id, None)
             # Ensure session is marked as failed if not already done
             try:
                 await self._update_session_status(session.id, MangaSessionStatus.FAILED.value, error_message=str(e))
@@ -818,33 +854,20 @@ class PipelineOrchestrator:
             raise
 
     async def _update_session_status(self, session_id: UUID, status: Optional[str] = None, **kwargs) -> None:
-        """Update session status in a separate transaction to avoid conflicts"""
-        async with self.session_factory() as db_session:
-            try:
-                update_values = {"updated_at": datetime.utcnow()}
-                if status:
-                    update_values["status"] = status
-                update_values.update(kwargs)
-
-                # Check if transaction is already active to avoid double-begin
-                if db_session.in_transaction():
-                    logger.info("_update_session_status: Using existing transaction")
-                    await db_session.execute(
-                        update(MangaSession)
-                        .where(MangaSession.id == session_id)
-                        .values(**update_values)
-                    )
-                else:
-                    logger.info("_update_session_status: Starting new transaction")
-                    async with db_session.begin():
-                        await db_session.execute(
-                            update(MangaSession)
-                            .where(MangaSession.id == session_id)
-                            .values(**update_values)
-                        )
-            except Exception as e:
-                logger.error(f"Failed to update session status: {e}")
-                raise
+        """Update session status through the write-behind buffer
+
+        Updates are merged per session; phase boundaries (current_phase) and
+        terminal states are written immediately, anything else within
+        ``session_status_flush_interval_seconds``.
+        """
+        update_values: Dict[str, Any] = dict(kwargs)
+        if status:
+            update_values["status"] = status
+        try:
+            await session_status_buffer.update(session_id, update_values, session_factory=self.session_factory)
+        except Exception as e:
+            logger.error(f"Failed to update session status: {e}")
+            raise
 
     async def _execute_single_phase(self, session: MangaSession, phase_config: Dict[str, Any], context: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
         """Execute a single phase with normalized database transaction scope"""
@@ -865,8 +888,9 @@ class PipelineOrchestrator:
                     # Persist phase results within the same transaction
                     await self._persist_phase_results(session, phase_config, phase_result)
 
-                    logger.info(f"Phase {phase_number}: Transaction committed successfully")
-                    return phase_result
+                logger.info(f"Phase {phase_number}: Transaction committed successfully")
+                session_snapshot_store.invalidate_phases(session.id)
+                return phase_result
 
             except Exception as e:
                 logger.error(f"Phase {phase_number} execution failed: {e}")
@@ -881,27 +905,26 @@ class PipelineOrchestrator:
         phase_number = phase_config["phase"]
         quality_score = float(phase_result.get("metadata", {}).get("quality", 0.0))
 
-        # Create phase result record
-        phase_result_record = PhaseResult(
+        # Create preview version (stored as a delta against the previous iteration when smaller)
+        preview_version = await create_preview_version(
+            self.db,
             session_id=session.id,
             phase=phase_number,
-            status="completed",
-            content=phase_result,
+            version_data=phase_result.get("preview"),
+            quality_level=self._quality_to_level(quality_score),
             quality_score=quality_score,
         )
-        self.db.add(phase_result_record)
-        await self.db.flush()
 
-        # Create preview version
-        preview_version = PreviewVersion(
-            session_id=session.id,
-            phase=phase_number,
-            version_data=phase_result.get("preview"),
-            quality_level=self._quality_to_level(quality_score),
+        # One phase_results row per (session, phase); re-runs overwrite it
+        await upsert_phase_result(
+            self.db,
+            session.id,
+            phase_number,
+            status="completed",
+            content=phase_result,
             quality_score=quality_score,
+            preview_version_id=preview_version.id,
         )
-        self.db.add(preview_version)
-        await self.db.flush()
 
         logger.info(f"Persisted results for phase {phase_number}")
 
@@ -995,32 +1018,17 @@ class PipelineOrchestrator:
         安全にセッションステータスを更新する（独立したトランザクションコンテキストを使用）
         エラーハンドリング中でも使用できる
         """
-        try:
-            # 独立したデータベースセッションを作成
-            async with session_scope() as independent_session:
-                async with independent_session.begin() as transaction:
-                    try:
-                        update_values = {
-                            'status': status,
-                            'updated_at': datetime.utcnow()
-                        }
-                        if error_message:
-                            update_values['error_message'] = error_message[:500]  # Limit error message length
+        update_values = {'status': status}
+        if error_message:
+            update_values['error_message'] = error_message[:500]  # Limit error message length
 
-                        await independent_session.execute(
-                            update(MangaSession)
-                            .where(MangaSession.id == session_id)
-                            .values(**update_values)
-                        )
-                        await transaction.commit()
-                        logger.info(f"Safe update: Successfully updated session {session_id} status to {status}")
-                        return True
-                    except Exception as commit_error:
-                        await transaction.rollback()
-                        logger.error(f"Safe update: Failed to update session status: {commit_error}")
-                        return False
+        try:
+            # 独立したデータベースセッション（session_scope）で即時 flush する
+            await session_status_buffer.update(session_id, update_values, flush=True)
+            logger.info(f"Safe update: Successfully updated session {session_id} status to {status}")
+            return True
         except Exception as e:
-            logger.error(f"Safe update: Failed to create independent session: {type(e).__name__}: {e}")
+            logger.error(f"Safe update: Failed to update session status: {type(e).__name__}: {e}")
             return False
 
 
@@ -1180,6 +1188,7 @@ class PipelineOrchestrator:
         enriched_characters = []
         for idx, character in enumerate(characters):
             image_url: Optional[str] = None
+            storage_path: Optional[str] = None
             if idx < len(image_results):
                 result = image_results[idx]
                 if isinstance(result, list) and result:
@@ -1189,6 +1198,12 @@ class PipelineOrchestrator:
                         image_url = f"data:image/png;base64,{first['image_base64']}"
                     if not image_url and first.get("description"):
                         image_url = f"placeholder://character-{idx + 1}"
+                    storage_path = await self._start_image_upload(
+                        session,
+                        phase_config["phase"],
+                        first.get("image_base64"),
+                        {"kind": "character", "index": idx + 1},
+                    )
             enriched_characters.append(
                 {
                     "name": character.get("name", f"キャラクター{idx + 1}"),
@@ -1196,6 +1211,7 @@ class PipelineOrchestrator:
                     "appearance": character.get("appearance", "外見情報なし"),
                     "personality": character.get("personality", "性格情報なし"),
                     "imageUrl": image_url,
+                    "storagePath": storage_path,
                 }
             )
 
@@ -1408,6 +1424,12 @@ class PipelineOrchestrator:
                     "prompt": prompts[idx],
                     "panelId": idx + 1,
                     "status": status,
+                    "storagePath": await self._start_image_upload(
+                        session,
+                        phase_config["phase"],
+                        image_entry.get("image_base64"),
+                        {"kind": "panel", "panelId": idx + 1},
+                    ),
                 }
             )
 
@@ -1649,64 +1671,97 @@ class PipelineOrchestrator:
     ) -> Optional[Dict[str, Any]]:
         """Wait for user feedback or timeout"""
         timeout_seconds = self.settings.hitl_feedback_timeout_minutes * 60
-        poll_interval = 5  # Check every 5 seconds
 
-        start_time = time.perf_counter()
+        feedback = await self._await_feedback_notification(
+            feedback_state.session_id, session.request_id, phase_number, timeout_seconds
+        )
+        if feedback is not None:
+            return feedback
+
+        # Handle timeout
+        await self.hitl_service.check_and_handle_timeouts()
+        await realtime_hub.publish_feedback_timeout(
+            session.request_id,
+            phase=phase_number,
+            action_taken="auto_approve"
+        )
+        logger.info(f"Feedback timeout for session {session.request_id}, phase {phase_number}")
+        return {"type": "timeout", "action_taken": "auto_approve"}
+
+    async def _await_feedback_notification(
+        self,
+        session_id: UUID,
+        request_id: UUID,
+        phase_number: int,
+        timeout_seconds: float
+    ) -> Optional[Dict[str, Any]]:
+        """Block until feedback is signalled via feedback_notifier, or return None on timeout.
+
+        The DB is re-checked only when woken or every safety-net interval, so a
+        missed notification (e.g. listener reconnecting) delays but never loses feedback.
+        """
+        poll_interval = getattr(self.settings, "hitl_feedback_poll_interval_seconds", 60)
+        deadline = time.perf_counter() + timeout_seconds
 
         while True:
-            elapsed = time.perf_counter() - start_time
-            if elapsed >= timeout_seconds:
-                # Handle timeout
-                await self.hitl_service.check_and_handle_timeouts()
-                await realtime_hub.publish_feedback_timeout(
-                    session.request_id,
-                    phase=phase_number,
-                    action_taken="auto_approve"
-                )
-                logger.info(f"Feedback timeout for session {session.request_id}, phase {phase_number}")
-                return {"type": "timeout", "action_taken": "auto_approve"}
+            # 通知取りこぼしを防ぐため、DB確認より先に待機を登録する
+            waiter = feedback_notifier.register(session_id, phase_number)
+            try:
+                feedback = await self._fetch_received_feedback(session_id, phase_number)
+                if feedback is not None:
+                    logger.info(f"Feedback received for session {request_id}, phase {phase_number}: {feedback['feedback_type']}")
+                    return feedback
 
-            # Check if feedback has been received
-            from app.db.models import PhaseFeedbackState
-            from sqlalchemy import select, and_
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
 
-            state_query = select(PhaseFeedbackState).where(
-                and_(
-                    PhaseFeedbackState.session_id == feedback_state.session_id,
-                    PhaseFeedbackState.phase == phase_number
-                )
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), timeout=min(poll_interval, remaining))
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                feedback_notifier.unregister(session_id, phase_number, waiter)
+
+    async def _fetch_received_feedback(
+        self,
+        session_id: UUID,
+        phase_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Return the latest feedback if the phase feedback state is 'received'"""
+        from app.db.models import PhaseFeedbackState, UserFeedbackHistory
+        from sqlalchemy import and_
+
+        state_query = select(PhaseFeedbackState.state).where(
+            and_(
+                PhaseFeedbackState.session_id == session_id,
+                PhaseFeedbackState.phase == phase_number
             )
-            async with self.session_factory() as db_session:
-                state_result = await db_session.execute(state_query)
-                current_state = state_result.scalar_one_or_none()
+        )
+        async with self.session_factory() as db_session:
+            current_state = (await db_session.execute(state_query)).scalar_one_or_none()
+            if current_state != "received":
+                return None
 
-                if current_state and current_state.state == "received":
-                    # Feedback received, get the feedback data
-                    from app.db.models import UserFeedbackHistory
+            feedback_query = select(UserFeedbackHistory).where(
+                and_(
+                    UserFeedbackHistory.session_id == session_id,
+                    UserFeedbackHistory.phase == phase_number
+                )
+            ).order_by(UserFeedbackHistory.created_at.desc()).limit(1)
 
-                    feedback_query = select(UserFeedbackHistory).where(
-                        and_(
-                            UserFeedbackHistory.session_id == feedback_state.session_id,
-                            UserFeedbackHistory.phase == phase_number
-                        )
-                    ).order_by(UserFeedbackHistory.created_at.desc())
-
-                    feedback_result = await db_session.execute(feedback_query)
-                    feedback_entry = feedback_result.scalar_one_or_none()
-
-                    if feedback_entry:
-                        logger.info(f"Feedback received for session {session.request_id}, phase {phase_number}: {feedback_entry.feedback_type}")
-                        return {
-                            "type": "feedback",
-                            "feedback_type": feedback_entry.feedback_type,
-                            "selected_options": feedback_entry.selected_options,
-                            "natural_language_input": feedback_entry.natural_language_input,
-                            "user_satisfaction_score": feedback_entry.user_satisfaction_score,
-                            "modifications": self._extract_feedback_modifications(feedback_entry)
-                        }
+            feedback_entry = (await db_session.execute(feedback_query)).scalar_one_or_none()
+            if not feedback_entry:
+                return None
 
-            # Wait before next check
-            await asyncio.sleep(poll_interval)
+            return {
+                "type": "feedback",
+                "feedback_type": feedback_entry.feedback_type,
+                "selected_options": feedback_entry.selected_options,
+                "natural_language_input": feedback_entry.natural_language_input,
+                "user_satisfaction_score": feedback_entry.user_satisfaction_score,
+                "modifications": self._extract_feedback_modifications(feedback_entry)
+            }
 
     def _extract_feedback_modifications(self, feedback_entry) -> Optional[Dict[str, Any]]:
         """Extract modification requests from user feedback"""
@@ -1874,27 +1929,61 @@ class PipelineOrchestrator:
             ),
         )
 
-    def _build_signed_url(
+    async def _start_image_upload(
         self,
         session: MangaSession,
-        phase_config: Dict[str, Any],
-        preview: PreviewVersion,
-        *,
-        file_extension: str = "json",
-    ) -> str:
-        bucket = self.settings.gcs_bucket_preview
-        path = (
-            f"preview/{session.request_id}/phase-{phase_config['phase']}/"
-            f"{preview.id}.{file_extension}"
-        )
+        phase: int,
+        image_base64: Optional[str],
+        image_metadata: Dict[str, Any],
+    ) -> Optional[str]:
+        """Store a generated image in the background; returns its (content-addressed) storage path"""
+        if not image_base64:
+            return None
         try:
-            client = core_clients.get_storage_client()
-            bucket_ref = client.bucket(bucket)
-            blob = bucket_ref.blob(path)
-            expiration = datetime.utcnow() + timedelta(seconds=self.settings.signed_url_ttl_seconds)
-            return blob.generate_signed_url(expiration=expiration, method="GET", version="v4")
-        except Exception:
-            return f"https://storage.googleapis.com/{bucket}/{path}"
+            data = base64.b64decode(image_base64, validate=True)
+        except (binascii.Error, ValueError) as e:
+            logger.warning(f"Skipping upload of undecodable phase {phase} image {image_metadata}: {e}")
+            return None
+        # put に digest を渡すため、大きな画像はここでスレッドにオフロードしてハッシュする
+        digest = await compute_digest(data)
+        task = asset_storage.spawn(self._store_generated_image(session, phase, data, digest, image_metadata))
+        self._pending_uploads.setdefault(session.id, []).append(task)
+        return blob_path(digest)
+
+    async def _store_generated_image(
+        self,
+        session: MangaSession,
+        phase: int,
+        data: bytes,
+        digest: str,
+        image_metadata: Dict[str, Any],
+    ) -> str:
+        # 再生成やリトライで同じ画像が出ても、既存の blob はメタデータの更新だけで済む
+        stored = await content_store.put(data, content_type="image/png", digest=digest)
+        async with session_scope(workload="asset_upload") as db_session:
+            db_session.add(
+                GeneratedImage(
+                    session_id=session.id,
+                    phase=phase,
+                    storage_path=stored.storage_path,
+                    content_digest=stored.digest,
+                    image_metadata={**image_metadata, "sizeBytes": stored.size_bytes},
+                )
+            )
+            # 画像の署名 URL はフェーズプレビューに含まれるため、フェーズの ETag を更新する
+            await db_session.execute(
+                update(PhaseResult)
+                .where(PhaseResult.session_id == session.id, PhaseResult.phase == phase)
+                .values(updated_at=datetime.utcnow())
+            )
+        return stored.storage_path
+
+    async def _wait_for_uploads(self, session: MangaSession) -> None:
+        tasks = self._pending_uploads.pop(session.id, [])
+        if not tasks:
+            return
+        uploaded = await asset_storage.wait_for(tasks)
+        logger.info(f"📦 Uploaded {len(uploaded)}/{len(tasks)} assets for session {session.request_id}")
 
     def _estimate_pages(self, session: MangaSession, context: Dict[int, Dict[str, Any]]) -> int:
         structure_data = context.get(3, {}).get("data", {})
@@ -1919,12 +2008,12 @@ class PipelineOrchestrator:
                 )
                 existing_pdf = result.scalars().first()
                 storage_path = f"projects/{project.id}/final/{session.request_id}.pdf"
-                signed_url = self._build_asset_signed_url(storage_path)
+                # 署名 URL は読み出し時に signed_url_cache から発行する
                 asset_payload = {
                     "project_id": project.id,
                     "asset_type": MangaAssetType.PDF,
+                    "phase": MangaAssetPhase.FINAL_RENDER,
                     "storage_path": storage_path,
-                    "signed_url": signed_url,
                     "asset_metadata": {
                         "total_pages": project.total_pages,
                         "generated_at": datetime.utcnow().isoformat(),
@@ -1945,17 +2034,6 @@ class PipelineOrchestrator:
             )
             return result.scalar_one_or_none()
 
-    def _build_asset_signed_url(self, storage_path: str) -> str:
-        bucket = self.settings.gcs_bucket_preview
-        try:
-            client = core_clients.get_storage_client()
-            bucket_ref = client.bucket(bucket)
-            blob = bucket_ref.blob(storage_path)
-            expiration = datetime.utcnow() + timedelta(seconds=self.settings.signed_url_ttl_seconds)
-            return blob.generate_signed_url(expiration=expiration, method="GET", version="v4")
-        except Exception:
-            return f"https://storage.googleapis.com/{bucket}/{storage_path}"
-
     def _parse_json(self, raw: str | None) -> Dict[str, Any]:
         if not raw:
             return {}
@@ -2061,22 +2139,18 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
             self.max_feedback_iterations = 3
             self.feedback_timeout_minutes = 30
         
-        # HITLコンポーネント初期化 - 必要時に作成
-        self._hitl_service: Optional[HITLService] = None
-        self._hitl_state_manager: Optional[HITLStateManager] = None
+        # DB に紐づく HITL コンポーネントは呼び出し毎に作成し、共有インスタンスには
+        # リクエストを跨ぐ状態（進行中の HITL セッション）だけを保持する
+        self._hitl_active_sessions: Dict[UUID, HITLSessionContext] = {}
 
     async def _get_hitl_service(self, db: AsyncSession) -> HITLService:
-        """HITLサービスを取得（初回作成時にキャッシュ）"""
-        if self._hitl_service is None:
-            self._hitl_service = HITLService(db)
-        return self._hitl_service
+        """呼び出し元の DB セッションに紐づく HITL サービス"""
+        return HITLService(db)
 
     async def _get_hitl_state_manager(self, db: AsyncSession) -> HITLStateManager:
-        """HITLステートマネージャーを取得（初回作成時にキャッシュ）"""
-        if self._hitl_state_manager is None:
-            hitl_service = await self._get_hitl_service(db)
-            self._hitl_state_manager = HITLStateManager(hitl_service)
-        return self._hitl_state_manager
+        """呼び出し元の DB セッションに紐づくステートマネージャー（active_sessions は共有）"""
+        hitl_service = await self._get_hitl_service(db)
+        return HITLStateManager(hitl_service, active_sessions=self._hitl_active_sessions)
 
     def _extract_preview_data(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """フェーズ結果からプレビューデータを抽出"""
@@ -2110,7 +2184,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
     async def _get_feedback_options_for_phase(self, phase_number: int) -> List[Dict[str, Any]]:
         """指定フェーズで利用可能なフィードバックオプションを取得"""
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 # フィードバックオプションテンプレートを取得
                 query = select(FeedbackOptionTemplate).where(
                     FeedbackOptionTemplate.phase == phase_number
@@ -2226,7 +2300,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         logger.info(f"Starting HITL feedback cycle for phase {phase_number}")
 
         # データベースセッションを取得してHITLコンポーネントを初期化
-        async with session_scope(self.session_factory) as db:
+        async with session_scope(workload="hitl") as db:
             try:
                 state_manager = await self._get_hitl_state_manager(db)
                 
@@ -2444,7 +2518,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         # HITLStateManagerからセッション状態を取得
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2473,7 +2547,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """フィードバックタイムアウト通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2495,7 +2569,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """フィードバック承認通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2517,7 +2591,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """フィードバック処理中通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2545,7 +2619,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """再生成完了通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2578,7 +2652,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """再生成エラー通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2603,7 +2677,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """フィードバックスキップ通知（HITLStateManager統合版）"""
         session_state = None
         try:
-            async with session_scope(self.session_factory) as db:
+            async with session_scope(workload="hitl") as db:
                 state_manager = await self._get_hitl_state_manager(db)
                 session_state = await state_manager.get_session_status(session.request_id)
         except Exception as e:
@@ -2640,6 +2714,30 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
             logger.error(f"Error waiting for feedback: {e}")
             return None
 
+    async def _wait_for_user_feedback_event(
+        self,
+        request_id: UUID,
+        phase_number: int,
+        timeout_minutes: int = 30
+    ) -> Optional[Dict[str, Any]]:
+        """
+        フィードバック通知を待機（タイムアウト時はNoneを返す）
+        """
+        async with self.session_factory() as db_session:
+            session_id = (
+                await db_session.execute(
+                    select(MangaSession.id).where(MangaSession.request_id == request_id)
+                )
+            ).scalar_one_or_none()
+
+        if session_id is None:
+            logger.warning(f"Session not found while waiting for feedback: {request_id}")
+            return None
+
+        return await self._await_feedback_notification(
+            session_id, request_id, phase_number, timeout_minutes * 60
+        )
+
     async def retry_specific_phase(
         self,
         session: MangaSession,
@@ -2661,7 +2759,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """
         logger.info(f"Starting phase retry for session {session.request_id}, phase {phase_id}")
 
-        async with session_scope(self.session_factory) as db:
+        async with session_scope(workload="pipeline") as db:
             try:
                 # セッションの状態を確認
                 if session.status in [MangaSessionStatus.COMPLETED.value, MangaSessionStatus.RUNNING.value]:
@@ -2746,25 +2844,17 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
                 result = await self._execute_single_phase_with_hitl(session, phase_config, context)
             else:
                 result = await self._execute_single_phase(session, phase_config, context)
+            await self._wait_for_uploads(session)
 
             # 結果を保存
-            async with session_scope(self.session_factory) as db:
-                from sqlalchemy import select
-                from app.db.models.phase_result import PhaseResult
-
-                db_result = await db.execute(
-                    select(PhaseResult).where(
-                        PhaseResult.session_id == session.id,
-                        PhaseResult.phase == phase_id
-                    )
+            async with session_scope(workload="pipeline") as db:
+                await upsert_phase_result(
+                    db,
+                    session.id,
+                    phase_id,
+                    content=result,
+                    status="completed" if result.get("success") else "failed",
                 )
-                phase_result = db_result.scalar_one_or_none()
-
-                if phase_result:
-                    phase_result.content = result
-                    phase_result.status = "completed" if result.get("success") else "failed"
-                    phase_result.updated_at = datetime.utcnow()
-
                 await db.commit()
 
             # WebSocket通知
@@ -2780,6 +2870,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
 
         except Exception as e:
             logger.error(f"Background phase retry failed for phase {phase_id}: {e}")
+            self._pending_uploads.pop(session.id, None)
             # エラー通知
             await self._send_websocket_notification(
                 session.request_id,
@@ -2806,24 +2897,30 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         Returns:
             Dict containing error details or None if no error found
         """
-        async with session_scope(self.session_factory) as db:
+        async with session_scope(workload="pipeline") as db:
             try:
                 from sqlalchemy import select
                 from app.db.models.phase_result import PhaseResult
 
+                # content 全体ではなく content->'error' だけをサーバー側で取り出す
                 result = await db.execute(
-                    select(PhaseResult).where(
+                    select(
+                        PhaseResult.status,
+                        PhaseResult.content["error"].label("error"),
+                        PhaseResult.created_at,
+                        PhaseResult.updated_at,
+                    ).where(
                         PhaseResult.session_id == session.id,
                         PhaseResult.phase == phase_id
                     )
                 )
-                phase_result = result.scalar_one_or_none()
+                phase_result = result.one_or_none()
 
                 if not phase_result:
                     return None
 
                 # エラー情報を抽出
-                content = phase_result.content or {}
+                content = {"error": phase_result.error} if phase_result.error is not None else {}
                 error_details = self._extract_error_details(content, phase_result.status)
 
                 if not error_details:
@@ -2946,7 +3043,7 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
         """指定フェーズ実行用のコンテキストを構築"""
         context = {}
 
-        async with session_scope(self.session_factory) as db:
+        async with session_scope(workload="pipeline") as db:
             try:
                 from sqlalchemy import select
                 from app.db.models.phase_result import PhaseResult
@@ -2978,3 +3075,27 @@ class HITLCapablePipelineOrchestrator(PipelineOrchestrator):
             await ws_service.send_to_session(str(request_id), data)
         except Exception as e:
             logger.warning(f"Failed to send WebSocket notification: {e}")
+
+
+_pipeline_orchestrator: Optional[PipelineOrchestrator] = None
+_hitl_orchestrator: Optional[HITLCapablePipelineOrchestrator] = None
+
+
+def get_pipeline_orchestrator() -> PipelineOrchestrator:
+    """Process-wide orchestrator for new generation sessions"""
+    global _pipeline_orchestrator
+    if _pipeline_orchestrator is None:
+        from app.core.db import get_session_factory
+
+        _pipeline_orchestrator = PipelineOrchestrator(get_session_factory())
+    return _pipeline_orchestrator
+
+
+def get_hitl_orchestrator() -> HITLCapablePipelineOrchestrator:
+    """Process-wide HITL orchestrator for phase retries and error inspection"""
+    global _hitl_orchestrator
+    if _hitl_orchestrator is None:
+        from app.core.db import get_session_factory
+
+        _hitl_orchestrator = HITLCapablePipelineOrchestrator(get_session_factory())
+    return _hitl_orchestrator
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PreviewVersion
+
+logger = logging.getLogger(__name__)
+
+# パッチがフル版の半分以上になる場合はチェックポイントとして保存する
+_MAX_PATCH_RATIO = 0.5
+
+
+# --------------------------------------------------------------- JSON Patch
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(old: Any, new: Any) -> bool:
+    # True == 1 を区別するため型も比較する
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, (dict, list)):
+        return json.dumps(old, sort_keys=True) == json.dumps(new, sort_keys=True)
+    return old == new
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Build RFC 6902 operations turning ``old`` into ``new``.
+
+    Objects are diffed key by key; lists and scalars are replaced wholesale.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif not _same(old[key], value):
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+    if _same(old, new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """Apply operations produced by make_patch to a copy of ``document``"""
+    result = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            result = copy.deepcopy(op.get("value"))
+            continue
+        target = result
+        for token in tokens[:-1]:
+            target = target[token]
+        if op["op"] == "remove":
+            target.pop(tokens[-1], None)
+        else:
+            target[tokens[-1]] = copy.deepcopy(op.get("value"))
+    return result
+
+
+# ------------------------------------------------------------ reconstruction
+
+
+class PreviewReconstructionCache:
+    """復元済み version_data の LRU（バージョンは不変なので無効化は不要）
+
+    返す dict は共有されるため読み取り専用として扱うこと。
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, version_id: UUID | str) -> Optional[Any]:
+        key = str(version_id)
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, version_id: UUID | str, data: Any) -> None:
+        key = str(version_id)
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, version_id: object) -> bool:
+        return str(version_id) in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+preview_reconstruction_cache = PreviewReconstructionCache()
+
+
+def _checkpoint_interval() -> int:
+    from app.core.settings import get_settings
+
+    return int(get_settings().preview_checkpoint_interval)
+
+
+async def resolve_version_data(db: AsyncSession, version_id: UUID) -> Optional[Any]:
+    """Reconstruct a version's full data (one recursive query back to the checkpoint)"""
+    cached = preview_reconstruction_cache.get(version_id)
+    if cached is not None:
+        return cached
+
+    table = PreviewVersion.__table__
+    chain = (
+        select(table.c.id, table.c.parent_version_id, table.c.version_data, table.c.version_delta)
+        .where(table.c.id == version_id)
+        .cte("preview_chain", recursive=True)
+    )
+    parent = table.alias("parent_version")
+    chain = chain.union_all(
+        select(parent.c.id, parent.c.parent_version_id, parent.c.version_data, parent.c.version_delta)
+        .where(parent.c.id == chain.c.parent_version_id)
+        .where(chain.c.version_delta.is_not(None))
+    )
+    rows = {row.id: row for row in (await db.execute(select(chain))).all()}
+
+    # 子 -> チェックポイント（またはキャッシュ済みの祖先）の順に辿る
+    pending = []
+    current = rows.get(version_id)
+    base: Any = None
+    while current is not None:
+        cached = preview_reconstruction_cache.get(current.id)
+        if cached is not None:
+            base = cached
+            break
+        if current.version_delta is None:
+            base = current.version_data
+            preview_reconstruction_cache.put(current.id, base)
+            break
+        pending.append(current)
+        current = rows.get(current.parent_version_id)
+    else:
+        if pending:
+            logger.warning("Preview version chain for %s is broken; cannot reconstruct", version_id)
+        return None
+
+    for row in reversed(pending):
+        base = apply_patch(base, row.version_delta)
+        preview_reconstruction_cache.put(row.id, base)
+    return base
+
+
+async def resolve_versions(db: AsyncSession, versions: Iterable[PreviewVersion]) -> List[Optional[Any]]:
+    """Resolve already loaded versions, applying deltas in memory where the parent is loaded too"""
+    versions = list(versions)
+    by_id = {version.id: version for version in versions}
+    resolved: Dict[Any, Any] = {}
+
+    async def resolve(version: PreviewVersion) -> Optional[Any]:
+        if version.id in resolved:
+            return resolved[version.id]
+        if version.version_delta is None:
+            data = version.version_data
+        else:
+            data = preview_reconstruction_cache.get(version.id)
+            if data is None:
+                parent = by_id.get(version.parent_version_id)
+                if parent is not None:
+                    parent_data = await resolve(parent)
+                    data = apply_patch(parent_data, version.version_delta) if parent_data is not None else None
+                    if data is not None:
+                        preview_reconstruction_cache.put(version.id, data)
+                else:
+                    data = await resolve_version_data(db, version.id)
+        resolved[version.id] = data
+        return data
+
+    return [await resolve(version) for version in versions]
+
+
+# ------------------------------------------------------------------- writes
+
+
+async def create_preview_version(
+    db: AsyncSession,
+    *,
+    session_id: UUID,
+    phase: int,
+    version_data: Optional[Dict[str, Any]],
+    **columns: Any,
+) -> PreviewVersion:
+    """Add a PreviewVersion for (session_id, phase), stored as a patch against the latest one
+
+    A full checkpoint is written every ``preview_checkpoint_interval`` versions,
+    when there is no parent, or when the patch would not be meaningfully smaller.
+    """
+    latest = (
+        await db.execute(
+            select(PreviewVersion.id, PreviewVersion.delta_depth)
+            .where(PreviewVersion.session_id == session_id, PreviewVersion.phase == phase)
+            .order_by(PreviewVersion.created_at.desc())
+            .limit(1)
+        )
+    ).one_or_none()
+
+    version = PreviewVersion(id=columns.pop("id", None) or uuid4(), session_id=session_id, phase=phase, **columns)
+    version.parent_version_id = latest.id if latest is not None else None
+    version.version_data = version_data
+    version.delta_depth = 0
+
+    if latest is not None and isinstance(version_data, dict) and (latest.delta_depth or 0) + 1 < _checkpoint_interval():
+        parent_data = await resolve_version_data(db, latest.id)
+        if isinstance(parent_data, dict):
+            ops = make_patch(parent_data, version_data)
+            full_size = len(json.dumps(version_data, default=str))
+            if len(json.dumps(ops, default=str)) < full_size * _MAX_PATCH_RATIO:
+                version.version_data = None
+                version.version_delta = ops
+                version.delta_depth = (latest.delta_depth or 0) + 1
+
+    db.add(version)
+    await db.flush()
+    preview_reconstruction_cache.put(version.id, copy.deepcopy(version_data))
+    return version
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.db.models import UserAccount
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class PrincipalCache:
+    """Process-local cache of authenticated users keyed by access-token digest
+
+    - Entries live for ``ttl_seconds`` but never past the token's own ``exp``
+    - Only tokens that passed signature verification are stored, so a hit
+      skips verification and the ``UserAccount`` query
+    - Each hit returns a fresh detached ``UserAccount`` (no ORM instance is
+      shared between request sessions); treat it as read-only
+    - A deactivated user stays authenticated for at most ``ttl_seconds`` (or
+      until the token's ``exp``, if sooner)
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 10000) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            from app.core.settings import get_settings
+
+            self._ttl_seconds = float(get_settings().principal_cache_ttl_seconds)
+        return self._ttl_seconds
+
+    def get(self, token: str) -> Optional[UserAccount]:
+        key = token_digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, values = entry
+        if time.monotonic() >= expires_at:
+            self._discard(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._detached_user(values)
+
+    def put(self, token: str, user: UserAccount, token_expires_at: Optional[datetime] = None) -> None:
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            ttl = min(ttl, (token_expires_at - datetime.now(timezone.utc)).total_seconds())
+        if ttl <= 0 or user.id is None:
+            return
+
+        key = token_digest(token)
+        values = {attr.key: getattr(user, attr.key) for attr in UserAccount.__mapper__.column_attrs}
+        self._entries[key] = (time.monotonic() + ttl, values)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    @staticmethod
+    def _detached_user(values: Dict[str, Any]) -> UserAccount:
+        user = UserAccount(**values)
+        make_transient_to_detached(user)
+        return user
+
+
+principal_cache = PrincipalCache()
@@ -4,11 +4,14 @@ from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.db.loading import light_project_options
 from app.db.models import MangaAsset, MangaAssetType, MangaProject, UserAccount
+from app.services.pagination import InvalidCursorError, apply_keyset, count_cache, split_page
+from app.services.signed_url_cache import signed_url_cache
 
 
 class ProjectService:
@@ -24,35 +27,49 @@ class ProjectService:
         sort: str,
         order: str,
         status_filter: Optional[str],
-    ) -> Tuple[List[MangaProject], Dict[str, int]]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[MangaProject], Dict[str, object]]:
         if page < 1:
             page = 1
         if limit < 1 or limit > 100:
             limit = 20
 
-        query = select(MangaProject).options(selectinload(MangaProject.assets)).where(MangaProject.user_id == user.id)
-        count_query = select(func.count()).select_from(MangaProject).where(MangaProject.user_id == user.id)
-
+        filtered = select(MangaProject).where(MangaProject.user_id == user.id)
         if status_filter and status_filter != "all":
-            query = query.where(MangaProject.status == status_filter)
-            count_query = count_query.where(MangaProject.status == status_filter)
+            filtered = filtered.where(MangaProject.status == status_filter)
 
         sort_column = self._resolve_sort_column(sort)
-        ordering = desc(sort_column) if order == "desc" else asc(sort_column)
-        query = query.order_by(ordering).offset((page - 1) * limit).limit(limit)
+        descending = order == "desc"
+
+        query = filtered.options(selectinload(MangaProject.assets), *light_project_options())
+        if cursor is None and page > 1:
+            # Legacy page-number access; cursor pagination keeps deep pages cheap
+            query = query.offset((page - 1) * limit)
+        try:
+            query = apply_keyset(query, sort_column, MangaProject.id, descending=descending, cursor=cursor, limit=limit)
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_cursor")
 
         result = await self.db.execute(query)
-        projects = result.scalars().all()
+        projects, next_cursor = split_page(result.scalars().all(), limit, sort_column.key)
 
-        total_result = await self.db.execute(count_query)
-        total_items = total_result.scalar_one()
-        total_pages = max(1, (total_items + limit - 1) // limit)
+        total_items: Optional[int] = None
+        total_pages: Optional[int] = None
+        total_is_approximate = False
+        if include_total:
+            total_items, total_is_approximate = await count_cache.count(
+                self.db, ("projects", user.id, status_filter or "all"), filtered
+            )
+            total_pages = max(1, (total_items + limit - 1) // limit)
 
         return projects, {
             "page": page,
             "limit": limit,
             "total_items": total_items,
             "total_pages": total_pages,
+            "next_cursor": next_cursor,
+            "total_is_approximate": total_is_approximate,
         }
 
     async def get_project(self, user: UserAccount, project_id: UUID) -> MangaProject:
@@ -98,20 +115,27 @@ class ProjectService:
         return MangaProject.created_at
 
     @staticmethod
-    def extract_thumbnail(project: MangaProject) -> Optional[str]:
+    async def asset_url(asset: MangaAsset) -> str:
+        """Signed URL for an asset, reused from the signed URL cache until shortly before expiry"""
+        from app.core.settings import get_settings
+
+        return await signed_url_cache.get_url(get_settings().gcs_bucket_preview, asset.storage_path)
+
+    @staticmethod
+    async def extract_thumbnail(project: MangaProject) -> Optional[str]:
         for asset in project.assets:
             if asset.asset_type == MangaAssetType.THUMBNAIL:
-                return asset.signed_url
+                return await ProjectService.asset_url(asset)
         return None
 
     @staticmethod
-    def aggregate_files(project: MangaProject) -> Dict[str, object]:
+    async def aggregate_files(project: MangaProject) -> Dict[str, object]:
         files: Dict[str, object] = {"pdf_url": None, "webp_urls": [], "thumbnail_url": None}
         for asset in project.assets:
             if asset.asset_type == MangaAssetType.PDF:
-                files["pdf_url"] = asset.signed_url
+                files["pdf_url"] = await ProjectService.asset_url(asset)
             elif asset.asset_type == MangaAssetType.WEBP:
-                files.setdefault("webp_urls", []).append(asset.signed_url)
+                files.setdefault("webp_urls", []).append(await ProjectService.asset_url(asset))
             elif asset.asset_type == MangaAssetType.THUMBNAIL:
-                files["thumbnail_url"] = asset.signed_url
+                files["thumbnail_url"] = await ProjectService.asset_url(asset)
         return files
@@ -0,0 +1,57 @@
+"""Cheap version lookups backing the ETag validators of read endpoints.
+
+Each lookup reads only trigger- or upsert-maintained version columns through
+an index, so a conditional GET can be answered with 304 before the full
+representation is loaded. Validators are read before the representation, so
+a concurrent write can only make an ETag older than its body (the next
+request then misses), never newer.
+"""
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import MangaProject, MangaSession, PhaseResult
+from app.services.rollups import PROJECT_USER_VERSION_COUNTER_PREFIX, get_counters
+
+
+async def phase_results_version(
+    db: AsyncSession,
+    request_id: UUID,
+    user_id: UUID,
+    *,
+    phase: Optional[int] = None,
+) -> Optional[List[Tuple[Any, ...]]]:
+    """(phase, status, updated_at, preview_version_id) per phase of an owned session; None if nothing to validate
+
+    Every new PreviewVersion is recorded on its phase_results row
+    (preview_version_id, updated_at), and storing a generated image bumps
+    updated_at, so this covers preview changes and new images too.
+    """
+    query = (
+        select(PhaseResult.phase, PhaseResult.status, PhaseResult.updated_at, PhaseResult.preview_version_id)
+        .join(MangaSession, MangaSession.id == PhaseResult.session_id)
+        .where(MangaSession.request_id == request_id, MangaSession.user_id == user_id)
+        .order_by(PhaseResult.phase)
+    )
+    if phase is not None:
+        query = query.where(PhaseResult.phase == phase)
+    rows = [tuple(row) for row in (await db.execute(query)).all()]
+    return rows or None
+
+
+async def project_version(db: AsyncSession, project_id: UUID, user_id: UUID) -> Optional[int]:
+    """Trigger-maintained version of an owned project (bumped on project and asset writes)"""
+    result = await db.execute(
+        select(MangaProject.version).where(MangaProject.id == project_id, MangaProject.user_id == user_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def user_projects_version(db: AsyncSession, user_id: UUID) -> int:
+    """Counter bumped on every write to any of the user's projects (list validator)"""
+    name = f"{PROJECT_USER_VERSION_COUNTER_PREFIX}{user_id}"
+    return (await get_counters(db, name))[name]
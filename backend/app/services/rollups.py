@@ -0,0 +1,119 @@
+"""Read helpers for the trigger-maintained rollup tables (migration 0016).
+
+Dashboard and health checks read these instead of scanning manga_sessions /
+phase_results; the rows are kept current by triggers on every write.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.rollups import (
+    DURATION_HISTOGRAM_BOUNDS,
+    PhaseQualityRollup,
+    RollupCounter,
+    SessionHourlyRollup,
+)
+
+SESSION_TOTAL_COUNTER = "manga_sessions.total"
+PROJECT_TOTAL_COUNTER = "manga_projects.total"
+PROJECT_USER_VERSION_COUNTER_PREFIX = "manga_projects.user_version."
+SESSION_STATUS_COUNTER_PREFIX = "manga_sessions.status."
+CREATED_STATUS = "created"
+
+
+@dataclass
+class DurationStats:
+    """Processing-time aggregate over a window of hourly rollups"""
+
+    count: int = 0
+    seconds_sum: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(DURATION_HISTOGRAM_BOUNDS) + 1))
+
+    @property
+    def average_seconds(self) -> float:
+        return self.seconds_sum / self.count if self.count else 0.0
+
+    def histogram_labels(self) -> Dict[str, int]:
+        labels = [f"<={bound}s" for bound in DURATION_HISTOGRAM_BOUNDS]
+        labels.append(f">{DURATION_HISTOGRAM_BOUNDS[-1]}s")
+        return dict(zip(labels, self.histogram))
+
+
+def _since(hours: float) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(hours=hours)
+
+
+async def get_counters(db: AsyncSession, *names: str) -> Dict[str, int]:
+    """Counter values by name; missing counters read as 0"""
+    result = await db.execute(select(RollupCounter.name, RollupCounter.value).where(RollupCounter.name.in_(names)))
+    values = {name: 0 for name in names}
+    values.update({name: int(value or 0) for name, value in result.all()})
+    return values
+
+
+async def get_session_status_counts(db: AsyncSession) -> Dict[str, int]:
+    """Current number of sessions per status"""
+    result = await db.execute(
+        select(RollupCounter.name, RollupCounter.value).where(
+            RollupCounter.name.startswith(SESSION_STATUS_COUNTER_PREFIX)
+        )
+    )
+    counts: Dict[str, int] = {}
+    for name, value in result.all():
+        if value:
+            counts[name[len(SESSION_STATUS_COUNTER_PREFIX):]] = int(value)
+    return counts
+
+
+async def count_entered_since(db: AsyncSession, status: str, *, hours: float = 24) -> int:
+    """Sessions that entered ``status`` in the last ``hours`` (hour granularity)"""
+    result = await db.execute(
+        select(func.coalesce(func.sum(SessionHourlyRollup.entered_count), 0)).where(
+            SessionHourlyRollup.status == status,
+            SessionHourlyRollup.bucket_start >= func.date_trunc("hour", _since(hours)),
+        )
+    )
+    return int(result.scalar_one() or 0)
+
+
+async def get_duration_stats(db: AsyncSession, status: str, *, hours: float = 24) -> DurationStats:
+    """Processing-time count/sum/histogram of sessions reaching ``status`` in the window"""
+    result = await db.execute(
+        select(
+            SessionHourlyRollup.entered_count,
+            SessionHourlyRollup.duration_seconds_sum,
+            SessionHourlyRollup.duration_histogram,
+        ).where(
+            SessionHourlyRollup.status == status,
+            SessionHourlyRollup.bucket_start >= func.date_trunc("hour", _since(hours)),
+        )
+    )
+    stats = DurationStats()
+    for entered, seconds_sum, histogram in result.all():
+        stats.count += int(entered or 0)
+        stats.seconds_sum += float(seconds_sum or 0)
+        for index, value in enumerate((histogram or [])[: len(stats.histogram)]):
+            stats.histogram[index] += int(value or 0)
+    return stats
+
+
+async def get_quality_overview(db: AsyncSession) -> Dict[str, object]:
+    """Overall and per-phase average quality from a single rollup read"""
+    result = await db.execute(
+        select(PhaseQualityRollup.phase, PhaseQualityRollup.quality_sum, PhaseQualityRollup.quality_count)
+        .order_by(PhaseQualityRollup.phase)
+    )
+    rows = [(phase, quality_sum or 0, int(quality_count or 0)) for phase, quality_sum, quality_count in result.all()]
+    total_sum = sum(float(quality_sum) for _, quality_sum, _ in rows)
+    total_count = sum(count for _, _, count in rows)
+    return {
+        "average": total_sum / total_count if total_count else 0.0,
+        "by_phase": {
+            int(phase): (float(quality_sum) / count if count else 0.0) for phase, quality_sum, count in rows
+        },
+    }
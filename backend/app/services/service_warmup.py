@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+WarmupStep = Tuple[str, Callable[[], Awaitable[Any]]]
+
+
+async def _warm_storage_client() -> None:
+    from app.core import clients as core_clients
+
+    # 認証情報の解決と HTTP セッション生成はブロッキング
+    await asyncio.to_thread(core_clients.get_storage_client)
+
+
+async def _warm_asset_storage() -> None:
+    from app.services.asset_storage import asset_storage
+
+    await asset_storage.warm()
+
+
+async def _warm_vertex() -> None:
+    from app.services.vertex_ai_service import get_vertex_service
+
+    # 認証情報の読み込み・vertexai.init・モデル取得に数秒かかる
+    service = await asyncio.to_thread(get_vertex_service)
+    if not service.enabled:
+        logger.warning("Vertex AI is disabled after warm-up; generation will use stub responses")
+
+
+async def _warm_orchestrators() -> None:
+    from app.services.pipeline_service import get_hitl_orchestrator, get_pipeline_orchestrator
+
+    get_pipeline_orchestrator()
+    get_hitl_orchestrator()
+
+
+# Each stage runs after the previous one; steps within a stage run concurrently
+DEFAULT_STAGES: List[Sequence[WarmupStep]] = [
+    [
+        ("storage_client", _warm_storage_client),
+        ("asset_storage", _warm_asset_storage),
+        ("vertex_ai", _warm_vertex),
+    ],
+    [("orchestrators", _warm_orchestrators)],
+]
+
+
+class ServiceWarmup:
+    """Initializes long-lived clients and service singletons at startup
+
+    - The lifespan waits up to ``startup_warmup_timeout_seconds`` for warm-up,
+      so the server does not accept connections while clients are cold
+    - If that times out, warm-up continues in the background and
+      ``/health/ready`` answers 503 until it has finished
+    - A failed step is logged and reported but does not keep the instance out
+      of rotation; the affected singleton is created lazily on first use
+    """
+
+    def __init__(self, stages: Optional[List[Sequence[WarmupStep]]] = None) -> None:
+        self._stages = stages if stages is not None else DEFAULT_STAGES
+        self._task: Optional[asyncio.Task] = None
+        self._ready = False
+        self.durations: Dict[str, float] = {}
+        self.failures: Dict[str, str] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def start(self) -> asyncio.Task:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for warm-up (starting it if needed); True if it finished within ``timeout``"""
+        task = self.start()
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏳ Warm-up still running after {timeout}s; readiness stays closed until it finishes")
+        return self._ready
+
+    async def _run(self) -> None:
+        started = time.perf_counter()
+        for stage in self._stages:
+            await asyncio.gather(*(self._run_step(name, step) for name, step in stage))
+        self._ready = True
+        logger.info(f"🔥 Warm-up finished in {time.perf_counter() - started:.2f}s ({len(self.failures)} failed steps)")
+
+    async def _run_step(self, name: str, step: Callable[[], Awaitable[Any]]) -> None:
+        started = time.perf_counter()
+        try:
+            await step()
+        except Exception as e:
+            self.failures[name] = f"{type(e).__name__}: {e}"
+            logger.error(f"❌ Warm-up step {name} failed: {e}")
+        finally:
+            self.durations[name] = round(time.perf_counter() - started, 3)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "ready": self._ready,
+            "durations": dict(self.durations),
+            "failures": dict(self.failures),
+        }
+
+
+service_warmup = ServiceWarmup()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.loading import light_session_options
+from app.db.models import MangaSession, UserAccount
+
+_RESOLVER_INFO_KEY = "session_resolver"
+
+
+class SessionOwnershipCache:
+    """Short-TTL cross-request cache of request_id -> (session id, owner id)
+
+    Ownership does not change after creation, so this only lets non-owners be
+    rejected without a query; session rows themselves are never shared
+    across requests.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, UUID, Optional[UUID]]]" = OrderedDict()
+
+    def get(self, request_id: UUID | str) -> Optional[Tuple[UUID, Optional[UUID]]]:
+        key = str(request_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, session_id, user_id = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return session_id, user_id
+
+    def put(self, request_id: UUID | str, session_id: UUID, user_id: Optional[UUID]) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        key = str(request_id)
+        self._entries[key] = (time.monotonic(), session_id, user_id)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, request_id: UUID | str) -> None:
+        self._entries.pop(str(request_id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+session_ownership_cache = SessionOwnershipCache()
+
+
+def _owns(owner_id: Optional[UUID], user: Optional[UserAccount], allow_unowned: bool) -> bool:
+    if user is None:
+        return True
+    if owner_id is None:
+        return allow_unowned
+    return owner_id == user.id
+
+
+class SessionResolver:
+    """Request-scoped MangaSession lookup by request_id with ownership checks
+
+    One resolver lives in the request's AsyncSession (``db.info``), so every
+    service sharing that session resolves a given request_id at most once per
+    load profile: ``light`` (large columns deferred) or full.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self._sessions: Dict[UUID, Tuple[MangaSession, bool]] = {}
+        self.queries = 0
+
+    @classmethod
+    def for_db(cls, db: AsyncSession) -> "SessionResolver":
+        info = getattr(db, "info", None)
+        if not isinstance(info, dict):
+            return cls(db)
+        resolver = info.get(_RESOLVER_INFO_KEY)
+        if resolver is None:
+            resolver = info[_RESOLVER_INFO_KEY] = cls(db)
+        return resolver
+
+    def remember(self, session: MangaSession, *, light: bool) -> None:
+        """Register a session loaded elsewhere in this request (e.g. with eager-loaded children)"""
+        cached = self._sessions.get(session.request_id)
+        if cached is None or cached[1]:
+            self._sessions[session.request_id] = (session, light)
+        session_ownership_cache.put(session.request_id, session.id, session.user_id)
+
+    async def get(self, request_id: UUID, *, light: bool = True) -> Optional[MangaSession]:
+        cached = self._sessions.get(request_id)
+        if cached is not None and (light or not cached[1]):
+            return cached[0]
+
+        options = light_session_options() if light else ()
+        self.queries += 1
+        result = await self.db.execute(
+            select(MangaSession).options(*options).where(MangaSession.request_id == request_id)
+        )
+        session = result.scalar_one_or_none()
+        if session is not None:
+            self._sessions[request_id] = (session, light)
+            session_ownership_cache.put(request_id, session.id, session.user_id)
+        return session
+
+    async def get_owned(
+        self,
+        request_id: UUID,
+        user: Optional[UserAccount],
+        *,
+        light: bool = True,
+        allow_unowned: bool = False,
+    ) -> MangaSession:
+        """Resolve a session owned by ``user``; 404 otherwise (including for other users' sessions)
+
+        ``allow_unowned`` accepts sessions without a user_id (legacy anonymous sessions).
+        """
+        known = session_ownership_cache.get(request_id)
+        if known is not None and not _owns(known[1], user, allow_unowned):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+
+        session = await self.get(request_id, light=light)
+        if session is None or not _owns(session.user_id, user, allow_unowned):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+        return session
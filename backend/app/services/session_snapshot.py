@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import MangaSession
+
+logger = logging.getLogger(__name__)
+
+
+def status_version(updated_at: Optional[datetime]) -> int:
+    """Client-facing status version: ``manga_sessions.updated_at`` in epoch milliseconds
+
+    Derived from the persisted row, so a version issued by one instance can be
+    passed as ``since_version`` to any other.
+    """
+    if updated_at is None:
+        return 0
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return int(updated_at.timestamp() * 1000)
+
+
+@dataclass
+class SessionSnapshot:
+    """セッションの軽量スナップショット（ステータス・フェーズ・プレビュー要約・最近のメッセージ）"""
+
+    session_id: str
+    request_id: str
+    user_id: Optional[str]
+    project_id: Optional[str]
+    status: str
+    current_phase: Optional[int]
+    title: Optional[str]
+    updated_at: Optional[datetime]
+    version: int
+    loaded_at: float = field(default_factory=time.monotonic)
+    # None は「未ロード／無効化済み」を表す
+    phases: Optional[List[Dict[str, Any]]] = None
+    messages: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def status_version(self) -> int:
+        return status_version(self.updated_at)
+
+
+class SessionSnapshotStore:
+    """プロセス内のセッションスナップショットキャッシュ
+
+    書き込み側（パイプライン・各サービス）は apply_session_update / invalidate_* を呼び、
+    その度にグローバル世代番号が進む。読み込み側は DB 取得前に current_generation() を
+    記録し、取得中に同じセッションへの書き込みがあった場合はキャッシュへの格納を破棄する。
+    書き込みは wait_for_change で待機しているロングポーリング要求も起こす。
+    """
+
+    _SNAPSHOT_COLUMNS = (
+        MangaSession.id,
+        MangaSession.request_id,
+        MangaSession.user_id,
+        MangaSession.project_id,
+        MangaSession.status,
+        MangaSession.current_phase,
+        MangaSession.title,
+        MangaSession.updated_at,
+    )
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 2048) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._snapshots: "OrderedDict[str, SessionSnapshot]" = OrderedDict()
+        self._request_index: Dict[str, str] = {}
+        self._last_write: "OrderedDict[str, int]" = OrderedDict()
+        self._generation = itertools.count(1)
+        self._current_generation = 0
+        self._change_events: Dict[str, asyncio.Event] = {}
+        # 待機中のロングポール数。0 になったらイベントを破棄する（アイドルなセッションで溜まらないように）
+        self._change_waiters: Dict[str, int] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is None:
+            from app.core.settings import get_settings
+
+            self._ttl_seconds = float(get_settings().session_snapshot_ttl_seconds)
+        return self._ttl_seconds
+
+    def current_generation(self) -> int:
+        return self._current_generation
+
+    def _next_generation(self) -> int:
+        self._current_generation = next(self._generation)
+        return self._current_generation
+
+    def _mark_written(self, session_id: str) -> int:
+        generation = self._next_generation()
+        self._last_write[session_id] = generation
+        self._last_write.move_to_end(session_id)
+        while len(self._last_write) > self._max_entries * 4:
+            self._last_write.popitem(last=False)
+        event = self._change_events.pop(session_id, None)
+        if event is not None:
+            event.set()
+        return generation
+
+    def last_write(self, session_id: UUID | str) -> int:
+        return self._last_write.get(str(session_id), 0)
+
+    async def wait_for_change(
+        self,
+        session_ids: Iterable[UUID | str],
+        since_version: int,
+        timeout: float,
+    ) -> bool:
+        """いずれかのセッションに since_version より後の書き込みがあるまで待機する
+
+        Returns:
+            True if a change was observed, False on timeout
+        """
+        keys = [str(session_id) for session_id in session_ids]
+        if not keys:
+            return False
+        if any(self._last_write.get(key, 0) > since_version for key in keys):
+            return True
+
+        for key in keys:
+            self._change_waiters[key] = self._change_waiters.get(key, 0) + 1
+        events = [self._change_events.setdefault(key, asyncio.Event()) for key in keys]
+        waiters = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            done, _ = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            return bool(done)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+            for key in keys:
+                remaining = self._change_waiters.get(key, 0) - 1
+                if remaining > 0:
+                    self._change_waiters[key] = remaining
+                else:
+                    self._change_waiters.pop(key, None)
+                    self._change_events.pop(key, None)
+
+    def _written_since(self, session_id: str, token: int) -> bool:
+        return self._last_write.get(session_id, 0) > token
+
+    # ------------------------------------------------------------------ reads
+
+    def get_by_request(self, request_id: UUID | str) -> Optional[SessionSnapshot]:
+        session_id = self._request_index.get(str(request_id))
+        if session_id is None:
+            return None
+        snapshot = self._snapshots.get(session_id)
+        if snapshot is None:
+            self._request_index.pop(str(request_id), None)
+            return None
+        if self.ttl_seconds and time.monotonic() - snapshot.loaded_at > self.ttl_seconds:
+            self._drop(session_id)
+            return None
+        self._snapshots.move_to_end(session_id)
+        return snapshot
+
+    async def load(self, db: AsyncSession, request_id: UUID) -> Optional[SessionSnapshot]:
+        """キャッシュから返し、なければ必要な列だけを1クエリで取得して格納する"""
+        snapshot = self.get_by_request(request_id)
+        if snapshot is not None:
+            return snapshot
+
+        token = self.current_generation()
+        result = await db.execute(
+            select(*self._SNAPSHOT_COLUMNS).where(MangaSession.request_id == request_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        snapshot = SessionSnapshot(
+            session_id=str(row.id),
+            request_id=str(row.request_id),
+            user_id=str(row.user_id) if row.user_id else None,
+            project_id=str(row.project_id) if row.project_id else None,
+            status=row.status,
+            current_phase=row.current_phase,
+            title=row.title,
+            updated_at=row.updated_at,
+            version=token,
+        )
+        self._install(snapshot, token)
+        return snapshot
+
+    async def load_many(
+        self,
+        db: AsyncSession,
+        request_ids: Iterable[UUID],
+        user_id: UUID | str,
+    ) -> Dict[str, SessionSnapshot]:
+        """所有者が user_id のセッションをまとめて返す（キャッシュミス分は1クエリ）"""
+        owner = str(user_id)
+        snapshots: Dict[str, SessionSnapshot] = {}
+        missing: List[UUID] = []
+        for request_id in request_ids:
+            snapshot = self.get_by_request(request_id)
+            if snapshot is None:
+                missing.append(request_id)
+            elif snapshot.user_id == owner:
+                snapshots[snapshot.request_id] = snapshot
+
+        if missing:
+            token = self.current_generation()
+            result = await db.execute(
+                select(*self._SNAPSHOT_COLUMNS).where(
+                    MangaSession.request_id.in_(missing),
+                    MangaSession.user_id == user_id,
+                )
+            )
+            for row in result.all():
+                snapshot = SessionSnapshot(
+                    session_id=str(row.id),
+                    request_id=str(row.request_id),
+                    user_id=str(row.user_id) if row.user_id else None,
+                    project_id=str(row.project_id) if row.project_id else None,
+                    status=row.status,
+                    current_phase=row.current_phase,
+                    title=row.title,
+                    updated_at=row.updated_at,
+                    version=token,
+                )
+                self._install(snapshot, token)
+                snapshots[snapshot.request_id] = snapshot
+
+        return snapshots
+
+    async def refresh(self, db: AsyncSession, request_id: UUID) -> Optional[SessionSnapshot]:
+        """キャッシュを捨てて DB から読み直す（他インスタンスによる更新を拾うため）"""
+        self._forget_requests([request_id])
+        return await self.load(db, request_id)
+
+    async def refresh_many(
+        self,
+        db: AsyncSession,
+        request_ids: Iterable[UUID | str],
+        user_id: UUID | str,
+    ) -> Dict[str, SessionSnapshot]:
+        request_ids = list(request_ids)
+        self._forget_requests(request_ids)
+        return await self.load_many(db, request_ids, user_id)
+
+    def _forget_requests(self, request_ids: Iterable[UUID | str]) -> None:
+        for request_id in request_ids:
+            session_id = self._request_index.get(str(request_id))
+            if session_id is not None:
+                self._drop(session_id)
+
+    def remember(self, session: MangaSession, token: Optional[int] = None) -> SessionSnapshot:
+        """ロード済みの MangaSession からスナップショットを作成して格納する"""
+        token = self.current_generation() if token is None else token
+        snapshot = SessionSnapshot(
+            session_id=str(session.id),
+            request_id=str(session.request_id),
+            user_id=str(session.user_id) if session.user_id else None,
+            project_id=str(session.project_id) if session.project_id else None,
+            status=session.status,
+            current_phase=session.current_phase,
+            title=session.title,
+            updated_at=session.updated_at,
+            version=token,
+        )
+        self._install(snapshot, token)
+        return snapshot
+
+    def set_parts(
+        self,
+        session_id: UUID | str,
+        token: int,
+        *,
+        phases: Optional[List[Dict[str, Any]]] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """遅延ロードしたプレビュー要約・メッセージを格納する（token 以降に書き込みがあれば破棄）"""
+        key = str(session_id)
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or self._written_since(key, token):
+            return
+        if phases is not None:
+            snapshot.phases = phases
+        if messages is not None:
+            snapshot.messages = messages
+
+    def _install(self, snapshot: SessionSnapshot, token: int) -> None:
+        if self._written_since(snapshot.session_id, token):
+            # 取得中に更新があった: 古い内容をキャッシュしない
+            return
+        self._snapshots[snapshot.session_id] = snapshot
+        self._snapshots.move_to_end(snapshot.session_id)
+        self._request_index[snapshot.request_id] = snapshot.session_id
+        while len(self._snapshots) > self._max_entries:
+            evicted_id, evicted = self._snapshots.popitem(last=False)
+            self._request_index.pop(evicted.request_id, None)
+
+    def _drop(self, session_id: str) -> None:
+        snapshot = self._snapshots.pop(session_id, None)
+        if snapshot is not None:
+            self._request_index.pop(snapshot.request_id, None)
+
+    # ----------------------------------------------------------------- writes
+
+    def apply_session_update(self, session_id: UUID | str, **values: Any) -> int:
+        """セッション行の更新を反映する（status / current_phase / updated_at / title / project_id）"""
+        key = str(session_id)
+        generation = self._mark_written(key)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            changes = {
+                name: values[name]
+                for name in ("status", "current_phase", "updated_at", "title")
+                if values.get(name) is not None
+            }
+            if values.get("project_id") is not None:
+                changes["project_id"] = str(values["project_id"])
+            self._snapshots[key] = replace(snapshot, version=generation, **changes)
+        return generation
+
+    def invalidate_phases(self, session_id: UUID | str) -> int:
+        key = str(session_id)
+        generation = self._mark_written(key)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            snapshot.phases = None
+            snapshot.version = generation
+        return generation
+
+    def invalidate_messages(self, session_id: UUID | str) -> int:
+        key = str(session_id)
+        generation = self._mark_written(key)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            snapshot.messages = None
+            snapshot.version = generation
+        return generation
+
+    def invalidate(self, session_id: UUID | str) -> int:
+        key = str(session_id)
+        generation = self._mark_written(key)
+        self._drop(key)
+        return generation
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._request_index.clear()
+
+
+session_snapshot_store = SessionSnapshotStore()
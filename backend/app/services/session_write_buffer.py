@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import update
+
+from app.db.models.manga_session import MangaSession, MangaSessionStatus
+from app.services.session_snapshot import session_snapshot_store
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({MangaSessionStatus.COMPLETED.value, MangaSessionStatus.FAILED.value})
+
+
+class SessionStatusWriteBuffer:
+    """セッション行の status / current_phase / タイムスタンプ更新をまとめて書き込むバッファ
+
+    - 更新は即座にスナップショットへ反映し、DB への UPDATE はセッション単位でマージする
+    - フェーズ境界（current_phase の変更）と終了状態（completed / failed）は即時 flush
+    - それ以外は flush_interval 秒後にまとめて flush
+    - 終了状態の UPDATE は DB 上の status が異なる場合にのみ適用する（エラー経路での重複
+      FAILED など）。他の書き込み元（照合ジョブ・リトライ）が行を変えうるため、プロセス内の
+      記憶では判定しない
+    """
+
+    def __init__(self, flush_interval_seconds: Optional[float] = None, max_tracked: int = 4096) -> None:
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_tracked = max_tracked
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._factories: Dict[str, Optional[Callable[[], Any]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # ロック解放用に最近 flush したセッションを覚えておく（値は保持しない）
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self.writes = 0
+        self.coalesced = 0
+
+    @property
+    def flush_interval_seconds(self) -> float:
+        if self._flush_interval_seconds is None:
+            from app.core.settings import get_settings
+
+            self._flush_interval_seconds = float(get_settings().session_status_flush_interval_seconds)
+        return self._flush_interval_seconds
+
+    def pending(self, session_id: UUID | str) -> Dict[str, Any]:
+        return dict(self._pending.get(str(session_id), {}))
+
+    async def update(
+        self,
+        session_id: UUID | str,
+        values: Dict[str, Any],
+        *,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush: bool = False,
+    ) -> None:
+        """Merge ``values`` into the pending write; flush now on phase boundaries / terminal states"""
+        key = str(session_id)
+        values = {"updated_at": datetime.utcnow(), **values}
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending.setdefault(key, {}).update(values)
+        if session_factory is not None:
+            self._factories[key] = session_factory
+        session_snapshot_store.apply_session_update(key, **values)
+
+        if flush or "current_phase" in values or values.get("status") in TERMINAL_STATUSES:
+            await self.flush(key)
+        elif key not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(
+                self.flush_interval_seconds,
+                lambda: asyncio.ensure_future(self._flush_quietly(key)),
+            )
+
+    async def flush(self, session_id: UUID | str) -> bool:
+        """Write the merged pending values for one session; returns True if a write was issued"""
+        key = str(session_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            values = self._pending.pop(key, None)
+            session_factory = self._factories.pop(key, None)
+            if not values:
+                return False
+
+            try:
+                await self._write(key, values, session_factory)
+            except Exception:
+                # 失敗した値は後続の更新を優先しつつ戻す
+                merged = {**values, **self._pending.get(key, {})}
+                self._pending[key] = merged
+                if session_factory is not None:
+                    self._factories.setdefault(key, session_factory)
+                raise
+
+            self.writes += 1
+            self._recent[key] = None
+            self._recent.move_to_end(key)
+            while len(self._recent) > self._max_tracked:
+                evicted, _ = self._recent.popitem(last=False)
+                if evicted not in self._pending:
+                    self._locks.pop(evicted, None)
+            return True
+
+    async def flush_all(self) -> None:
+        for key in list(self._pending):
+            await self._flush_quietly(key)
+
+    def forget(self, session_id: UUID | str) -> None:
+        key = str(session_id)
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        self._pending.pop(key, None)
+        self._factories.pop(key, None)
+        self._recent.pop(key, None)
+        self._locks.pop(key, None)
+
+    async def _flush_quietly(self, key: str) -> None:
+        try:
+            await self.flush(key)
+        except Exception as exc:
+            logger.error(f"Failed to flush buffered session status for {key}: {exc}")
+
+    @staticmethod
+    def _statement(key: str, values: Dict[str, Any]):
+        statement = update(MangaSession).where(MangaSession.id == UUID(key)).values(**values)
+        status = values.get("status")
+        if status in TERMINAL_STATUSES:
+            # 既に同じ終了状態なら書き込まない（重複 FAILED など）
+            statement = statement.where(MangaSession.status.is_distinct_from(status))
+        return statement
+
+    async def _write(self, key: str, values: Dict[str, Any], session_factory) -> None:
+        statement = self._statement(key, values)
+        if session_factory is None:
+            from app.core.db import session_scope
+
+            async with session_scope(workload="status_write_behind") as db_session:
+                await db_session.execute(statement)
+            return
+
+        async with session_factory() as db_session:
+            async with db_session.begin():
+                await db_session.execute(statement)
+
+
+session_status_buffer = SessionStatusWriteBuffer()
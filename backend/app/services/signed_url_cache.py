@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PreviewCacheMetadata
+
+logger = logging.getLogger(__name__)
+
+
+def public_url(bucket: str, storage_path: str) -> str:
+    return f"https://storage.googleapis.com/{bucket}/{storage_path}"
+
+
+def _sign(bucket: str, storage_path: str, expiration: datetime) -> str:
+    from app.core import clients as core_clients
+
+    blob = core_clients.get_storage_client().bucket(bucket).blob(storage_path)
+    return blob.generate_signed_url(expiration=expiration, method="GET", version="v4")
+
+
+class SignedUrlCache:
+    """Two-tier cache of V4 signed GET URLs
+
+    - L1: process-local LRU keyed by ``bucket/path``
+    - L2: ``preview_cache_metadata`` rows, for preview objects (needs the
+      owning PreviewVersion); shared across instances and restarts
+    - URLs are reused until ``refresh_margin_seconds`` before expiry
+    - Misses are signed in a worker thread (RSA signing is CPU-bound) and
+      concurrent misses for the same object share one signing call
+    - If signing fails the public URL is returned and nothing is cached
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: Optional[int] = None,
+        refresh_margin_seconds: Optional[int] = None,
+        max_entries: int = 8192,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.signed = 0
+
+    @property
+    def ttl_seconds(self) -> int:
+        if self._ttl_seconds is None:
+            from app.core.settings import get_settings
+
+            self._ttl_seconds = int(get_settings().signed_url_ttl_seconds)
+        return self._ttl_seconds
+
+    @property
+    def refresh_margin_seconds(self) -> int:
+        if self._refresh_margin_seconds is None:
+            from app.core.settings import get_settings
+
+            self._refresh_margin_seconds = int(get_settings().signed_url_refresh_margin_seconds)
+        return self._refresh_margin_seconds
+
+    def url_epoch(self) -> int:
+        """Changes every refresh margin; part of ETags of responses that embed signed URLs
+
+        A URL handed out is valid for at least the margin, so a client that
+        revalidates into a new epoch never keeps a body with expired URLs.
+        """
+        return int(time.time() // max(1, self.refresh_margin_seconds))
+
+    def _usable_until(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.refresh_margin_seconds)
+
+    def _remember(self, key: str, url: str, expires_at: datetime) -> None:
+        self._entries[key] = (url, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_url(
+        self,
+        bucket: str,
+        storage_path: str,
+        *,
+        db: Optional[AsyncSession] = None,
+        version_id: Optional[UUID] = None,
+        phase: Optional[int] = None,
+    ) -> str:
+        """Signed URL for ``bucket/storage_path``; pass ``db`` + ``version_id`` to use the L2 table"""
+        key = f"{bucket}/{storage_path}"
+        usable_until = self._usable_until()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > usable_until:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        use_table = db is not None and version_id is not None
+        if use_table:
+            row = (
+                await db.execute(
+                    select(PreviewCacheMetadata.signed_url, PreviewCacheMetadata.expires_at).where(
+                        PreviewCacheMetadata.cache_key == key,
+                        PreviewCacheMetadata.expires_at > usable_until,
+                    )
+                )
+            ).first()
+            if row is not None:
+                self._remember(key, row.signed_url, row.expires_at)
+                return row.signed_url
+
+        signed = await self._sign_once(key, bucket, storage_path)
+        if signed is None:
+            return public_url(bucket, storage_path)
+        url, expires_at = signed
+
+        if use_table:
+            await self._store(db, key, url, expires_at, version_id=version_id, phase=phase)
+        return url
+
+    async def _sign_once(self, key: str, bucket: str, storage_path: str) -> Optional[Tuple[str, datetime]]:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            try:
+                url = await asyncio.to_thread(_sign, bucket, storage_path, expires_at)
+            except Exception as exc:
+                logger.warning(f"Signing {key} failed, falling back to public URL: {exc}")
+                result = None
+            else:
+                self.signed += 1
+                self._remember(key, url, expires_at)
+                result = (url, expires_at)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.cancel()
+
+    async def _store(
+        self,
+        db: AsyncSession,
+        key: str,
+        url: str,
+        expires_at: datetime,
+        *,
+        version_id: UUID,
+        phase: Optional[int],
+    ) -> None:
+        statement = insert(PreviewCacheMetadata).values(
+            cache_key=key,
+            version_id=version_id,
+            phase=phase or 0,
+            quality_level=0,
+            signed_url=url,
+            expires_at=expires_at,
+            created_at=datetime.utcnow(),
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[PreviewCacheMetadata.cache_key],
+                set_={"signed_url": statement.excluded.signed_url, "expires_at": statement.excluded.expires_at},
+            )
+        )
+
+    def purge_expired(self) -> int:
+        now = datetime.utcnow()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._entries.pop(key, None)
+        return len(expired)
+
+    async def sweep_expired(self, db: AsyncSession) -> int:
+        """Delete expired L2 rows (and drop expired L1 entries); returns the deleted row count"""
+        self.purge_expired()
+        result = await db.execute(
+            delete(PreviewCacheMetadata).where(PreviewCacheMetadata.expires_at <= datetime.utcnow())
+        )
+        return int(result.rowcount or 0)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+signed_url_cache = SignedUrlCache()
+
+
+async def start_signed_url_sweep(interval_minutes: Optional[int] = None):
+    """Periodically delete expired preview_cache_metadata rows (leader-only job)"""
+    from app.core.db import session_scope
+
+    if interval_minutes is None:
+        from app.core.settings import get_settings
+
+        interval_minutes = get_settings().signed_url_sweep_interval_minutes
+    logger.info(f"🧹 Starting signed URL cache sweep (every {interval_minutes} minutes)")
+
+    while True:
+        try:
+            await asyncio.sleep(interval_minutes * 60)
+            async with session_scope(workload="signed_url_sweep") as db_session:
+                deleted = await signed_url_cache.sweep_expired(db_session)
+            if deleted:
+                logger.info(f"🧹 Removed {deleted} expired signed URL cache rows")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Signed URL cache sweep failed: {e}")
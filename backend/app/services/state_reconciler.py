@@ -6,19 +6,23 @@ Phase 3: Detect and fix inconsistent session states
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update, and_, or_
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.manga_session import MangaSession, MangaSessionStatus
 from app.core.db import session_scope
 from app.services.realtime_hub import realtime_hub
 from app.services.emergency_stop import EmergencyStopManager
+from app.services.session_snapshot import session_snapshot_store
 
 logger = logging.getLogger(__name__)
 
+# Legacy status string (not in MangaSessionStatus) still reconciled for old rows
+PROCESSING_STATUS = "processing"
+
 
 class StateReconciler:
     """
@@ -32,11 +36,32 @@ class StateReconciler:
     STALE_QUEUED_MINUTES = 15   # Sessions stuck in QUEUED for 15+ minutes
     STALE_PROCESSING_MINUTES = 45  # Sessions stuck in PROCESSING for 45+ minutes
 
+    # Result of the most recent reconciliation run (read by health checks; never triggers a run)
+    last_run_stats: Optional[Dict[str, Any]] = None
+    last_run_at: Optional[datetime] = None
+    run_interval_minutes: int = 10
+
+    # Notifications are published after commit, this many at a time
+    NOTIFY_BATCH_SIZE = 100
+
+    @classmethod
+    def _stale_rules(cls) -> List[Tuple[str, str, int]]:
+        """(status, stats key, stale minutes) for each reconciled state"""
+        return [
+            (MangaSessionStatus.RUNNING.value, "running", cls.STALE_RUNNING_MINUTES),
+            (MangaSessionStatus.QUEUED.value, "queued", cls.STALE_QUEUED_MINUTES),
+            (PROCESSING_STATUS, "processing", cls.STALE_PROCESSING_MINUTES),
+        ]
+
     @classmethod
     async def reconcile_all_sessions(cls) -> Dict[str, Any]:
         """
         Perform comprehensive state reconciliation
 
+        One set-based ``UPDATE ... RETURNING`` per stale state (served by the
+        partial (status, updated_at) index); notifications are sent in batches
+        after the transaction commits.
+
         Returns:
             Statistics about reconciliation actions performed
         """
@@ -51,181 +76,81 @@ class StateReconciler:
             "notifications_sent": 0,
             "errors": 0
         }
+        notifications: List[Tuple[Optional[UUID], str]] = []
+        fixed_ids: List[UUID] = []
 
         try:
-            async with session_scope() as db_session:
-                # Find all potentially inconsistent sessions
-                inconsistent_sessions = await cls._find_inconsistent_sessions(db_session)
-                stats["total_checked"] = len(inconsistent_sessions)
-
-                logger.info(f"Found {len(inconsistent_sessions)} potentially inconsistent sessions")
-
-                for session in inconsistent_sessions:
-                    try:
-                        action_taken = await cls._fix_session_state(db_session, session)
-                        if action_taken:
-                            stats[f"stale_{action_taken}_fixed"] += 1
-                            stats["notifications_sent"] += 1
-                    except Exception as e:
-                        logger.error(f"Failed to fix session {session.id}: {e}")
-                        stats["errors"] += 1
-
-                # Commit all changes
-                await db_session.commit()
+            async with session_scope(workload="reconciliation") as db_session:
+                for status, key, minutes in cls._stale_rules():
+                    reason = f"Session stale in {status.upper()} state for over {minutes} minutes"
+                    rows = await cls._fail_stale_sessions(db_session, status, minutes, reason)
+                    stats[f"stale_{key}_fixed"] = len(rows)
+                    for session_id, request_id in rows:
+                        fixed_ids.append(session_id)
+                        notifications.append((request_id, reason))
+            stats["total_checked"] = len(fixed_ids)
+            logger.info(f"Failed {len(fixed_ids)} stale sessions")
 
         except Exception as e:
             logger.error(f"State reconciliation failed: {e}")
             stats["errors"] += 1
+            notifications.clear()
+            fixed_ids.clear()
 
+        for session_id in fixed_ids:
+            session_snapshot_store.invalidate(session_id)
+        stats["notifications_sent"] = await cls._send_reconciliation_notifications(notifications)
+
+        cls.last_run_stats = dict(stats)
+        cls.last_run_at = datetime.utcnow()
         logger.info(f"✅ State reconciliation completed: {stats}")
         return stats
 
     @classmethod
-    async def _find_inconsistent_sessions(cls, db_session: AsyncSession) -> List[MangaSession]:
-        """Find sessions with potentially inconsistent states"""
-        now = datetime.utcnow()
-
-        # Calculate cutoff times for different states
-        running_cutoff = now - timedelta(minutes=cls.STALE_RUNNING_MINUTES)
-        queued_cutoff = now - timedelta(minutes=cls.STALE_QUEUED_MINUTES)
-        processing_cutoff = now - timedelta(minutes=cls.STALE_PROCESSING_MINUTES)
-
-        # Query for stale sessions
-        result = await db_session.execute(
-            select(MangaSession).where(
-                or_(
-                    # Sessions stuck in RUNNING state
-                    and_(
-                        MangaSession.status == MangaSessionStatus.RUNNING.value,
-                        MangaSession.updated_at < running_cutoff
-                    ),
-                    # Sessions stuck in QUEUED state
-                    and_(
-                        MangaSession.status == MangaSessionStatus.QUEUED.value,
-                        MangaSession.updated_at < queued_cutoff
-                    ),
-                    # Sessions stuck in PROCESSING state
-                    and_(
-                        MangaSession.status == MangaSessionStatus.PROCESSING.value,
-                        MangaSession.updated_at < processing_cutoff
-                    )
-                )
-            )
-        )
-
-        return result.scalars().all()
-
-    @classmethod
-    async def _fix_session_state(
+    async def _fail_stale_sessions(
         cls,
         db_session: AsyncSession,
-        session: MangaSession
-    ) -> Optional[str]:
-        """
-        Fix an inconsistent session state
-
-        Args:
-            db_session: Database session
-            session: Session to fix
-
-        Returns:
-            String describing the action taken, or None if no action needed
-        """
+        status: str,
+        stale_minutes: int,
+        reason: str
+    ) -> List[Tuple[UUID, Optional[UUID]]]:
+        """Mark sessions stuck in ``status`` as FAILED; returns (id, request_id) of the updated rows"""
         now = datetime.utcnow()
-        time_since_update = now - session.updated_at
+        cutoff = now - timedelta(minutes=stale_minutes)
 
-        logger.warning(
-            f"🔧 Fixing stale session {session.id}: "
-            f"status={session.status}, stale_for={time_since_update}"
-        )
-
-        # Determine the appropriate action based on current state and staleness
-        if session.status == MangaSessionStatus.RUNNING.value:
-            return await cls._fix_stale_running_session(db_session, session, time_since_update)
-        elif session.status == MangaSessionStatus.QUEUED.value:
-            return await cls._fix_stale_queued_session(db_session, session, time_since_update)
-        elif session.status == MangaSessionStatus.PROCESSING.value:
-            return await cls._fix_stale_processing_session(db_session, session, time_since_update)
-
-        return None
-
-    @classmethod
-    async def _fix_stale_running_session(
-        cls,
-        db_session: AsyncSession,
-        session: MangaSession,
-        time_since_update: timedelta
-    ) -> str:
-        """Fix a session stuck in RUNNING state"""
-        reason = f"Session stale in RUNNING state for {time_since_update}"
-
-        # Update session to FAILED state
-        await db_session.execute(
+        result = await db_session.execute(
             update(MangaSession)
-            .where(MangaSession.id == session.id)
-            .values(
-                status=MangaSessionStatus.FAILED.value,
-                error_message=f"State reconciliation: {reason}",
-                updated_at=datetime.utcnow()
+            .where(
+                MangaSession.status == status,
+                MangaSession.updated_at < cutoff
             )
-        )
-
-        # Notify frontend immediately
-        await cls._send_reconciliation_notification(session.request_id, "FAILED", reason)
-
-        return "running"
-
-    @classmethod
-    async def _fix_stale_queued_session(
-        cls,
-        db_session: AsyncSession,
-        session: MangaSession,
-        time_since_update: timedelta
-    ) -> str:
-        """Fix a session stuck in QUEUED state"""
-        reason = f"Session stale in QUEUED state for {time_since_update}"
-
-        # Update session to FAILED state
-        await db_session.execute(
-            update(MangaSession)
-            .where(MangaSession.id == session.id)
             .values(
                 status=MangaSessionStatus.FAILED.value,
                 error_message=f"State reconciliation: {reason}",
-                updated_at=datetime.utcnow()
+                updated_at=now
             )
+            .returning(MangaSession.id, MangaSession.request_id)
+            .execution_options(synchronize_session=False)
         )
-
-        # Notify frontend immediately
-        await cls._send_reconciliation_notification(session.request_id, "FAILED", reason)
-
-        return "queued"
+        rows = [(row[0], row[1]) for row in result.all()]
+        if rows:
+            logger.warning(f"🔧 Failed {len(rows)} sessions stale in {status} for {stale_minutes}+ minutes")
+        return rows
 
     @classmethod
-    async def _fix_stale_processing_session(
+    async def _send_reconciliation_notifications(
         cls,
-        db_session: AsyncSession,
-        session: MangaSession,
-        time_since_update: timedelta
-    ) -> str:
-        """Fix a session stuck in PROCESSING state"""
-        reason = f"Session stale in PROCESSING state for {time_since_update}"
-
-        # Update session to FAILED state
-        await db_session.execute(
-            update(MangaSession)
-            .where(MangaSession.id == session.id)
-            .values(
-                status=MangaSessionStatus.FAILED.value,
-                error_message=f"State reconciliation: {reason}",
-                updated_at=datetime.utcnow()
-            )
-        )
-
-        # Notify frontend immediately
-        await cls._send_reconciliation_notification(session.request_id, "FAILED", reason)
-
-        return "processing"
+        notifications: List[Tuple[Optional[UUID], str]]
+    ) -> int:
+        """Publish FAILED notifications in batches; returns the number attempted"""
+        notifications = [(request_id, reason) for request_id, reason in notifications if request_id is not None]
+        for start in range(0, len(notifications), cls.NOTIFY_BATCH_SIZE):
+            batch = notifications[start:start + cls.NOTIFY_BATCH_SIZE]
+            await asyncio.gather(*(
+                cls._send_reconciliation_notification(request_id, "FAILED", reason)
+                for request_id, reason in batch
+            ))
+        return len(notifications)
 
     @classmethod
     async def _send_reconciliation_notification(
@@ -300,7 +225,7 @@ class StateReconciler:
             return time_since_update < timedelta(minutes=cls.STALE_RUNNING_MINUTES)
         elif session.status == MangaSessionStatus.QUEUED.value:
             return time_since_update < timedelta(minutes=cls.STALE_QUEUED_MINUTES)
-        elif session.status == MangaSessionStatus.PROCESSING.value:
+        elif session.status == PROCESSING_STATUS:
             return time_since_update < timedelta(minutes=cls.STALE_PROCESSING_MINUTES)
 
         return True
@@ -321,15 +246,20 @@ class StateReconciler:
             return "Session appears stuck in RUNNING state - consider emergency stop"
         elif session.status == MangaSessionStatus.QUEUED.value and minutes_stale > cls.STALE_QUEUED_MINUTES:
             return "Session appears stuck in QUEUED state - check task queue health"
-        elif session.status == MangaSessionStatus.PROCESSING.value and minutes_stale > cls.STALE_PROCESSING_MINUTES:
+        elif session.status == PROCESSING_STATUS and minutes_stale > cls.STALE_PROCESSING_MINUTES:
             return "Session appears stuck in PROCESSING state - check pipeline health"
 
         return "Session appears healthy"
 
 
 # Periodic reconciliation task
-async def start_periodic_reconciliation(interval_minutes: int = 10):
+async def start_periodic_reconciliation(interval_minutes: Optional[int] = None):
     """Start a background task for periodic state reconciliation"""
+    if interval_minutes is None:
+        from app.core.settings import get_settings
+
+        interval_minutes = get_settings().reconcile_interval_minutes
+    StateReconciler.run_interval_minutes = interval_minutes
     logger.info(f"🔄 Starting periodic state reconciliation (every {interval_minutes} minutes)")
 
     while True:
@@ -9,7 +9,9 @@ from fastapi import WebSocket
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.loading import light_session_options
 from app.db.models import SessionEvent, MangaSession, UserAccount
+from app.services.session_snapshot import session_snapshot_store
 
 
 class WebSocketManager:
@@ -112,33 +114,42 @@ class WebSocketService:
 
     async def _send_initial_data(self, websocket: WebSocket, session: MangaSession):
         """Send initial session data to a new websocket connection."""
-        # Get recent messages
-        from app.services.message_service import MessageService
-        from app.services.phase_preview_service import PhasePreviewService
+        token = session_snapshot_store.current_generation()
+        snapshot = session_snapshot_store.get_by_request(session.request_id) or session_snapshot_store.remember(session)
 
-        message_service = MessageService(self.db)
-        preview_service = PhasePreviewService(self.db)
+        messages = snapshot.messages
+        phases = snapshot.phases
 
-        # Get session owner (simplified for this context)
-        user_query = select(UserAccount).where(UserAccount.id == session.user_id)
-        result = await self.db.execute(user_query)
-        user = result.scalar_one()
+        # スナップショットに無い部分のみDBから読み込む（再接続時はクエリ不要）
+        if messages is None or phases is None:
+            from app.services.message_service import MessageService
+            from app.services.phase_preview_service import PhasePreviewService
 
-        # Get messages and previews
-        messages = await message_service.get_session_messages(session.request_id, user, limit=20)
-        previews = await preview_service.get_phase_previews(session.request_id, user)
+            # Get session owner (simplified for this context)
+            user_query = select(UserAccount).where(UserAccount.id == session.user_id)
+            result = await self.db.execute(user_query)
+            user = result.scalar_one()
+
+            if messages is None:
+                message_list = await MessageService(self.db).get_session_messages(session.request_id, user, limit=20)
+                messages = [msg.dict() for msg in message_list.messages]
+            if phases is None:
+                previews = await PhasePreviewService(self.db).get_phase_previews(session.request_id, user)
+                phases = [preview.dict() for preview in previews]
+
+            session_snapshot_store.set_parts(session.id, token, phases=phases, messages=messages)
 
         initial_data = {
             "type": "initial_data",
             "session": {
-                "id": str(session.id),
-                "request_id": str(session.request_id),
-                "status": session.status,
-                "current_phase": session.current_phase,
-                "title": session.title,
+                "id": snapshot.session_id,
+                "request_id": snapshot.request_id,
+                "status": snapshot.status,
+                "current_phase": snapshot.current_phase,
+                "title": snapshot.title,
             },
-            "messages": [msg.dict() for msg in messages.messages],
-            "phases": [preview.dict() for preview in previews],
+            "messages": messages,
+            "phases": phases,
         }
 
         await websocket.send_text(json.dumps(initial_data))
@@ -182,6 +193,7 @@ class WebSocketService:
 
         query = (
             select(MangaSession)
+            .options(*light_session_options())
             .where(MangaSession.request_id == request_id)
             .where(MangaSession.user_id == current_user.id)
         )
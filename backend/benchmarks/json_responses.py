@@ -0,0 +1,142 @@
+"""Serialization cost of the heaviest read endpoints per response path.
+
+Compares, for synthetic payloads shaped like production data:
+
+- ``default``: validated models + FastAPI response_model handling
+  (dump, re-validate, serialize) + stdlib ``JSONResponse``
+- ``fast_json``: the same with the app-wide ``FastJSONResponse``
+- ``trusted``: ``model_construct`` + ``model_response`` (one pydantic-core pass)
+
+Usage: ``python -m benchmarks.json_responses [--panels 120] [--repeat 200]``
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.responses import ORJSON_AVAILABLE, FastJSONResponse, model_response
+from app.api.schemas.manga import PhasePreviewResponse, SessionDetailResponse
+
+PHASES = 7
+
+
+def _phase_data(phase: int, panels: int) -> Dict[str, Any]:
+    return {
+        "phaseId": phase,
+        "data": {
+            "panels": [
+                {
+                    "panelId": index,
+                    "description": "主人公が街角で空を見上げる印象的なシーン" * 2,
+                    "characters": ["主人公", "相棒"],
+                    "dialogues": [{"speaker": "主人公", "text": "行こう！", "position": [0.2, 0.8]}] * 3,
+                    "cameraAngle": "ローアングル",
+                    "quality": 0.87,
+                }
+                for index in range(panels)
+            ],
+        },
+        "metadata": {"processingTimeMs": 1234, "quality": 0.87, "confidence": 0.92, "attempt": 1},
+    }
+
+
+def _preview_values(panels: int) -> List[Dict[str, Any]]:
+    now = datetime(2025, 10, 1, 12, 0, 0)
+    return [
+        {
+            "id": f"result-{phase}",
+            "session_id": "session-1",
+            "phase_number": phase,
+            "preview_type": "text",
+            "content": "プレビュー本文" * 20,
+            "image_url": None,
+            "document_url": None,
+            "progress": 100,
+            "status": "completed",
+            "metadata": _phase_data(phase, panels),
+            "created_at": now,
+            "updated_at": now + timedelta(minutes=phase),
+        }
+        for phase in range(1, PHASES + 1)
+    ]
+
+
+def _session_values(panels: int) -> Dict[str, Any]:
+    return {
+        "session_id": "session-1",
+        "request_id": "request-1",
+        "status": "completed",
+        "current_phase": PHASES,
+        "started_at": datetime(2025, 10, 1, 12, 0, 0),
+        "completed_at": datetime(2025, 10, 1, 12, 20, 0),
+        "retry_count": 0,
+        "phase_results": [_phase_data(phase, panels) for phase in range(1, PHASES + 1)],
+        "preview_versions": [_phase_data(phase, panels)["data"] for phase in range(1, PHASES + 1)],
+        "project_id": None,
+    }
+
+
+def _fastapi_path(response_class, annotation, build: Callable[[], Any]) -> Callable[[], bytes]:
+    """Models built with validation, then FastAPI's response_model dump / validate / serialize"""
+    adapter = TypeAdapter(annotation)
+
+    def run() -> bytes:
+        models = build()
+        dumped = [m.model_dump() for m in models] if isinstance(models, list) else models.model_dump()
+        content = adapter.dump_python(adapter.validate_python(dumped), mode="json")
+        return response_class(content).body
+
+    return run
+
+
+def _time_per_call(func: Callable[[], bytes], repeat: int) -> tuple[float, int]:
+    size = len(func())
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--panels", type=int, default=120, help="panels per phase payload")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    previews = _preview_values(args.panels)
+    session = _session_values(args.panels)
+    cases = {
+        "GET /sessions/{id}/phases": (
+            list[PhasePreviewResponse],
+            lambda: [PhasePreviewResponse(**values) for values in previews],
+            lambda: [PhasePreviewResponse.model_construct(**values) for values in previews],
+        ),
+        "GET /sessions/{id}": (
+            SessionDetailResponse,
+            lambda: SessionDetailResponse(**session),
+            lambda: SessionDetailResponse.model_construct(**session),
+        ),
+    }
+
+    print(f"orjson available: {ORJSON_AVAILABLE}; panels/phase={args.panels}; repeat={args.repeat}")
+    print(f"{'endpoint':<28} {'path':<10} {'ms/req':>8} {'speedup':>8} {'bytes':>9}")
+    for endpoint, (annotation, validated, trusted) in cases.items():
+        paths = {
+            "default": _fastapi_path(JSONResponse, annotation, validated),
+            "fast_json": _fastapi_path(FastJSONResponse, annotation, validated),
+            "trusted": lambda trusted=trusted: model_response(trusted()).body,
+        }
+        baseline = None
+        for name, func in paths.items():
+            elapsed, size = _time_per_call(func, args.repeat)
+            baseline = baseline or elapsed
+            print(f"{endpoint:<28} {name:<10} {elapsed:>8.3f} {baseline / elapsed:>7.1f}x {size:>9}")
+
+
+if __name__ == "__main__":
+    main()
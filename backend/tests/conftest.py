@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, AsyncMock
 from uuid import uuid4
 
@@ -12,6 +13,49 @@ def event_loop():
     loop.close()
 
 
+class FakeScopes:
+    """session_scope stand-in recording the statements of each transaction
+
+    ``results`` is either a sequence served one per ``execute`` in order, or
+    a callable building the result for a statement.
+    """
+
+    def __init__(self, results):
+        self._results = results if callable(results) else list(results)
+        self.transactions = []
+
+    @property
+    def statements(self):
+        return [statement for transaction in self.transactions for statement in transaction]
+
+    def _result(self, statement):
+        if callable(self._results):
+            return self._results(statement)
+        return self._results.pop(0)
+
+    def __call__(self, workload=None):
+        @asynccontextmanager
+        async def scope():
+            statements = []
+            self.transactions.append(statements)
+            db = AsyncMock()
+
+            async def execute(statement, *args, **kwargs):
+                statements.append(statement)
+                return self._result(statement)
+
+            db.execute = execute
+            yield db
+
+        return scope()
+
+
+@pytest.fixture
+def fake_scopes():
+    """Factory for FakeScopes, to patch in for session_scope"""
+    return FakeScopes
+
+
 @pytest.fixture
 def mock_async_session():
     """Mock SQLAlchemy async session for database operations"""
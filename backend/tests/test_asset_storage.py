@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.services.asset_storage import AssetStorage, LocalStorageBackend, StorageBackend, iter_chunks
+
+
+class RecordingBackend(StorageBackend):
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.objects = {}
+        self.streamed = []
+
+    async def _enter(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+    async def upload_bytes(self, path, data, content_type):
+        await self._enter()
+        self.objects[path] = data
+
+    async def upload_stream(self, path, chunks, content_type):
+        received = [chunk async for chunk in chunks]
+        await self._enter()
+        self.streamed.append(path)
+        self.objects[path] = b"".join(received)
+        return sum(len(chunk) for chunk in received)
+
+
+class TestAssetStorage:
+    @pytest.mark.asyncio
+    async def test_upload_many_is_bounded(self):
+        backend = RecordingBackend(delay=0.01)
+        storage = AssetStorage(backend, max_concurrency=2, chunk_bytes=1024)
+
+        paths = await storage.upload_many((f"img-{i}.png", b"x", "image/png") for i in range(6))
+
+        assert paths == [f"img-{i}.png" for i in range(6)]
+        assert backend.peak == 2
+        assert storage.uploaded_bytes == 6
+
+    @pytest.mark.asyncio
+    async def test_large_payload_is_streamed(self):
+        backend = RecordingBackend()
+        storage = AssetStorage(backend, max_concurrency=1, chunk_bytes=4)
+
+        await storage.upload("book.pdf", b"0123456789", content_type="application/pdf")
+        await storage.upload("small.png", b"012", content_type="image/png")
+
+        assert backend.streamed == ["book.pdf"]
+        assert backend.objects["book.pdf"] == b"0123456789"
+
+    @pytest.mark.asyncio
+    async def test_background_failures_are_reported_not_raised(self):
+        class FailingBackend(RecordingBackend):
+            async def upload_bytes(self, path, data, content_type):
+                if path == "bad.png":
+                    raise RuntimeError("boom")
+                await super().upload_bytes(path, data, content_type)
+
+        storage = AssetStorage(FailingBackend(), max_concurrency=2, chunk_bytes=1024)
+        tasks = [storage.start_upload("good.png", b"a"), storage.start_upload("bad.png", b"b")]
+
+        assert await AssetStorage.wait_for(tasks) == ["good.png"]
+
+
+class TestLocalStorageBackend:
+    @pytest.mark.asyncio
+    async def test_round_trip_and_stream(self, tmp_path):
+        storage = AssetStorage(LocalStorageBackend(tmp_path), max_concurrency=2, chunk_bytes=3)
+
+        await storage.upload("a/b/small.txt", b"hi")
+        await storage.upload("a/big.bin", b"abcdefgh")
+
+        assert await storage.download("a/b/small.txt") == b"hi"
+        assert await storage.download("a/big.bin") == b"abcdefgh"
+        assert sorted(p.name for p in (tmp_path / "a").iterdir()) == ["b", "big.bin"]
+
+        await storage.delete("a/big.bin")
+        assert not (tmp_path / "a" / "big.bin").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_leaves_nothing_behind(self, tmp_path):
+        backend = LocalStorageBackend(tmp_path)
+
+        async def broken():
+            yield b"part"
+            raise RuntimeError("generator failed")
+
+        with pytest.raises(RuntimeError):
+            await backend.upload_stream("out.pdf", broken(), "application/pdf")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_paths_outside_root(self, tmp_path):
+        backend = LocalStorageBackend(tmp_path / "root")
+        with pytest.raises(ValueError):
+            await backend.upload_bytes("../escape.txt", b"x", "text/plain")
+
+
+@pytest.mark.asyncio
+async def test_iter_chunks():
+    assert [c async for c in iter_chunks(b"abcde", 2)] == [b"ab", b"cd", b"e"]
@@ -0,0 +1,95 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy.dialects import postgresql
+
+from app.api.conditional import etag_matches, make_etag, not_modified_response
+from app.api.routes import manga as manga_routes
+from app.api.schemas.manga import PhasePreviewResponse
+from app.services.resource_versions import phase_results_version
+
+
+def _request(if_none_match=None, query=b"") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": query})
+
+
+class TestConditionalHelpers:
+    def test_etag_is_strong_and_stable(self):
+        stamp = datetime(2025, 10, 1, 12, 0)
+        etag = make_etag("phases", 1, [(1, "completed", stamp)])
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("phases", 1, [(1, "completed", stamp)])
+        assert etag != make_etag("phases", 1, [(1, "running", stamp)])
+
+    def test_if_none_match_parsing(self):
+        etag = make_etag("x")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+    def test_not_modified_response_sets_validators(self):
+        etag = make_etag("x")
+        response = Response()
+
+        assert not_modified_response(_request(), response, etag) is None
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        not_modified = not_modified_response(_request(etag), Response(), etag)
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.body == b""
+
+
+class TestPhasePreviewEtags:
+    @pytest.mark.asyncio
+    async def test_validator_query_reads_only_version_columns(self):
+        db = AsyncMock()
+        db.execute.return_value.all = lambda: []
+
+        assert await phase_results_version(db, uuid4(), uuid4(), phase=2) is None
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith(
+            "SELECT phase_results.phase, phase_results.status, phase_results.updated_at, "
+            "phase_results.preview_version_id \nFROM phase_results JOIN manga_sessions"
+        )
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_loading_previews(self):
+        request_id = uuid4()
+        user = SimpleNamespace(id=uuid4())
+        versions = [(1, "completed", datetime(2025, 10, 1), uuid4())]
+        etag = make_etag("phase", request_id, versions, 7)
+
+        preview = PhasePreviewResponse.model_construct(id="1", phase_number=1, metadata={"k": "v"})
+
+        with patch.object(manga_routes, "phase_results_version", AsyncMock(return_value=versions)), patch.object(
+            manga_routes.PhasePreviewService, "get_phase_preview", AsyncMock(return_value=preview)
+        ) as load, patch.object(manga_routes.signed_url_cache, "url_epoch", return_value=7) as url_epoch:
+            result = await manga_routes.get_phase_preview(
+                request_id, 1, _request(etag), Response(), db=AsyncMock(), current_user=user
+            )
+            assert result.status_code == 304
+            load.assert_not_awaited()
+
+            result = await manga_routes.get_phase_preview(
+                request_id, 1, _request('"stale"'), Response(), db=AsyncMock(), current_user=user
+            )
+            load.assert_awaited_once()
+            assert result.status_code == 200
+            assert result.headers["ETag"] == etag
+            assert result.headers["content-length"] == str(len(result.body))
+
+            # 署名 URL の epoch が進むと保持中の ETag は一致しなくなる
+            url_epoch.return_value = 8
+            result = await manga_routes.get_phase_preview(
+                request_id, 1, _request(etag), Response(), db=AsyncMock(), current_user=user
+            )
+            assert result.status_code == 200
@@ -0,0 +1,174 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.asset_storage import AssetStorage, LocalStorageBackend
+from app.services.content_store import ContentStore, blob_path, compute_digest, content_digest
+
+
+def _result(scalar=None, rows=()):
+    result = Mock()
+    result.scalar.return_value = scalar
+    result.__iter__ = lambda self: iter(rows)
+    return result
+
+
+class BlobTable:
+    """In-memory content_blobs with row locks held until the transaction ends"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.locks = {}
+
+    def __call__(self, workload):
+        @asynccontextmanager
+        async def scope():
+            held = []
+            db = AsyncMock()
+
+            async def execute(statement, *args, **kwargs):
+                if statement.is_select:
+                    for digest, row in self.rows.items():
+                        if row["ref_count"] <= 0 and digest not in self.locks:
+                            self.locks[digest] = asyncio.Event()
+                            held.append(digest)
+                    return [
+                        Mock(digest=d, storage_path=blob_path(d), uploaded_at=self.rows[d]["uploaded_at"])
+                        for d in held
+                    ]
+                if statement.is_delete:
+                    for digest in held:
+                        self.rows.pop(digest, None)
+                    return _result()
+                digest = statement.compile().params["digest_1" if statement.is_update else "digest"]
+                while digest in self.locks:
+                    await self.locks[digest].wait()
+                if statement.is_update:
+                    self.rows[digest]["uploaded_at"] = datetime.utcnow()
+                    return _result()
+                row = self.rows.setdefault(digest, {"uploaded_at": None, "ref_count": 0})
+                return _result(scalar=row["uploaded_at"])
+
+            db.execute = execute
+            try:
+                yield db
+            finally:
+                for digest in held:
+                    self.locks.pop(digest).set()
+
+        return scope()
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _store(tmp_path, scopes, **kwargs) -> ContentStore:
+    storage = AssetStorage(LocalStorageBackend(tmp_path), max_concurrency=2, chunk_bytes=1024)
+    return ContentStore(storage, scope=scopes, gc_grace_minutes=60, **kwargs)
+
+
+class TestContentStore:
+    @pytest.mark.asyncio
+    async def test_new_content_is_uploaded_once_under_its_digest(self, tmp_path, fake_scopes):
+        scopes = fake_scopes([_result(scalar=None), _result()])
+        store = _store(tmp_path, scopes)
+
+        stored = await store.put(b"panel", content_type="image/png")
+
+        digest = content_digest(b"panel")
+        assert stored.storage_path == blob_path(digest) == f"blobs/sha256/{digest[:2]}/{digest}"
+        assert not stored.deduplicated
+        assert (tmp_path / stored.storage_path).read_bytes() == b"panel"
+        assert "ON CONFLICT (digest) DO UPDATE" in _sql(scopes.statements[0])
+        assert "UPDATE content_blobs SET uploaded_at" in _sql(scopes.statements[1])
+
+    @pytest.mark.asyncio
+    async def test_existing_content_is_metadata_only(self, tmp_path, fake_scopes):
+        scopes = fake_scopes([_result(scalar=object())])
+        store = _store(tmp_path, scopes)
+
+        stored = await store.put(b"panel", content_type="image/png")
+
+        assert stored.deduplicated
+        assert store.uploads == 0 and store.deduplicated == 1
+        assert len(scopes.statements) == 1
+        assert not (tmp_path / stored.storage_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_puts_of_same_content_share_one_write(self, tmp_path, fake_scopes):
+        scopes = fake_scopes([_result(scalar=None), _result()])
+        store = _store(tmp_path, scopes)
+
+        results = await asyncio.gather(*(store.put(b"same", content_type="image/png") for _ in range(4)))
+
+        assert {r.digest for r in results} == {content_digest(b"same")}
+        assert store.uploads == 1
+        assert len(scopes.statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_are_hashed_in_a_thread(self):
+        with patch("app.services.content_store.THREADED_DIGEST_BYTES", 4), \
+                patch("app.services.content_store.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await compute_digest(b"tiny") == content_digest(b"tiny")
+            assert to_thread.call_count == 0
+            assert await compute_digest(b"larger") == content_digest(b"larger")
+            assert to_thread.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_deletes_objects_before_rows(self, tmp_path, fake_scopes):
+        (tmp_path / "blobs").mkdir()
+        (tmp_path / "blobs" / "old").write_bytes(b"x")
+        rows = [
+            Mock(digest="old", storage_path="blobs/old", uploaded_at=object()),
+            Mock(digest="never", storage_path="blobs/never", uploaded_at=None),
+        ]
+        scopes = fake_scopes([_result(rows=rows), _result()])
+        store = _store(tmp_path, scopes)
+
+        assert await store.collect_garbage() == 2
+
+        select_sql, delete_sql = (_sql(statement) for statement in scopes.statements)
+        assert "ref_count <= " in select_sql and "FOR UPDATE SKIP LOCKED" in select_sql
+        assert delete_sql.startswith("DELETE FROM content_blobs") and "ref_count <= " in delete_sql
+        assert not (tmp_path / "blobs" / "old").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_object_delete_keeps_row(self, tmp_path, fake_scopes):
+        rows = [Mock(digest="old", storage_path="blobs/old", uploaded_at=object())]
+        scopes = fake_scopes([_result(rows=rows)])
+        store = _store(tmp_path, scopes)
+        store._storage.delete = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+        assert await store.collect_garbage() == 0
+        assert len(scopes.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_put_during_garbage_collection_keeps_fresh_object(self, tmp_path):
+        digest = content_digest(b"panel")
+        table = BlobTable({digest: {"uploaded_at": datetime(2025, 1, 1), "ref_count": 0}})
+        store = _store(tmp_path, table)
+        storage_delete = store.storage.delete
+        put_task = None
+
+        async def delete_racing_put(path):
+            # GC がロックを保持している間に同じ内容の put が始まる
+            nonlocal put_task
+            put_task = asyncio.create_task(store.put(b"panel", content_type="image/png"))
+            await asyncio.sleep(0.01)
+            assert not put_task.done()
+            await storage_delete(path)
+
+        store._storage.delete = delete_racing_put
+        await store.storage.upload(blob_path(digest), b"panel", content_type="image/png")
+
+        assert await store.collect_garbage() == 1
+        stored = await put_task
+
+        assert not stored.deduplicated
+        assert (tmp_path / stored.storage_path).read_bytes() == b"panel"
+        assert table.rows[digest]["uploaded_at"] is not None
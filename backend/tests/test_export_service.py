@@ -0,0 +1,102 @@
+import io
+import json
+import zipfile
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.asset_storage import AssetStorage, LocalStorageBackend
+from app.services.export_service import ExportPlan, stream_ndjson, stream_zip
+
+
+def _plan(session_id, phases=3, assets=()):
+    return ExportPlan(
+        name=f"session-{session_id}",
+        header={"type": "session", "session_id": str(session_id)},
+        phase_keys=[(session_id, phase) for phase in range(1, phases + 1)],
+        assets=list(assets),
+    )
+
+
+def _phase_rows(statement):
+    """phase_results rows for the (session_id, phase) keys a batch selects"""
+    return [
+        SimpleNamespace(
+            session_id=session_id,
+            phase=phase,
+            status="completed",
+            quality_score=None,
+            content={"phaseId": phase, "data": {"text": "本文" * 10}},
+            updated_at=datetime(2025, 10, 1, 12, phase),
+        )
+        for session_id, phase in statement.whereclause.right.value
+    ]
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestExportStreams:
+    @pytest.mark.asyncio
+    async def test_ndjson_yields_one_line_per_record(self, fake_scopes):
+        session_id = uuid4()
+        asset = {"type": "generated_image", "storage_path": "blobs/sha256/ab/abc", "content_type": "image/png"}
+
+        with patch("app.core.db.session_scope", fake_scopes(_phase_rows)):
+            chunks = await _collect(stream_ndjson(_plan(session_id, phases=5, assets=[asset])))
+
+        records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        assert [r["type"] for r in records] == ["session"] + ["phase_result"] * 5 + ["generated_image"]
+        assert [r["phase"] for r in records[1:6]] == [1, 2, 3, 4, 5]
+        assert len(chunks) == 7
+
+    @pytest.mark.asyncio
+    async def test_batches_use_separate_transactions(self, fake_scopes):
+        session_id = uuid4()
+        scopes = fake_scopes(_phase_rows)
+
+        from app.services.export_service import iter_phase_results
+
+        with patch("app.core.db.session_scope", scopes):
+            records = [record async for record in iter_phase_results(_plan(session_id, phases=5), batch_size=2)]
+
+        assert len(records) == 5
+        assert [
+            [phase for _, phase in statement.whereclause.right.value]
+            for (statement,) in scopes.transactions
+        ] == [[1, 2], [3, 4], [5]]
+
+    @pytest.mark.asyncio
+    async def test_zip_contains_phases_assets_and_manifest(self, tmp_path, fake_scopes):
+        session_id = uuid4()
+        storage = AssetStorage(LocalStorageBackend(tmp_path), max_concurrency=1, chunk_bytes=1024)
+        await storage.upload("blobs/sha256/ab/abc", b"\x89PNG-data")
+        assets = [
+            {"type": "generated_image", "storage_path": "blobs/sha256/ab/abc", "content_type": "image/png"},
+            {"type": "generated_image", "storage_path": "blobs/sha256/ab/abc", "content_type": "image/png"},
+            {"type": "asset", "storage_path": "projects/p/final/x.pdf", "content_type": "application/pdf"},
+        ]
+
+        with patch("app.core.db.session_scope", fake_scopes(_phase_rows)):
+            body = b"".join(await _collect(stream_zip(_plan(session_id, phases=2, assets=assets), storage)))
+
+        archive = zipfile.ZipFile(io.BytesIO(body))
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names == [
+            f"phases/{session_id}/phase-1.json",
+            f"phases/{session_id}/phase-2.json",
+            "assets/blobs/sha256/ab/abc.png",
+            "manifest.json",
+        ]
+        assert archive.getinfo("assets/blobs/sha256/ab/abc.png").compress_type == zipfile.ZIP_STORED
+        assert archive.read("assets/blobs/sha256/ab/abc.png") == b"\x89PNG-data"
+
+        manifest = json.loads(archive.read("manifest.json"))
+        assert [a.get("file") for a in manifest["assets"]] == ["assets/blobs/sha256/ab/abc.png"] * 2 + [None]
+        assert manifest["assets"][2]["missing"] is True
+        assert json.loads(archive.read(f"phases/{session_id}/phase-2.json"))["content"]["phaseId"] == 2
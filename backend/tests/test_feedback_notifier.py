@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from uuid import uuid4
+
+from app.services.feedback_notifier import FeedbackNotifier
+
+
+class TestFeedbackNotifier:
+    """Test suite for FeedbackNotifier"""
+
+    @pytest.fixture
+    def notifier(self):
+        return FeedbackNotifier()
+
+    @pytest.mark.asyncio
+    async def test_notify_local_wakes_registered_waiter(self, notifier):
+        """Waiters registered for (session, phase) are resolved by notify_local"""
+        session_id = uuid4()
+        waiter = notifier.register(session_id, 1)
+
+        assert notifier.notify_local(session_id, 1) == 1
+        await asyncio.wait_for(waiter, timeout=0.1)
+        assert notifier.waiter_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_notify_other_phase_does_not_wake(self, notifier):
+        """Notifications are scoped to a single (session, phase)"""
+        session_id = uuid4()
+        waiter = notifier.register(session_id, 1)
+
+        assert notifier.notify_local(session_id, 2) == 0
+        assert not waiter.done()
+
+        notifier.unregister(session_id, 1, waiter)
+        assert notifier.waiter_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_pg_notification_payload_wakes_waiter(self, notifier):
+        """LISTEN payloads '<session_id>:<phase>' resolve matching waiters"""
+        session_id = uuid4()
+        waiter = notifier.register(session_id, 3)
+
+        notifier._on_notification(None, 0, "hitl_feedback", f"{session_id}:3")
+        assert waiter.done()
+
+    @pytest.mark.asyncio
+    async def test_malformed_payload_is_ignored(self, notifier):
+        """Malformed payloads are logged and ignored"""
+        waiter = notifier.register(uuid4(), 1)
+        notifier._on_notification(None, 0, "hitl_feedback", "garbage")
+        assert not waiter.done()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_contained_in_savepoint(self, notifier):
+        """A failed pg_notify rolls back only its savepoint, never the caller's transaction"""
+        events = []
+        savepoint = MagicMock()
+        savepoint.__aenter__ = AsyncMock(side_effect=lambda: events.append("savepoint"))
+
+        async def exit_savepoint(exc_type, exc, tb):
+            events.append("rollback to savepoint" if exc_type else "release")
+            return False
+
+        savepoint.__aexit__ = AsyncMock(side_effect=exit_savepoint)
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.begin_nested.return_value = savepoint
+        db.execute = AsyncMock(side_effect=RuntimeError("notify failed"))
+
+        await notifier.publish(db, uuid4(), 1)
+
+        assert events == ["savepoint", "rollback to savepoint"]
+        db.execute.assert_awaited_once()
+
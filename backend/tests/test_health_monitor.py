@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from app.services.health_monitor import HealthMonitor, HealthStatus, SystemHealthReport
+from app.services.leader_election import LeaderElection
+from app.services.state_reconciler import StateReconciler
+
+
+def _leader(is_leader: bool = True):
+    return patch.object(LeaderElection, "is_leader", new_callable=PropertyMock, return_value=is_leader)
+
+
+def _report(age_seconds: float = 0) -> SystemHealthReport:
+    return SystemHealthReport(
+        overall_status=HealthStatus.HEALTHY,
+        score=100,
+        metrics=[],
+        recommendations=[],
+        timestamp=datetime.utcnow() - timedelta(seconds=age_seconds),
+    )
+
+
+class TestCachedHealthReport:
+    @pytest.mark.asyncio
+    async def test_fresh_report_is_served_from_cache(self):
+        monitor = HealthMonitor()
+        monitor._latest_report = _report(age_seconds=5)
+        monitor._build_report = AsyncMock()
+
+        report = await monitor.get_system_health(max_age_seconds=60)
+
+        assert report is monitor.latest_report
+        monitor._build_report.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stale_reads_share_one_rebuild(self):
+        monitor = HealthMonitor()
+        monitor._latest_report = _report(age_seconds=600)
+        calls = 0
+
+        async def build():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            monitor._latest_report = _report()
+            return monitor._latest_report
+
+        monitor._build_report = build
+
+        reports = await asyncio.gather(*(monitor.get_system_health(max_age_seconds=60) for _ in range(5)))
+
+        assert calls == 1
+        assert all(report is reports[0] for report in reports)
+
+
+class TestHealthChecksAreReadOnly:
+    @pytest.mark.asyncio
+    async def test_state_consistency_uses_last_reconciliation(self):
+        monitor = HealthMonitor()
+        with _leader(), \
+                patch.object(StateReconciler, "last_run_stats", {"stale_running_fixed": 2, "errors": 0}), \
+                patch.object(StateReconciler, "last_run_at", datetime.utcnow()), \
+                patch.object(StateReconciler, "reconcile_all_sessions", AsyncMock()) as reconcile:
+            metrics = await monitor._check_state_consistency()
+
+        reconcile.assert_not_awaited()
+        by_name = {metric.name: metric for metric in metrics}
+        assert by_name["state_consistency_issues"].value == 2
+        assert by_name["state_reconciliation_age_minutes"].status == HealthStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_state_consistency_unknown_before_first_run(self):
+        monitor = HealthMonitor()
+        with _leader(), patch.object(StateReconciler, "last_run_stats", None):
+            metrics = await monitor._check_state_consistency()
+
+        assert [metric.status for metric in metrics] == [HealthStatus.UNKNOWN]
+
+    @pytest.mark.asyncio
+    async def test_state_consistency_skipped_on_followers(self):
+        """Reconciliation runs on the leader only, so followers have no result to report"""
+        monitor = HealthMonitor()
+        with _leader(False), patch.object(StateReconciler, "last_run_stats", None):
+            metrics = await monitor._check_state_consistency()
+
+        assert metrics == []
@@ -213,31 +213,33 @@ class TestHITLCapablePipelineOrchestrator:
 
     @pytest.mark.asyncio
     async def test_get_hitl_service(self, orchestrator):
-        """Test HITL service getter with caching"""
-        mock_db = AsyncMock()
+        """HITL service is bound to the caller's DB session, never cached on the shared orchestrator"""
+        first_db = AsyncMock()
+        second_db = AsyncMock()
 
-        # First call should create service
-        service1 = await orchestrator._get_hitl_service(mock_db)
-        assert service1 is not None
-        assert orchestrator._hitl_service is service1
+        service1 = await orchestrator._get_hitl_service(first_db)
+        service2 = await orchestrator._get_hitl_service(second_db)
 
-        # Second call should return cached service
-        service2 = await orchestrator._get_hitl_service(mock_db)
-        assert service2 is service1
+        assert service1.db is first_db
+        assert service2.db is second_db
+        assert service1 is not service2
 
     @pytest.mark.asyncio
     async def test_get_hitl_state_manager(self, orchestrator):
-        """Test HITL state manager getter with caching"""
-        mock_db = AsyncMock()
+        """State managers are per call but share the active HITL sessions"""
+        first_db = AsyncMock()
+        second_db = AsyncMock()
 
-        # First call should create state manager
-        manager1 = await orchestrator._get_hitl_state_manager(mock_db)
-        assert manager1 is not None
-        assert orchestrator._hitl_state_manager is manager1
+        manager1 = await orchestrator._get_hitl_state_manager(first_db)
+        manager2 = await orchestrator._get_hitl_state_manager(second_db)
 
-        # Second call should return cached manager
-        manager2 = await orchestrator._get_hitl_state_manager(mock_db)
-        assert manager2 is manager1
+        assert manager1.db is first_db
+        assert manager2.db is second_db
+        assert manager1.active_sessions is manager2.active_sessions
+
+        session_id = uuid4()
+        manager1.active_sessions[session_id] = HITLSessionContext(session_id, 1)
+        assert session_id in manager2.active_sessions
 
     @pytest.mark.asyncio
     async def test_notify_feedback_required(self, orchestrator, mock_session, test_result):
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from app.services import leader_election as module
+from app.services.leader_election import LeaderElection, advisory_lock_key
+
+
+def _election(**kwargs) -> LeaderElection:
+    return LeaderElection("test-jobs", renew_interval_seconds=0.01, lease_seconds=5, instance_id="me", **kwargs)
+
+
+class TestLeaderElection:
+    def test_lock_key_is_stable_signed_bigint(self):
+        key = advisory_lock_key("background-jobs")
+        assert key == advisory_lock_key("background-jobs")
+        assert key != advisory_lock_key("other-jobs")
+        assert -(2 ** 63) <= key < 2 ** 63
+
+    @pytest.mark.asyncio
+    async def test_non_postgres_instance_leads(self):
+        election = _election()
+        engine = Mock()
+        engine.dialect.name = "sqlite"
+        with patch("app.core.db.get_engine", return_value=engine):
+            await election._try_acquire()
+
+        assert election.is_leader
+        assert election.describe()["leader"] == "me"
+
+    @pytest.mark.asyncio
+    async def test_lease_expiry_revokes_leadership(self):
+        election = _election()
+        election._set_leader(True)
+        election._lease_expires_at = 0
+
+        assert not election.is_leader
+
+    @pytest.mark.asyncio
+    async def test_singleton_job_runs_only_while_leader(self):
+        election = _election()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def job():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        runner = asyncio.create_task(election.run_while_leader(job, job_name="job"))
+        await asyncio.sleep(0)
+        assert not started.is_set()
+
+        election._set_leader(True)
+        await asyncio.wait_for(started.wait(), 1)
+
+        election._set_leader(False)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+    @staticmethod
+    def _postgres(acquired: bool):
+        app_engine = Mock()
+        app_engine.dialect.name = "postgresql"
+        connection = AsyncMock()
+        result = MagicMock()
+        result.scalar.return_value = acquired
+        result.first.return_value = None
+        connection.execute = AsyncMock(return_value=result)
+        lock_engine = Mock()
+        lock_engine.connect = AsyncMock(return_value=connection)
+        lock_engine.dispose = AsyncMock()
+        return app_engine, lock_engine, connection
+
+    @pytest.mark.asyncio
+    async def test_step_down_discards_lock_connection(self):
+        """The lock connection is non-pooled and invalidated, so Postgres drops the advisory lock"""
+        election = _election()
+        app_engine, lock_engine, connection = self._postgres(acquired=True)
+        with patch("app.core.db.get_engine", return_value=app_engine), \
+                patch.object(module, "create_async_engine", return_value=lock_engine) as create:
+            await election._try_acquire()
+            assert election.is_leader
+
+            await election._step_down()
+
+        assert create.call_args.kwargs["poolclass"] is module.NullPool
+        assert not election.is_leader
+        connection.invalidate.assert_awaited_once()
+        connection.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_discards_connection(self):
+        election = _election()
+        app_engine, lock_engine, connection = self._postgres(acquired=False)
+        with patch("app.core.db.get_engine", return_value=app_engine), \
+                patch.object(module, "create_async_engine", return_value=lock_engine):
+            await election._try_acquire()
+            await election.release()
+
+        assert not election.is_leader
+        connection.invalidate.assert_awaited_once()
+        lock_engine.dispose.assert_awaited_once()
+
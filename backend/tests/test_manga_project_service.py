@@ -0,0 +1,57 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.db.models import MangaAsset, MangaProject
+from app.db.models.manga_asset import MangaAssetType
+from app.services.manga_project_service import MangaProjectService
+from app.services.project_service import ProjectService
+
+
+class TestMangaProjectDetail:
+    @pytest.mark.asyncio
+    async def test_detail_serializes_assets(self, mock_async_session):
+        user = Mock(id=uuid4())
+        now = datetime.utcnow()
+        project = MangaProject(
+            id=uuid4(),
+            user_id=user.id,
+            title="Sample",
+            status="completed",
+            visibility="private",
+            created_at=now,
+            updated_at=now,
+        )
+        asset = MangaAsset(
+            id=uuid4(),
+            project_id=project.id,
+            asset_type=MangaAssetType.PDF,
+            phase=5,
+            storage_path="projects/sample/manga.pdf",
+            content_type="application/pdf",
+            asset_metadata={"pages": 8},
+        )
+        project.assets = [asset]
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = project
+        mock_async_session.execute = AsyncMock(return_value=result)
+
+        with patch.object(ProjectService, "asset_url", AsyncMock(return_value="https://signed/manga.pdf")):
+            detail = await MangaProjectService(mock_async_session).get_project_detail(project.id, user)
+
+        assert detail.files == {
+            "assets": [
+                {
+                    "id": str(asset.id),
+                    "asset_type": "pdf",
+                    "phase": 5,
+                    "content_type": "application/pdf",
+                    "storage_path": "projects/sample/manga.pdf",
+                    "url": "https://signed/manga.pdf",
+                    "metadata": {"pages": 8},
+                }
+            ]
+        }
@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import SessionMessage
+from app.services.pagination import (
+    ApproximateCountCache,
+    InvalidCursorError,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+
+
+class TestCursor:
+    """Cursor encoding helpers"""
+
+    def test_round_trip_datetime(self):
+        created_at = datetime(2025, 9, 25, 12, 30, 15, 123456)
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+    def test_round_trip_string(self):
+        row_id = uuid4()
+        assert decode_cursor(encode_cursor("My Project", row_id)) == ("My Project", row_id)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "eyJrIjoxfQ"])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestKeyset:
+    """apply_keyset / split_page"""
+
+    def test_seek_predicate_and_order(self):
+        cursor = encode_cursor(datetime(2025, 1, 1), uuid4())
+        query = apply_keyset(
+            select(SessionMessage),
+            SessionMessage.created_at,
+            SessionMessage.id,
+            descending=True,
+            cursor=cursor,
+            limit=20,
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "session_messages.created_at < " in sql
+        assert "session_messages.id < " in sql
+        assert "ORDER BY session_messages.created_at DESC, session_messages.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert query._limit == 21
+
+    def test_split_page_emits_cursor_only_when_more_rows(self):
+        rows = [SimpleNamespace(id=uuid4(), created_at=datetime(2025, 1, day)) for day in range(1, 4)]
+
+        items, next_cursor = split_page(rows, 2, "created_at")
+        assert items == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+
+        items, next_cursor = split_page(rows, 3, "created_at")
+        assert items == rows
+        assert next_cursor is None
+
+
+class TestApproximateCountCache:
+    """Cached totals"""
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached_until_invalidated(self):
+        cache = ApproximateCountCache(ttl_seconds=60)
+        result = Mock()
+        result.scalar_one.return_value = 42
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+        query = select(SessionMessage)
+
+        assert await cache.count(db, "key", query) == (42, False)
+        assert await cache.count(db, "key", query) == (42, True)
+        db.execute.assert_awaited_once()
+
+        cache.invalidate("key")
+        assert await cache.count(db, "key", query) == (42, False)
+        assert db.execute.await_count == 2
@@ -0,0 +1,128 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.services import phase_preview_service
+from app.services.phase_preview_service import PhasePreviewService, preview_images
+
+
+def _preview_row(phase, **columns):
+    row = Mock()
+    row.id = uuid4()
+    row.session_id = uuid4()
+    row.phase = phase
+    row.status = "completed"
+    row.created_at = datetime.utcnow()
+    row.updated_at = datetime.utcnow()
+    row.preview_version_id = uuid4()
+    row.is_delta = False
+    row.image_paths = None
+    for key, value in columns.items():
+        setattr(row, key, value)
+    return row
+
+
+def _db_returning(rows):
+    result = Mock()
+    result.all.return_value = rows
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestPhasePreviewService:
+    """Test suite for PhasePreviewService.get_phase_previews"""
+
+    @pytest.mark.asyncio
+    async def test_previews_resolved_in_single_query(self):
+        """All phases come back from one DISTINCT ON query"""
+        rows = [
+            _preview_row(phase, version_data={"content": f"phase {phase}", "image_url": None})
+            for phase in range(1, 8)
+        ]
+        db = _db_returning(rows)
+
+        previews = await PhasePreviewService(db).get_phase_previews(uuid4(), Mock(id=uuid4()))
+
+        assert [preview.phase_number for preview in previews] == list(range(1, 8))
+        assert previews[0].content == "phase 1"
+        assert previews[0].metadata == {"content": "phase 1", "image_url": None}
+        db.execute.assert_awaited_once()
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "DISTINCT ON (preview_versions.phase)" in sql
+        assert "array_agg(generated_images.storage_path ORDER BY generated_images.created_at)" in sql
+
+    @pytest.mark.asyncio
+    async def test_stored_images_are_signed_under_their_preview_version(self):
+        row = _preview_row(4, version_data={}, image_paths=["blobs/a", "blobs/b", "blobs/a"])
+        db = _db_returning([row])
+        get_url = AsyncMock(side_effect=lambda bucket, path, **kwargs: f"https://signed/{path}")
+
+        with patch("app.core.settings.get_settings", return_value=Mock(gcs_bucket_preview="previews")), \
+                patch.object(phase_preview_service.signed_url_cache, "get_url", get_url):
+            previews = await PhasePreviewService(db).get_phase_previews(uuid4(), Mock(id=uuid4()))
+
+        assert previews[0].image_urls == ["https://signed/blobs/a", "https://signed/blobs/b"]
+        get_url.assert_awaited_with(
+            "previews", "blobs/b", db=db, version_id=row.preview_version_id, phase=4
+        )
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_field_mask_skips_version_data(self):
+        """Omitting metadata selects only extracted keys, not the JSON blob"""
+        db = _db_returning([_preview_row(1, image_url="https://example/img.png", document_url=None)])
+
+        previews = await PhasePreviewService(db).get_phase_previews(uuid4(), Mock(id=uuid4()), fields=set())
+
+        assert previews[0].preview_type == "image"
+        assert previews[0].metadata is None
+        assert previews[0].content is None
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "preview_versions.version_data AS version_data" not in sql
+        assert "->>" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_result_checks_ownership(self):
+        """No rows falls back to the ownership lookup to return 404"""
+        empty = Mock()
+        empty.all.return_value = []
+        not_found = Mock()
+        not_found.scalar_one_or_none.return_value = None
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[empty, not_found])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await PhasePreviewService(db).get_phase_previews(uuid4(), Mock(id=uuid4()))
+        assert exc_info.value.status_code == 404
+
+
+class TestPreviewImages:
+    @pytest.mark.asyncio
+    async def test_images_join_latest_preview_version(self):
+        version_id = uuid4()
+        rows = [
+            Mock(phase=2, storage_path="blobs/a", version_id=version_id),
+            Mock(phase=2, storage_path="blobs/a", version_id=version_id),
+            Mock(phase=5, storage_path="blobs/b", version_id=None),
+        ]
+        db = _db_returning(rows)
+        get_url = AsyncMock(side_effect=lambda bucket, path, **kwargs: f"https://signed/{path}")
+
+        with patch("app.core.settings.get_settings", return_value=Mock(gcs_bucket_preview="previews")), \
+                patch.object(phase_preview_service.signed_url_cache, "get_url", get_url):
+            images = await preview_images(db, uuid4())
+
+        assert images == [
+            {"phase": 2, "storage_path": "blobs/a", "url": "https://signed/blobs/a"},
+            {"phase": 5, "storage_path": "blobs/b", "url": "https://signed/blobs/b"},
+        ]
+        assert get_url.await_args_list[0].kwargs == {"db": db, "version_id": version_id, "phase": 2}
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "LEFT OUTER JOIN" in sql and "DISTINCT ON (preview_versions.phase)" in sql
@@ -0,0 +1,32 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.phase_result_store import upsert_phase_result
+
+
+class TestUpsertPhaseResult:
+    """One phase_results row per (session_id, phase)"""
+
+    @pytest.mark.asyncio
+    async def test_insert_on_conflict_updates_given_columns(self):
+        row = Mock()
+        result = Mock()
+        result.one.return_value = row
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+
+        returned = await upsert_phase_result(db, uuid4(), 3, status="completed", quality_score=0.8)
+
+        assert returned is row
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO phase_results" in sql
+        assert "ON CONFLICT ON CONSTRAINT uq_phase_results_session_phase DO UPDATE SET" in sql
+        update_clause = sql.split("DO UPDATE SET", 1)[1]
+        assert "status = " in update_clause
+        assert "quality_score = " in update_clause
+        assert "updated_at = " in update_clause
+        assert "content = " not in update_clause
+        assert "RETURNING phase_results.id" in sql
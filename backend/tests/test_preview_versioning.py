@@ -0,0 +1,133 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from app.services import preview_versioning as module
+from app.services.preview_versioning import apply_patch, make_patch
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = module.PreviewReconstructionCache()
+    monkeypatch.setattr(module, "preview_reconstruction_cache", cache)
+    monkeypatch.setattr(module, "_checkpoint_interval", lambda: 3)
+    return cache
+
+
+class TestJsonPatch:
+    """make_patch / apply_patch round trips"""
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1, "b": {"c": [1, 2]}}, {"a": 1, "b": {"c": [1, 2, 3]}, "d": None}),
+            ({"a/b": 1, "x~y": 2}, {"a/b": 2}),
+            ({"flag": 1}, {"flag": True}),
+            ({"a": {"b": 1}}, ["replaced"]),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        assert apply_patch(old, make_patch(old, new)) == new
+
+    def test_unchanged_keys_are_not_repeated(self):
+        old = {"content": "x" * 1000, "progress": 10}
+        ops = make_patch(old, {"content": "x" * 1000, "progress": 20})
+        assert ops == [{"op": "replace", "path": "/progress", "value": 20}]
+
+    def test_apply_does_not_mutate_input(self):
+        old = {"a": {"b": 1}}
+        apply_patch(old, [{"op": "replace", "path": "/a/b", "value": 2}])
+        assert old == {"a": {"b": 1}}
+
+
+def _latest(version_id, depth):
+    result = Mock()
+    result.one_or_none.return_value = SimpleNamespace(id=version_id, delta_depth=depth) if version_id else None
+    return result
+
+
+class TestCreatePreviewVersion:
+    """Write path"""
+
+    @pytest.mark.asyncio
+    async def test_small_change_stored_as_delta(self, fresh_cache):
+        parent_id = uuid4()
+        parent_data = {"content": "x" * 500, "progress": 10}
+        fresh_cache.put(parent_id, parent_data)
+        db = AsyncMock()
+        db.add = Mock()
+        db.execute = AsyncMock(return_value=_latest(parent_id, 0))
+
+        version = await module.create_preview_version(
+            db, session_id=uuid4(), phase=1, version_data={"content": "x" * 500, "progress": 50}
+        )
+
+        assert version.version_data is None
+        assert version.version_delta == [{"op": "replace", "path": "/progress", "value": 50}]
+        assert version.parent_version_id == parent_id
+        assert version.delta_depth == 1
+        assert fresh_cache.get(version.id) == {"content": "x" * 500, "progress": 50}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_every_interval(self, fresh_cache):
+        parent_id = uuid4()
+        fresh_cache.put(parent_id, {"content": "x" * 500, "progress": 10})
+        db = AsyncMock()
+        db.add = Mock()
+        db.execute = AsyncMock(return_value=_latest(parent_id, 2))
+
+        version = await module.create_preview_version(
+            db, session_id=uuid4(), phase=1, version_data={"content": "x" * 500, "progress": 50}
+        )
+
+        assert version.version_delta is None
+        assert version.version_data == {"content": "x" * 500, "progress": 50}
+        assert version.delta_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_first_version_is_full(self):
+        db = AsyncMock()
+        db.add = Mock()
+        db.execute = AsyncMock(return_value=_latest(None, 0))
+
+        version = await module.create_preview_version(db, session_id=uuid4(), phase=1, version_data={"a": 1})
+
+        assert version.version_data == {"a": 1}
+        assert version.parent_version_id is None
+
+
+class TestReconstruction:
+    """Read path"""
+
+    @pytest.mark.asyncio
+    async def test_chain_reconstructed_and_cached(self, fresh_cache):
+        base_id, mid_id, head_id = uuid4(), uuid4(), uuid4()
+        rows = [
+            SimpleNamespace(id=head_id, parent_version_id=mid_id, version_data=None,
+                            version_delta=[{"op": "replace", "path": "/progress", "value": 3}]),
+            SimpleNamespace(id=mid_id, parent_version_id=base_id, version_data=None,
+                            version_delta=[{"op": "add", "path": "/image_url", "value": "u"}]),
+            SimpleNamespace(id=base_id, parent_version_id=None, version_data={"progress": 1}, version_delta=None),
+        ]
+        result = Mock()
+        result.all.return_value = rows
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+
+        data = await module.resolve_version_data(db, head_id)
+        assert data == {"progress": 3, "image_url": "u"}
+        assert fresh_cache.get(mid_id) == {"progress": 1, "image_url": "u"}
+
+        assert await module.resolve_version_data(db, head_id) == data
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_loaded_versions_resolved_in_memory(self):
+        base = SimpleNamespace(id=uuid4(), parent_version_id=None, version_data={"p": 1}, version_delta=None)
+        child = SimpleNamespace(id=uuid4(), parent_version_id=base.id, version_data=None,
+                                version_delta=[{"op": "replace", "path": "/p", "value": 2}])
+        db = AsyncMock()
+
+        assert await module.resolve_versions(db, [base, child]) == [{"p": 1}, {"p": 2}]
+        db.execute.assert_not_awaited()
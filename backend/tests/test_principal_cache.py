@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from app.db.models import UserAccount
+from app.services.auth_service import AuthService
+from app.services.principal_cache import PrincipalCache
+from app.services import auth_service as auth_module
+from app.services.token_service import TokenService
+
+
+def _user(**overrides) -> UserAccount:
+    values = dict(id=uuid4(), firebase_uid="uid", google_id="gid", email="a@example.com", name="a", is_active=True)
+    values.update(overrides)
+    return UserAccount(**values)
+
+
+class TestPrincipalCache:
+    def test_hit_returns_fresh_detached_copy(self):
+        cache = PrincipalCache(ttl_seconds=60)
+        user = _user()
+        cache.put("token", user)
+
+        first = cache.get("token")
+        second = cache.get("token")
+
+        assert first.id == user.id and first.email == user.email
+        assert first is not second
+        assert inspect(first).detached
+
+    def test_ttl_is_bounded_by_token_expiry(self):
+        cache = PrincipalCache(ttl_seconds=60)
+        cache.put("expired", _user(), datetime.now(timezone.utc) - timedelta(seconds=1))
+
+        assert cache.get("expired") is None
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+        cache.put("t1", _user())
+        cache.put("t2", _user())
+        cache.get("t1")
+        cache.put("t3", _user())
+
+        assert cache.get("t2") is None
+        assert cache.get("t1") is not None and cache.get("t3") is not None
+
+
+class TestAuthenticateAccessToken:
+    @pytest.mark.asyncio
+    async def test_second_request_skips_verification_and_query(self, monkeypatch):
+        cache = PrincipalCache(ttl_seconds=60)
+        monkeypatch.setattr(auth_module, "principal_cache", cache)
+        user = _user()
+        tokens = TokenService("secret-key-for-tests")
+        token = tokens.create_token({"sub": str(user.id)}, timedelta(minutes=5))
+
+        result = Mock()
+        result.scalar_one_or_none.return_value = user
+        service = AuthService.__new__(AuthService)
+        service.db = AsyncMock()
+        service.db.execute = AsyncMock(return_value=result)
+        service.token_service = tokens
+
+        await service.authenticate_access_token(token)
+        service.token_service = Mock(verify_token=Mock(side_effect=AssertionError("verified twice")))
+        cached = await service.authenticate_access_token(token)
+
+        assert cached.id == user.id
+        assert service.db.execute.await_count == 1
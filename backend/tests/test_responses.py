@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from fastapi import Response
+
+from app.api.responses import FastJSONResponse, dumps_json, model_response
+from app.api.schemas.manga import PhasePreviewResponse, SessionDetailResponse
+
+
+def _preview(**overrides):
+    values = dict(
+        id="p1",
+        session_id="s1",
+        phase_number=2,
+        preview_type="text",
+        content="本文",
+        image_url=None,
+        document_url=None,
+        progress=100,
+        status="completed",
+        metadata={"nested": {"items": [1, 2.5, None, "テキスト"]}},
+        created_at=datetime(2025, 10, 1, 12, 0, 0),
+        updated_at=datetime(2025, 10, 1, 12, 30, 0),
+    )
+    values.update(overrides)
+    return values
+
+
+class TestFastJSONResponse:
+    def test_encodes_like_the_validated_path(self):
+        preview = PhasePreviewResponse(**_preview())
+        expected = json.loads(json.dumps(preview.model_dump(mode="json")))
+
+        assert json.loads(FastJSONResponse(preview.model_dump()).body) == expected
+        assert json.loads(dumps_json({"id": UUID(int=1), "score": Decimal("0.5")})) == {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "score": 0.5,
+        }
+
+    def test_non_ascii_is_not_escaped(self):
+        assert "本文".encode("utf-8") in dumps_json({"content": "本文"})
+
+
+class TestModelResponse:
+    def test_constructed_models_serialize_without_validation(self):
+        validated = PhasePreviewResponse(**_preview())
+        constructed = PhasePreviewResponse.model_construct(**_preview())
+
+        body = model_response([constructed, constructed]).body
+        assert json.loads(body) == [validated.model_dump(mode="json")] * 2
+
+        detail = SessionDetailResponse.model_construct(
+            session_id="s1",
+            request_id="r1",
+            status="completed",
+            current_phase=7,
+            started_at=None,
+            completed_at=None,
+            retry_count=0,
+            phase_results=[{"phaseId": 1, "data": {"k": [1, 2]}}],
+            preview_versions=None,
+            project_id=None,
+        )
+        assert json.loads(model_response(detail).body)["phase_results"] == [{"phaseId": 1, "data": {"k": [1, 2]}}]
+
+    def test_keeps_headers_of_injected_response(self):
+        injected = Response()
+        injected.headers["ETag"] = '"abc"'
+
+        result = model_response([], injected)
+
+        assert result.body == b"[]"
+        assert result.headers["etag"] == '"abc"'
+        assert result.headers.getlist("content-length") == ["2"]
+        assert result.headers["content-type"] == "application/json"
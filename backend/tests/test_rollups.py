@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.services import rollups
+
+
+def _rows(rows):
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
+class TestRollupReads:
+    @pytest.mark.asyncio
+    async def test_status_counts_strip_prefix_and_skip_zero(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_rows([
+            ("manga_sessions.status.running", 2),
+            ("manga_sessions.status.failed", 1),
+            ("manga_sessions.status.queued", 0),
+        ]))
+
+        counts = await rollups.get_session_status_counts(db)
+
+        assert counts == {"running": 2, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_duration_stats_sum_hourly_buckets(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_rows([
+            (1, 30.0, [1, 0, 0, 0, 0, 0]),
+            (2, 2500.0, [0, 0, 0, 0, 0, 2]),
+        ]))
+
+        stats = await rollups.get_duration_stats(db, "completed", hours=24)
+
+        assert stats.count == 3
+        assert stats.average_seconds == pytest.approx(2530.0 / 3)
+        assert stats.histogram == [1, 0, 0, 0, 0, 2]
+        assert stats.histogram_labels()[">1200s"] == 2
+
+    def test_histogram_has_overflow_slot(self):
+        assert len(rollups.DurationStats().histogram) == len(rollups.DURATION_HISTOGRAM_BOUNDS) + 1
@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.services import pipeline_service
+from app.services.asset_storage import AssetStorage, LocalStorageBackend
+from app.services.pipeline_service import PipelineOrchestrator
+from app.services.service_warmup import ServiceWarmup
+
+
+class TestServiceWarmup:
+    @pytest.mark.asyncio
+    async def test_stages_run_in_order(self):
+        calls = []
+
+        def step(name, delay=0.0):
+            async def run():
+                await asyncio.sleep(delay)
+                calls.append(name)
+            return run
+
+        warmup = ServiceWarmup([
+            [("slow", step("slow", 0.02)), ("fast", step("fast"))],
+            [("after", step("after"))],
+        ])
+
+        assert await warmup.wait(timeout=1) is True
+        assert calls == ["fast", "slow", "after"]
+        assert warmup.ready
+        assert set(warmup.durations) == {"slow", "fast", "after"}
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_reported_without_blocking_readiness(self):
+        async def broken():
+            raise RuntimeError("no credentials")
+
+        warmup = ServiceWarmup([[("vertex_ai", broken), ("storage_client", AsyncMock())]])
+
+        assert await warmup.wait(timeout=1) is True
+        assert warmup.describe()["failures"] == {"vertex_ai": "RuntimeError: no credentials"}
+
+    @pytest.mark.asyncio
+    async def test_timeout_leaves_warmup_running(self):
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        warmup = ServiceWarmup([[("vertex_ai", blocked)]])
+
+        assert await warmup.wait(timeout=0.01) is False
+        assert not warmup.ready
+
+        release.set()
+        await warmup.start()
+        assert warmup.ready
+
+    @pytest.mark.asyncio
+    async def test_local_asset_storage_warm_creates_root(self, tmp_path):
+        root = tmp_path / "assets"
+        await AssetStorage(LocalStorageBackend(root)).warm()
+        assert root.is_dir()
+
+
+class TestSharedOrchestrator:
+    @pytest.fixture
+    def orchestrator(self):
+        with patch("app.services.pipeline_service.core_settings.get_settings"), \
+                patch("app.services.pipeline_service.get_vertex_service"):
+            return PipelineOrchestrator(Mock())
+
+    @pytest.mark.asyncio
+    async def test_phase_db_is_task_local(self, orchestrator):
+        seen = {}
+
+        async def phase(name, db):
+            orchestrator.db = db
+            await asyncio.sleep(0.01)
+            seen[name] = orchestrator.db
+
+        first, second = object(), object()
+        await asyncio.gather(phase("first", first), phase("second", second))
+
+        assert seen == {"first": first, "second": second}
+        assert orchestrator.db is None
+
+    def test_singletons_are_reused(self):
+        with patch.object(pipeline_service, "_pipeline_orchestrator", None), \
+                patch.object(pipeline_service, "_hitl_orchestrator", None), \
+                patch("app.core.db.get_session_factory", return_value=Mock()) as factory, \
+                patch("app.services.pipeline_service.core_settings.get_settings"), \
+                patch("app.services.pipeline_service.get_vertex_service"):
+            pipeline = pipeline_service.get_pipeline_orchestrator()
+            hitl = pipeline_service.get_hitl_orchestrator()
+
+            assert pipeline_service.get_pipeline_orchestrator() is pipeline
+            assert pipeline_service.get_hitl_orchestrator() is hitl
+            assert isinstance(hitl, pipeline_service.HITLCapablePipelineOrchestrator)
+            assert factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_hitl_components_are_per_call_with_shared_active_sessions(self):
+        with patch("app.services.pipeline_service.core_settings.get_settings"), \
+                patch("app.services.pipeline_service.get_vertex_service"), \
+                patch("app.services.hitl_service.get_settings"):
+            orchestrator = pipeline_service.HITLCapablePipelineOrchestrator(Mock())
+            first_db, second_db = AsyncMock(), AsyncMock()
+
+            first = await orchestrator._get_hitl_state_manager(first_db)
+            second = await orchestrator._get_hitl_state_manager(second_db)
+
+        assert first.db is first_db and first.hitl_service.db is first_db
+        assert second.db is second_db
+        assert first.active_sessions is second.active_sessions
+
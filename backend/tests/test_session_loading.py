@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.loading import light_project_options, light_session_options
+from app.db.models import MangaProject, MangaSession
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _session_row(**overrides):
+    values = dict(
+        id=uuid4(), request_id=uuid4(), user_id=None, project_id=None, status="running",
+        current_phase=2, started_at=None, completed_at=None, retry_count=0,
+        phase_results=[Mock(content={"phase": 1})], preview_versions=[Mock(version_data={"v": 1}, version_delta=None)],
+    )
+    values.update(overrides)
+    return Mock(**values)
+
+
+class TestLoaderOptions:
+    """Deferred large columns"""
+
+    def test_light_session_skips_large_columns(self):
+        sql = _sql(select(MangaSession).options(*light_session_options()))
+
+        assert "manga_sessions.status" in sql
+        assert "manga_sessions.text" not in sql
+        assert "manga_sessions.session_metadata" not in sql
+
+    def test_light_project_skips_json_columns(self):
+        sql = _sql(select(MangaProject).options(*light_project_options()))
+
+        assert "manga_projects.title" in sql
+        assert "manga_projects.project_metadata" not in sql
+        assert "manga_projects.settings" not in sql
+
+
+class TestGetSessionFields:
+    """GenerationService.get_session field selection"""
+
+    @pytest.fixture
+    def module(self, monkeypatch):
+        from app.services import generation_service as module
+
+        monkeypatch.setattr(module.core_settings, "get_settings", lambda: Mock())
+        return module
+
+    def _db(self, row):
+        result = Mock()
+        result.scalar_one_or_none.return_value = row
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_default_returns_all_parts(self, module):
+        row = _session_row()
+        db = self._db(row)
+        images = [{"phase": 4, "storage_path": "blobs/a", "url": "https://signed/blobs/a"}]
+
+        with patch.object(module, "preview_images", AsyncMock(return_value=images)) as load_images:
+            response = await module.GenerationService(db).get_session(uuid4())
+
+        assert response.phase_results == [{"phase": 1}]
+        assert response.preview_versions == [{"v": 1}]
+        assert response.generated_images == images
+        load_images.assert_awaited_once_with(db, row.id)
+        assert "manga_sessions.text" not in _sql(db.execute.await_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_field_mask_omits_unselected_parts(self, module):
+        row = _session_row()
+        db = self._db(row)
+
+        response = await module.GenerationService(db).get_session(uuid4(), fields={"phase_results"})
+
+        assert response.phase_results == [{"phase": 1}]
+        assert response.preview_versions is None
+        assert response.generated_images is None
+        statement = db.execute.await_args.args[0]
+        loaded = {str(option.path) for option in statement._with_options if hasattr(option, "path")}
+        assert any("phase_results" in path for path in loaded)
+        assert not any("preview_versions" in path for path in loaded)
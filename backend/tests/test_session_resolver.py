@@ -0,0 +1,78 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.services.session_resolver import SessionOwnershipCache, SessionResolver
+from app.services import session_resolver as resolver_module
+
+
+def _db(session):
+    result = Mock()
+    result.scalar_one_or_none.return_value = session
+    db = AsyncMock()
+    db.info = {}
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.fixture(autouse=True)
+def ownership_cache(monkeypatch):
+    cache = SessionOwnershipCache(ttl_seconds=30)
+    monkeypatch.setattr(resolver_module, "session_ownership_cache", cache)
+    return cache
+
+
+class TestSessionResolver:
+    @pytest.mark.asyncio
+    async def test_resolves_once_per_request_across_services(self):
+        user = Mock(id=uuid4())
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=user.id)
+        db = _db(session)
+
+        first = await SessionResolver.for_db(db).get_owned(session.request_id, user)
+        second = await SessionResolver.for_db(db).get_owned(session.request_id, user)
+
+        assert first is second is session
+        db.execute.assert_awaited_once()
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "manga_sessions.text" not in sql
+
+    @pytest.mark.asyncio
+    async def test_full_load_upgrades_light_entry_once(self):
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=None)
+        resolver = SessionResolver.for_db(_db(session))
+
+        await resolver.get(session.request_id, light=True)
+        await resolver.get(session.request_id, light=False)
+        await resolver.get(session.request_id, light=True)
+
+        assert resolver.queries == 2
+
+    @pytest.mark.asyncio
+    async def test_other_users_session_is_404_without_query_when_cached(self, ownership_cache):
+        owner, other = Mock(id=uuid4()), Mock(id=uuid4())
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=owner.id)
+        await SessionResolver.for_db(_db(session)).get_owned(session.request_id, owner)
+
+        db = _db(session)
+        with pytest.raises(HTTPException) as exc:
+            await SessionResolver.for_db(db).get_owned(session.request_id, other)
+
+        assert exc.value.status_code == 404
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unowned_sessions_require_opt_in(self):
+        user = Mock(id=uuid4())
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=None)
+
+        with pytest.raises(HTTPException):
+            await SessionResolver.for_db(_db(session)).get_owned(session.request_id, user)
+        resolved = await SessionResolver.for_db(_db(session)).get_owned(
+            session.request_id, user, allow_unowned=True
+        )
+
+        assert resolved is session
@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from app.api.responses import dumps_json
+from app.core import db as core_db
+
+
+def _mock_factory(session):
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
+
+
+class TestSessionScopeMetrics:
+    """Test suite for per-workload session attribution"""
+
+    @pytest.mark.asyncio
+    async def test_websocket_workload_is_attributed(self, mock_async_session):
+        """Sessions opened with workload='websocket' are counted separately and released"""
+        with patch.object(core_db, "get_session_factory", return_value=_mock_factory(mock_async_session)):
+            async with core_db.session_scope(workload="websocket") as session:
+                assert session is mock_async_session
+                assert core_db.get_session_metrics()["workloads"]["websocket"]["active"] == 1
+
+        stats = core_db.get_session_metrics()["workloads"]["websocket"]
+        assert stats["active"] == 0
+        assert stats["checkouts"] >= 1
+        mock_async_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_error_releases_session(self, mock_async_session):
+        """Errors roll back and still decrement the active counter"""
+        with patch.object(core_db, "get_session_factory", return_value=_mock_factory(mock_async_session)):
+            with pytest.raises(RuntimeError):
+                async with core_db.session_scope(workload="test-error"):
+                    raise RuntimeError("boom")
+
+        assert core_db.get_session_metrics()["workloads"]["test-error"]["active"] == 0
+        mock_async_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_hitl_path_is_attributed_by_name(self, mock_async_session):
+        """Pipeline HITL queries are attributed to a named workload, keeping metrics JSON-encodable"""
+        from app.services.pipeline_service import HITLCapablePipelineOrchestrator
+
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        mock_async_session.execute = AsyncMock(return_value=result)
+
+        with patch("app.services.pipeline_service.core_settings.get_settings"), \
+                patch("app.services.pipeline_service.get_vertex_service"):
+            orchestrator = HITLCapablePipelineOrchestrator(Mock())
+        with patch.object(core_db, "get_session_factory", return_value=_mock_factory(mock_async_session)):
+            options = await orchestrator._get_feedback_options_for_phase(1)
+
+        assert options
+        metrics = core_db.get_session_metrics()
+        assert metrics["workloads"]["hitl"]["checkouts"] >= 1
+        assert all(isinstance(name, str) for name in metrics["workloads"])
+        dumps_json(metrics)
+
+    def test_workload_is_keyword_only(self):
+        with pytest.raises(TypeError):
+            core_db.session_scope("request")
+
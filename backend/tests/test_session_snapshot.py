@@ -0,0 +1,284 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from app.services.session_snapshot import SessionSnapshotStore, status_version
+
+
+def _row(session_id, request_id, status="running", current_phase=1):
+    row = Mock()
+    row.id = session_id
+    row.request_id = request_id
+    row.user_id = uuid4()
+    row.project_id = None
+    row.status = status
+    row.current_phase = current_phase
+    row.title = "test"
+    row.updated_at = datetime.utcnow()
+    return row
+
+
+def _db_returning(row):
+    result = Mock()
+    result.one_or_none.return_value = row
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestSessionSnapshotStore:
+    """Test suite for SessionSnapshotStore"""
+
+    @pytest.fixture
+    def store(self):
+        return SessionSnapshotStore(ttl_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_load_caches_snapshot(self, store):
+        """Second load is served from memory without a query"""
+        session_id, request_id = uuid4(), uuid4()
+        db = _db_returning(_row(session_id, request_id))
+
+        first = await store.load(db, request_id)
+        second = await store.load(db, request_id)
+
+        assert first is second
+        assert first.status == "running"
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_apply_session_update_bumps_version(self, store):
+        """Writes update the cached snapshot and advance its version"""
+        session_id, request_id = uuid4(), uuid4()
+        snapshot = await store.load(_db_returning(_row(session_id, request_id)), request_id)
+
+        store.apply_session_update(session_id, status="completed", current_phase=7, error_message="ignored")
+        updated = store.get_by_request(request_id)
+
+        assert updated.status == "completed"
+        assert updated.current_phase == 7
+        assert updated.version > snapshot.version
+
+    @pytest.mark.asyncio
+    async def test_stale_load_is_not_installed(self, store):
+        """A load that raced with a write is returned but not cached"""
+        session_id, request_id = uuid4(), uuid4()
+        db = _db_returning(_row(session_id, request_id))
+
+        async def racing_execute(*args, **kwargs):
+            store.apply_session_update(session_id, status="failed")
+            return db.execute.return_value
+
+        db.execute.side_effect = racing_execute
+        snapshot = await store.load(db, request_id)
+
+        assert snapshot is not None
+        assert store.get_by_request(request_id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_parts(self, store):
+        """Part invalidation clears lazily loaded phases/messages only"""
+        session_id, request_id = uuid4(), uuid4()
+        await store.load(_db_returning(_row(session_id, request_id)), request_id)
+
+        token = store.current_generation()
+        store.set_parts(session_id, token, phases=[{"phase": 1}], messages=[])
+        assert store.get_by_request(request_id).phases == [{"phase": 1}]
+
+        store.invalidate_phases(session_id)
+        snapshot = store.get_by_request(request_id)
+        assert snapshot.phases is None
+        assert snapshot.messages == []
+
+        # Parts loaded before the invalidation are discarded
+        store.set_parts(session_id, token, phases=[{"phase": 1}])
+        assert store.get_by_request(request_id).phases is None
+
+    def test_ttl_expiry(self):
+        """Snapshots older than the TTL are dropped"""
+        store = SessionSnapshotStore(ttl_seconds=0.000001)
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=None, project_id=None,
+                       status="queued", current_phase=0, title=None, updated_at=None)
+        store.remember(session)
+
+        import time
+        time.sleep(0.001)
+        assert store.get_by_request(session.request_id) is None
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_wakes_on_write(self, store):
+        """Long-poll waiters are released by the next write to the session"""
+        import asyncio
+
+        session_id = uuid4()
+        since = store.current_generation()
+        waiter = asyncio.ensure_future(store.wait_for_change([session_id], since, timeout=1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        store.apply_session_update(session_id, status="completed")
+        assert await asyncio.wait_for(waiter, timeout=0.5) is True
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_times_out(self, store):
+        """No write within the timeout returns False"""
+        assert await store.wait_for_change([uuid4()], store.current_generation(), timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_drops_events_without_waiters(self, store):
+        """Long-polls on idle sessions do not leave change events behind"""
+        import asyncio
+
+        session_id = uuid4()
+        since = store.current_generation()
+        first = asyncio.ensure_future(store.wait_for_change([session_id], since, timeout=0.01))
+        second = asyncio.ensure_future(store.wait_for_change([session_id], since, timeout=0.2))
+        assert await first is False
+        # 残りの待機者がいる間はイベントを保持する
+        assert str(session_id) in store._change_events
+
+        store.apply_session_update(session_id, status="running")
+        assert await second is True
+        assert store._change_events == {}
+        assert store._change_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_returns_immediately_when_newer(self, store):
+        """A since_version older than the last write returns without waiting"""
+        session_id = uuid4()
+        since = store.current_generation()
+        store.apply_session_update(session_id, status="running")
+        assert await store.wait_for_change([session_id], since, timeout=10) is True
+
+
+class TestGenerationServiceLongPoll:
+    """Long-poll behaviour of GenerationService.get_status"""
+
+    @pytest.mark.asyncio
+    async def test_get_status_waits_for_phase_change(self, monkeypatch):
+        import asyncio
+        from app.services import generation_service as module
+
+        store = SessionSnapshotStore(ttl_seconds=60)
+        monkeypatch.setattr(module, "session_snapshot_store", store)
+        monkeypatch.setattr(module.core_settings, "get_settings", lambda: Mock())
+
+        session_id, request_id = uuid4(), uuid4()
+        db = _db_returning(_row(session_id, request_id, current_phase=1))
+        service = module.GenerationService(db)
+
+        initial = await service.get_status(request_id)
+        task = asyncio.ensure_future(
+            service.get_status(request_id, wait_seconds=1, since_version=initial.version)
+        )
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        store.apply_session_update(session_id, current_phase=2, updated_at=datetime.utcnow())
+        response = await asyncio.wait_for(task, timeout=0.5)
+
+        assert response.current_phase == 2
+        assert response.version > initial.version
+        db.commit.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_status_sees_changes_made_by_other_instances(self, monkeypatch):
+        """Without an in-process wake-up the wait re-reads the row; versions come from updated_at"""
+        import asyncio
+        from datetime import timedelta
+        from app.services import generation_service as module
+
+        store = SessionSnapshotStore(ttl_seconds=60)
+        monkeypatch.setattr(module, "session_snapshot_store", store)
+        monkeypatch.setattr(module.core_settings, "get_settings", lambda: Mock())
+        monkeypatch.setattr(module, "LONG_POLL_REFRESH_SECONDS", 0.01)
+
+        session_id, request_id = uuid4(), uuid4()
+        before = _row(session_id, request_id, current_phase=1)
+        after = _row(session_id, request_id, current_phase=2)
+        after.user_id = before.user_id
+        after.updated_at = before.updated_at + timedelta(seconds=1)
+        result = Mock()
+        result.one_or_none.side_effect = [before, before, after]
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+        service = module.GenerationService(db)
+
+        # 別インスタンスが発行したバージョン（同じ updated_at から導出される）
+        since = status_version(before.updated_at)
+        response = await asyncio.wait_for(
+            service.get_status(request_id, wait_seconds=1, since_version=since), timeout=0.5
+        )
+
+        assert response.current_phase == 2
+        assert response.version == status_version(after.updated_at) > since
+
+
+class TestGenerationServiceStatusBatch:
+    """Batch status resolution"""
+
+    @pytest.fixture
+    def service_and_store(self, monkeypatch):
+        from app.services import generation_service as module
+
+        store = SessionSnapshotStore(ttl_seconds=60)
+        monkeypatch.setattr(module, "session_snapshot_store", store)
+        monkeypatch.setattr(module.core_settings, "get_settings", lambda: Mock())
+        return module, store
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_in_one_query_and_reports_missing(self, service_and_store):
+        from app.api.schemas.manga import SessionStatusBatchRequest
+
+        module, store = service_and_store
+        user = Mock(id=uuid4())
+        owned = _row(uuid4(), uuid4())
+        owned.user_id = user.id
+        unknown = uuid4()
+
+        result = Mock()
+        result.all.return_value = [owned]
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+
+        response = await module.GenerationService(db).get_status_batch(
+            SessionStatusBatchRequest(request_ids=[owned.request_id, unknown]), user
+        )
+
+        assert response.items == [(str(owned.request_id), "running", 1, status_version(owned.updated_at))]
+        assert response.missing == [str(unknown)]
+        db.execute.assert_awaited_once()
+
+        # Second call is served from the snapshot cache
+        await module.GenerationService(db).get_status_batch(
+            SessionStatusBatchRequest(request_ids=[owned.request_id]), user
+        )
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_changed_since_long_poll(self, service_and_store):
+        import asyncio
+        from app.api.schemas.manga import SessionStatusBatchRequest
+
+        module, store = service_and_store
+        user = Mock(id=uuid4())
+        session = Mock(id=uuid4(), request_id=uuid4(), user_id=user.id, project_id=None,
+                       status="running", current_phase=3, title=None, updated_at=None)
+        store.remember(session)
+        db = AsyncMock()
+        since = status_version(session.updated_at)
+        store.apply_session_update(uuid4(), status="running", updated_at=datetime.utcnow())  # unrelated session
+
+        task = asyncio.ensure_future(module.GenerationService(db).get_status_batch(
+            SessionStatusBatchRequest(request_ids=[session.request_id], since_version=since, wait=1), user
+        ))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        updated_at = datetime.utcnow()
+        store.apply_session_update(session.id, current_phase=4, updated_at=updated_at)
+        response = await asyncio.wait_for(task, timeout=0.5)
+
+        assert [item[2] for item in response.items] == [4]
+        assert response.version == status_version(updated_at)
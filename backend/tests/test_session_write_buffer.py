@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import session_write_buffer as module
+from app.services.session_snapshot import SessionSnapshotStore
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    monkeypatch.setattr(module, "session_snapshot_store", SessionSnapshotStore(ttl_seconds=60))
+    buffer = module.SessionStatusWriteBuffer(flush_interval_seconds=0.05)
+    buffer._write = AsyncMock()
+    return buffer
+
+
+class TestSessionStatusWriteBuffer:
+    """Write-behind coalescing of session status updates"""
+
+    @pytest.mark.asyncio
+    async def test_non_terminal_updates_are_merged(self, buffer):
+        session_id = uuid4()
+
+        await buffer.update(session_id, {"status": "running"})
+        await buffer.update(session_id, {"started_at": "t0"})
+        buffer._write.assert_not_awaited()
+
+        await asyncio.sleep(0.1)
+        buffer._write.assert_awaited_once()
+        values = buffer._write.await_args.args[1]
+        assert values["status"] == "running"
+        assert values["started_at"] == "t0"
+
+    @pytest.mark.asyncio
+    async def test_phase_boundary_flushes_pending_fields(self, buffer):
+        session_id = uuid4()
+
+        await buffer.update(session_id, {"status": "running"})
+        await buffer.update(session_id, {"current_phase": 1})
+
+        buffer._write.assert_awaited_once()
+        assert buffer._write.await_args.args[1]["status"] == "running"
+        assert buffer._write.await_args.args[1]["current_phase"] == 1
+        assert buffer.pending(session_id) == {}
+
+    @pytest.mark.asyncio
+    async def test_terminal_state_flushes_every_write(self, buffer):
+        """Repeated terminal writes are not deduped in memory; another writer may have changed the row"""
+        session_id = uuid4()
+
+        await buffer.update(session_id, {"status": "failed", "error_message": "boom"})
+        await buffer.update(session_id, {"status": "failed", "error_message": "boom"})
+
+        assert buffer._write.await_count == 2
+
+    def test_terminal_update_is_conditional_in_sql(self):
+        statement = module.SessionStatusWriteBuffer._statement(str(uuid4()), {"status": "failed"})
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "manga_sessions.status IS DISTINCT FROM" in sql
+
+        running = module.SessionStatusWriteBuffer._statement(str(uuid4()), {"status": "running"})
+        assert "IS DISTINCT FROM" not in str(running.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_snapshot_updated_before_flush(self, buffer):
+        session_id = uuid4()
+        before = module.session_snapshot_store.current_generation()
+
+        await buffer.update(session_id, {"status": "running"})
+
+        assert module.session_snapshot_store.last_write(session_id) > before
+        buffer._write.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_requeued(self, buffer):
+        session_id = uuid4()
+        buffer._write.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await buffer.update(session_id, {"current_phase": 2})
+
+        assert buffer.pending(session_id)["current_phase"] == 2
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import signed_url_cache as cache_module
+from app.services.signed_url_cache import SignedUrlCache
+
+
+def _cache(**kwargs) -> SignedUrlCache:
+    return SignedUrlCache(ttl_seconds=3600, refresh_margin_seconds=300, **kwargs)
+
+
+class TestSignedUrlCache:
+    @pytest.mark.asyncio
+    async def test_reuses_url_until_refresh_margin(self):
+        cache = _cache()
+        with patch.object(cache_module, "_sign", side_effect=lambda b, p, e: f"https://signed/{p}?{cache.signed}"):
+            first = await cache.get_url("bucket", "a.pdf")
+            second = await cache.get_url("bucket", "a.pdf")
+            # 残り時間がマージンを切ったら再署名する
+            url, _ = cache._entries["bucket/a.pdf"]
+            cache._entries["bucket/a.pdf"] = (url, datetime.utcnow() + timedelta(seconds=60))
+            third = await cache.get_url("bucket", "a.pdf")
+
+        assert first == second
+        assert third != first
+        assert cache.signed == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_sign_once(self):
+        cache = _cache()
+        calls = []
+
+        def sign(bucket, path, expiration):
+            calls.append(path)
+            return f"https://signed/{path}"
+
+        with patch.object(cache_module, "_sign", side_effect=sign):
+            urls = await asyncio.gather(*(cache.get_url("bucket", "b.pdf") for _ in range(5)))
+
+        assert set(urls) == {"https://signed/b.pdf"}
+        assert calls == ["b.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_signing_failure_falls_back_without_caching(self):
+        cache = _cache()
+        with patch.object(cache_module, "_sign", side_effect=RuntimeError("no credentials")):
+            url = await cache.get_url("bucket", "c.pdf")
+
+        assert url == "https://storage.googleapis.com/bucket/c.pdf"
+        assert "bucket/c.pdf" not in cache._entries
+
+    @pytest.mark.asyncio
+    async def test_table_hit_skips_signing(self):
+        cache = _cache()
+        row = Mock(signed_url="https://signed/from-table", expires_at=datetime.utcnow() + timedelta(hours=1))
+        result = Mock()
+        result.first.return_value = row
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=result)
+
+        with patch.object(cache_module, "_sign", side_effect=AssertionError("signed")):
+            url = await cache.get_url("bucket", "p.json", db=db, version_id=uuid4(), phase=2)
+
+        assert url == "https://signed/from-table"
+        assert cache._entries["bucket/p.json"][0] == url
+
+    @pytest.mark.asyncio
+    async def test_table_miss_signs_and_upserts(self):
+        cache = _cache()
+        miss = Mock()
+        miss.first.return_value = None
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[miss, Mock()])
+
+        with patch.object(cache_module, "_sign", return_value="https://signed/new"):
+            await cache.get_url("bucket", "p.json", db=db, version_id=uuid4(), phase=2)
+
+        sql = str(db.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO preview_cache_metadata" in sql
+        assert "ON CONFLICT (cache_key) DO UPDATE" in sql
@@ -0,0 +1,70 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import state_reconciler
+from app.services.state_reconciler import StateReconciler
+
+
+def _returning(rows):
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
+class TestSetBasedReconciliation:
+    @pytest.mark.asyncio
+    async def test_one_update_per_state_and_notifications_after_commit(self):
+        stale_running = [(uuid4(), uuid4()), (uuid4(), None)]
+        stale_queued = [(uuid4(), uuid4())]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_returning(stale_running), _returning(stale_queued), _returning([])])
+        events = []
+
+        @asynccontextmanager
+        async def scope(**_):
+            yield db
+            events.append("commit")
+
+        async def publish(request_id, event):
+            events.append(("publish", request_id))
+
+        with patch.object(state_reconciler, "session_scope", scope), \
+                patch.object(state_reconciler.realtime_hub, "publish", side_effect=publish), \
+                patch.object(StateReconciler, "last_run_stats", None), \
+                patch.object(StateReconciler, "last_run_at", None):
+            stats = await StateReconciler.reconcile_all_sessions()
+
+        assert db.execute.await_count == 3
+        sql = str(db.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE manga_sessions")
+        assert "RETURNING manga_sessions.id, manga_sessions.request_id" in sql
+
+        assert stats["stale_running_fixed"] == 2
+        assert stats["stale_queued_fixed"] == 1
+        assert stats["stale_processing_fixed"] == 0
+        assert stats["notifications_sent"] == 2
+        # 通知はコミット後にのみ送る（request_id の無い行は通知しない）
+        assert events[0] == "commit"
+        assert {request_id for _, request_id in events[1:]} == {stale_running[0][1], stale_queued[0][1]}
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_sends_no_notifications(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=RuntimeError("boom"))
+
+        @asynccontextmanager
+        async def scope(**_):
+            yield db
+
+        with patch.object(state_reconciler, "session_scope", scope), \
+                patch.object(state_reconciler.realtime_hub, "publish", AsyncMock()) as publish, \
+                patch.object(StateReconciler, "last_run_stats", None), \
+                patch.object(StateReconciler, "last_run_at", None):
+            stats = await StateReconciler.reconcile_all_sessions()
+
+        assert stats["errors"] == 1
+        publish.assert_not_awaited()
@@ -0,0 +1,58 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.system import system_dashboard
+
+
+def _result(scalar=None, rows=None):
+    result = Mock()
+    result.scalar_one.return_value = scalar
+    result.all.return_value = rows or []
+    return result
+
+
+class TestSystemDashboard:
+    """Dashboard aggregates are read from rollup tables"""
+
+    @pytest.mark.asyncio
+    async def test_reads_only_rollup_tables(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[
+            _result(rows=[("manga_projects.total", 3), ("manga_sessions.total", 5)]),
+            _result(2),
+            _result(rows=[(2, 150.0, [0, 1, 1, 0, 0, 0])]),
+            _result(rows=[(1, Decimal("1.6"), 2), (2, Decimal("0"), 0)]),
+        ])
+
+        payload = await system_dashboard(db)
+
+        assert payload["system_overview"] == {
+            "projects_total": 3,
+            "sessions_total": 5,
+            "sessions_last_24h": 2,
+        }
+        assert payload["processing_metrics"]["completed_last_24h"] == 2
+        assert payload["processing_metrics"]["avg_processing_seconds"] == 75.0
+        assert payload["processing_metrics"]["processing_time_histogram"]["<=120s"] == 1
+        assert payload["quality_metrics"]["avg_quality_score"] == 0.8
+        assert payload["quality_metrics"]["avg_quality_by_phase"] == {"1": 0.8, "2": 0.0}
+
+        for call in db.execute.await_args_list:
+            sql = str(call.args[0].compile(dialect=postgresql.dialect()))
+            assert "FROM manga_sessions" not in sql
+            assert "FROM phase_results" not in sql
+            assert "FROM manga_projects" not in sql
+
+    @pytest.mark.asyncio
+    async def test_missing_counters_read_as_zero(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(rows=[]), _result(0), _result(rows=[]), _result(rows=[])])
+
+        payload = await system_dashboard(db)
+
+        assert payload["system_overview"]["projects_total"] == 0
+        assert payload["processing_metrics"]["avg_processing_seconds"] == 0.0
+        assert payload["quality_metrics"] == {"avg_quality_score": 0.0, "avg_quality_by_phase": {}}